@@ -0,0 +1,10 @@
+"""Benchmarks for the modeling hot paths.
+
+Run from the repository root::
+
+    python -m benchmarks run --output benchmarks/baselines/current.json
+    python -m benchmarks compare benchmarks/baselines/baseline.json benchmarks/baselines/current.json
+
+``run`` times every case in ``cases.py`` and writes per-call medians as JSON;
+``compare`` diffs two such files and exits non-zero on regressions.
+"""
@@ -0,0 +1,70 @@
+"""Command line for running benchmarks and comparing JSON baselines."""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+
+from . import harness
+from .cases import all_cases
+
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baselines", "baseline.json")
+# Scratch report (gitignored); the committed baseline is only rewritten on request.
+DEFAULT_OUTPUT = os.path.join(os.path.dirname(__file__), "baselines", "current.json")
+
+
+def run(args: argparse.Namespace) -> int:
+    cases = [case for case in all_cases() if not args.filter or any(f in case.key for f in args.filter)]
+    repeat, min_time = (3, 0.05) if args.quick else (args.repeat, args.min_time)
+    report = harness.run_cases(cases, repeat=repeat, min_time=min_time, log=lambda line: print(line, file=sys.stderr))
+    harness.save(report, args.output)
+    print(f"wrote {len(report['results'])} results to {args.output}", file=sys.stderr)
+    if args.compare:
+        return compare_reports(harness.load(args.compare), report, args.threshold)
+    return 0
+
+
+def compare_reports(baseline: dict, current: dict, threshold: float) -> int:
+    if not harness.same_environment(baseline, current):
+        print("warning: baseline was recorded on a different machine or interpreter", file=sys.stderr)
+    rows = harness.compare(baseline, current, threshold)
+    for line in harness.comparison_lines(rows):
+        print(line)
+    regressions = [row for row in rows if row.status == "regression"]
+    if regressions:
+        print(f"{len(regressions)} regression(s) beyond {threshold:.0%}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Hot-path benchmarks")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Time every case and write a JSON report")
+    run_parser.add_argument(
+        "--output", default=DEFAULT_OUTPUT, help="Report path (default: benchmarks/baselines/current.json)"
+    )
+    run_parser.add_argument("--filter", action="append", help="Only cases whose key contains this (repeatable)")
+    run_parser.add_argument("--repeat", type=int, default=5, help="Timed runs per case")
+    run_parser.add_argument("--min-time", dest="min_time", type=float, default=0.2, help="Seconds per timed run")
+    run_parser.add_argument("--quick", action="store_true", help="3 short runs per case (noisier)")
+    run_parser.add_argument("--compare", default=None, help="Baseline to compare the new report against")
+    run_parser.add_argument("--threshold", type=float, default=0.15, help="Relative slowdown flagged as regression")
+
+    compare_parser = commands.add_parser("compare", help="Compare two reports and flag regressions")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=0.15, help="Relative slowdown flagged as regression")
+
+    args = parser.parse_args(argv)
+    if args.command == "run":
+        if args.compare and os.path.abspath(args.output) == os.path.abspath(args.compare):
+            parser.error("--output must differ from --compare, or the baseline is overwritten before the comparison")
+        return run(args)
+    return compare_reports(harness.load(args.baseline), harness.load(args.current), args.threshold)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,128 @@
+"""Benchmark cases for the modeling hot paths.
+
+Each ``Case.setup`` seeds ``random`` and builds its inputs outside the timed
+call. Sweeps cover ``num_paths`` for the simulation paths and slate sizes for
+the batched pricer.
+"""
+from __future__ import annotations
+
+from typing import Callable, List
+import random
+
+from src.backtest.metrics import compute_metrics
+from src.data.odds_scraper import OddsScraper
+from src.edge.detector import EdgeDetector
+from src.models.distribution import Distribution
+from src.models.monte_carlo import MonteCarloSimulator, SimulationConfig
+from src.models.ot_engine import OTEngine
+from src.sports import SlatePricer, TotalsAnalyzer, profile_for
+
+from .harness import Case
+
+
+PATH_SWEEP = (1000, 5000, 20000)
+SLATE_SWEEP = (10, 100, 1000)
+# One sport per profile shape: simulated basketball/football, Poisson hockey and soccer.
+ANALYZE_SPORTS = (
+    "basketball_nba",
+    "basketball_cbb_division1",
+    "football_nfl",
+    "football_cfb_fbs",
+    "hockey_nhl",
+    "soccer_epl",
+)
+
+
+def _seeded(build: Callable[[], Callable[[], object]]) -> Callable[[], Callable[[], object]]:
+    def setup() -> Callable[[], object]:
+        random.seed(0)
+        return build()
+
+    return setup
+
+
+def _sample(n: int):
+    dist = Distribution(mean=220.0, std=12.0)
+    return lambda: dist.sample(n)
+
+
+def _simulate(num_paths: int):
+    simulator = MonteCarloSimulator(SimulationConfig(num_paths=num_paths))
+    injuries = [{"player": "starter", "status": "out", "impact": 3.0}]
+    return lambda: simulator.simulate_total_points(base_mean=220.0, base_std=12.0, injuries=injuries, pace=100.0)
+
+
+def _ot_distance():
+    engine = OTEngine()
+    true_dist, market_dist = Distribution(222.0, 11.0), Distribution(215.5, 10.2)
+    return lambda: engine.distance_between_distributions(true_dist, market_dist)
+
+
+def _quantile_wasserstein(n: int):
+    a = Distribution(222.0, 11.0).sample(n)
+    b = Distribution(215.5, 10.2).sample(n)
+    return lambda: OTEngine._quantile_wasserstein(a, b, 2)
+
+
+def _detect():
+    detector = EdgeDetector()
+    true_dist, market_dist = Distribution(222.0, 11.0), Distribution(215.5, 10.2)
+    return lambda: detector.detect(true_dist=true_dist, market_dist=market_dist, odds=-110)
+
+
+def _detect_many(size: int):
+    detector = EdgeDetector()
+    true_dists = [Distribution(random.gauss(220.0, 5.0), 11.0) for _ in range(size)]
+    market_dists = [Distribution(215.5, 10.2)] * size
+    odds = [-110] * size
+    return lambda: detector.detect_many(true_dists, market_dists, odds)
+
+
+def _compute_metrics(n: int):
+    returns = [random.gauss(0.001, 0.02) for _ in range(n)]
+    return lambda: compute_metrics(returns)
+
+
+def _analyze_game(sport: str, num_paths: int):
+    simulator = MonteCarloSimulator(SimulationConfig(num_paths=num_paths))
+    analyzer = TotalsAnalyzer(profile_for(sport), simulator=simulator)
+    game = OddsScraper().fetch_odds_api(sport=sport, max_games=1)[0]
+    analyzer.analyze_game(**game)  # warm the stats cache: time the model, not the first fetch
+    return lambda: analyzer.analyze_game(**game)
+
+
+def _price_slate(size: int):
+    pricer = SlatePricer()
+    slate = OddsScraper().fetch_slate("basketball_cbb_division1", max_games=size)
+    pricer.price_slates([slate])
+    return lambda: pricer.price_slates([slate])
+
+
+def all_cases() -> List[Case]:
+    cases: List[Case] = []
+
+    def add(name: str, build: Callable[[], Callable[[], object]], **params) -> None:
+        cases.append(Case(name, _seeded(build), params))
+
+    for n in (512, 5000):
+        add("distribution.sample", lambda n=n: _sample(n), n=n)
+    for paths in PATH_SWEEP:
+        add("simulator.simulate_total_points", lambda paths=paths: _simulate(paths), num_paths=paths)
+    add("ot.distance_between_distributions", _ot_distance)
+    for n in (512, 5000):
+        add("ot._quantile_wasserstein", lambda n=n: _quantile_wasserstein(n), n=n)
+    add("detector.detect", _detect)
+    for size in SLATE_SWEEP:
+        add("detector.detect_many", lambda size=size: _detect_many(size), slate=size)
+    for n in (250, 5000):
+        add("backtest.compute_metrics", lambda n=n: _compute_metrics(n), n=n)
+    for sport in ANALYZE_SPORTS:
+        add("analyze_game", lambda sport=sport: _analyze_game(sport, 5000), sport=sport, num_paths=5000)
+    for paths in (1000, 20000):
+        add("analyze_game", lambda paths=paths: _analyze_game("basketball_nba", paths), sport="basketball_nba", num_paths=paths)
+    for size in SLATE_SWEEP:
+        add("slate_pricer.price_slates", lambda size=size: _price_slate(size), slate=size)
+    return cases
+
+
+__all__: List[str] = ["ANALYZE_SPORTS", "PATH_SWEEP", "SLATE_SWEEP", "all_cases"]
@@ -0,0 +1,182 @@
+"""Timing, JSON baselines and regression comparison for the benchmark cases."""
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, field
+from typing import Callable, Dict, Iterable, List
+import json
+import os
+import platform
+import statistics
+import subprocess
+import time
+
+
+@dataclass
+class Case:
+    """One benchmark: ``setup()`` builds inputs untimed and returns the callable to time."""
+
+    name: str
+    setup: Callable[[], Callable[[], object]]
+    params: Dict[str, object] = field(default_factory=dict)
+
+    @property
+    def key(self) -> str:
+        if not self.params:
+            return self.name
+        args = ",".join(f"{k}={v}" for k, v in self.params.items())
+        return f"{self.name}[{args}]"
+
+
+@dataclass
+class Timing:
+    median: float  # seconds per call
+    best: float
+    stdev: float
+    repeat: int
+    number: int
+
+
+@dataclass
+class Comparison:
+    key: str
+    baseline: float | None
+    current: float | None
+    ratio: float | None
+    status: str  # "regression", "improvement", "same", "new" or "missing"
+
+
+def measure(fn: Callable[[], object], repeat: int = 5, min_time: float = 0.2) -> Timing:
+    """Time ``fn`` per call: calibrate loops to ``min_time`` per run, then take ``repeat`` runs."""
+    number = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(number):
+            fn()
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_time or number >= 1 << 20:
+            break
+        number *= 2 if elapsed <= 0 else max(2, min(10, int(min_time / elapsed) + 1))
+    runs = [elapsed / number]
+    for _ in range(repeat - 1):
+        started = time.perf_counter()
+        for _ in range(number):
+            fn()
+        runs.append((time.perf_counter() - started) / number)
+    return Timing(
+        median=statistics.median(runs),
+        best=min(runs),
+        stdev=statistics.stdev(runs) if len(runs) > 1 else 0.0,
+        repeat=len(runs),
+        number=number,
+    )
+
+
+def environment() -> Dict[str, str]:
+    """Machine/interpreter details stored with every baseline, since timings only compare like for like."""
+    info = {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpus": str(os.cpu_count()),
+    }
+    try:
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=root, capture_output=True, text=True, check=True
+        )
+        info["commit"] = commit.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        pass
+    return info
+
+
+def run_cases(
+    cases: Iterable[Case],
+    repeat: int = 5,
+    min_time: float = 0.2,
+    log: Callable[[str], None] | None = None,
+) -> dict:
+    results: Dict[str, dict] = {}
+    for case in cases:
+        timing = measure(case.setup(), repeat=repeat, min_time=min_time)
+        results[case.key] = asdict(timing)
+        if log is not None:
+            log(f"{case.key:<60} {format_seconds(timing.median):>10}  (±{format_seconds(timing.stdev)})")
+    return {"created": time.strftime("%Y-%m-%dT%H:%M:%S%z"), "environment": environment(), "results": results}
+
+
+def save(report: dict, path: str) -> None:
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(report, handle, indent=2, sort_keys=True)
+        handle.write("\n")
+
+
+def load(path: str) -> dict:
+    with open(path, encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def compare(baseline: dict, current: dict, threshold: float = 0.15) -> List[Comparison]:
+    """Compare median per-call times; beyond ``threshold`` (relative) is a regression or improvement."""
+    base, cur = baseline["results"], current["results"]
+    rows: List[Comparison] = []
+    for key in list(base) + [key for key in cur if key not in base]:
+        before = base.get(key, {}).get("median")
+        after = cur.get(key, {}).get("median")
+        if before is None:
+            rows.append(Comparison(key, None, after, None, "new"))
+            continue
+        if after is None:
+            rows.append(Comparison(key, before, None, None, "missing"))
+            continue
+        ratio = after / before if before > 0 else float("inf")
+        if ratio > 1 + threshold:
+            status = "regression"
+        elif ratio < 1 / (1 + threshold):
+            status = "improvement"
+        else:
+            status = "same"
+        rows.append(Comparison(key, before, after, ratio, status))
+    return rows
+
+
+def comparison_lines(rows: List[Comparison]) -> List[str]:
+    lines = [f"{'benchmark':<60} {'baseline':>10} {'current':>10} {'ratio':>7}  status"]
+    for row in rows:
+        before = format_seconds(row.baseline) if row.baseline is not None else "-"
+        after = format_seconds(row.current) if row.current is not None else "-"
+        ratio = f"{row.ratio:.2f}x" if row.ratio is not None else "-"
+        lines.append(f"{row.key:<60} {before:>10} {after:>10} {ratio:>7}  {row.status}")
+    return lines
+
+
+def format_seconds(seconds: float) -> str:
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+    return f"{seconds / 1e-9:.0f} ns"
+
+
+def same_environment(baseline: dict, current: dict) -> bool:
+    keys = ("python", "implementation", "machine", "cpus")
+    return all(baseline["environment"].get(k) == current["environment"].get(k) for k in keys)
+
+
+__all__: List[str] = [
+    "Case",
+    "Comparison",
+    "Timing",
+    "compare",
+    "comparison_lines",
+    "environment",
+    "format_seconds",
+    "load",
+    "measure",
+    "run_cases",
+    "same_environment",
+    "save",
+]
@@ -1,43 +1,47 @@
 from __future__ import annotations
 
 import argparse
-from dataclasses import asdict
+from contextlib import nullcontext
+from dataclasses import asdict, dataclass, field
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, TextIO
 import json
+import os
+import sys
+import time
 
 from .data.odds_scraper import OddsScraper
-from .data.team_registry import teams_for_sport
-from .sports import CBBAnalyzer, NBAAnalyzer, NCAAFAnalyzer, NFLAnalyzer, NHLAnalyzer, SoccerAnalyzer
-
-
-def resolve_analyzer(sport: str):
-    if sport == "basketball_nba":
-        return NBAAnalyzer()
-    if sport == "football_nfl":
-        return NFLAnalyzer()
-    if sport == "football_cfb_fbs":
-        return NCAAFAnalyzer()
-    if sport == "hockey_nhl":
-        return NHLAnalyzer()
-    if sport.startswith("soccer_"):
-        return SoccerAnalyzer()
-    if sport == "basketball_cbb_division1":
-        return CBBAnalyzer()
-    # Default to NBA analyzer to keep demo running even if sport code is new
-    return NBAAnalyzer()
-
-
-def run_demo(sport: str, max_games: int | None = None) -> None:
-    analyzer = resolve_analyzer(sport)
+from .sports import PricedGame, SlatePricer, TotalsAnalyzer, profile_for
+
+if TYPE_CHECKING:
+    from .edge.result_cache import ResultCache
+
+
+# Games in the first chunk of a scan bounded only by ``--memory-limit``.
+FIRST_CHUNK_SIZE = 1000
+
+
+def resolve_analyzer(sport: str, result_cache: ResultCache | None = None) -> TotalsAnalyzer:
+    # Unknown codes fall back to the NBA profile to keep the demo running
+    return TotalsAnalyzer(profile_for(sport), result_cache=result_cache)
+
+
+def prefetch_team_stats(analyzer, games: list[dict], sport: str) -> None:
+    """Warm the analyzer's stats cache with one bulk fetch for the whole slate."""
+    fetch_many = getattr(getattr(analyzer, "stats", None), "fetch_team_stats_many", None)
+    if fetch_many is None:
+        return
+    fetch_many({team for game in games for team in (game["home_team"], game["away_team"])}, sport)
+
+
+def run_demo(sport: str, max_games: int | None = None, result_cache: ResultCache | None = None) -> None:
+    analyzer = resolve_analyzer(sport, result_cache=result_cache)
     scraper = OddsScraper()
     odds = scraper.fetch_odds_api(sport=sport, max_games=max_games or 1)
+    prefetch_team_stats(analyzer, odds, sport)
 
     for game in odds:
-        payload = {**game, "injuries": []}
-        # Soccer analyzer needs the specific league code for baselines
-        if isinstance(analyzer, SoccerAnalyzer):
-            payload["sport"] = sport
-
-        edge = analyzer.analyze_game(**payload)
+        # The sport code selects league-level baselines (e.g. per soccer league)
+        edge = analyzer.analyze_game(**{**game, "injuries": []}, sport=analyzer.profile.code)
         if edge:
             print("⚡ EDGE DETECTED")
             print(json.dumps(asdict(edge), indent=2))
@@ -45,26 +49,409 @@ def run_demo(sport: str, max_games: int | None = None) -> None:
             print("No edge for game", game["game_id"])
 
 
-def scan_sports(sport: str | None = None) -> None:
-    scraper = OddsScraper()
-    sports = [sport] if sport else scraper.list_supported_sports()
+@dataclass
+class ScanReport:
+    """Running throughput counters for a streaming scan."""
+
+    games: int = 0
+    edges: int = 0
+    elapsed: float = 0.0
+    sport_latency: Dict[str, float] = field(default_factory=dict)
+    sport_games: Dict[str, int] = field(default_factory=dict)
+    chunks: int = 0  # bounded-memory scans only
+    peak_memory: int = 0  # largest measured chunk working set, in bytes
+
+    @property
+    def games_per_sec(self) -> float:
+        return self.games / self.elapsed if self.elapsed > 0 else 0.0
+
+    def summary_lines(self) -> list[str]:
+        lines = [
+            f"{code}: {self.sport_games[code]} games in {latency * 1000:.1f} ms"
+            for code, latency in self.sport_latency.items()
+        ]
+        lines.append(
+            f"scanned {self.games} games, {self.edges} edges in {self.elapsed:.3f}s ({self.games_per_sec:.0f} games/sec)"
+        )
+        if self.chunks:
+            peak = f", peak chunk working set {self.peak_memory / 2**20:.1f} MiB" if self.peak_memory else ""
+            lines.append(f"bounded scan: {self.chunks} chunks{peak}")
+        return lines
+
+
+def scan_record(row: PricedGame) -> dict:
+    """Flat JSON-serializable record for one priced game."""
+    from .metrics import METRICS
+
+    with METRICS.timer("format"):
+        return {
+            "sport": row.sport,
+            **row.game,
+            "mean": row.distribution.mean,
+            "std": row.distribution.std,
+            "edge": asdict(row.edge) if row.edge else None,
+        }
+
+
+def iter_priced(
+    sports: Iterable[str],
+    scraper: OddsScraper | None = None,
+    pricer: SlatePricer | None = None,
+    report: ScanReport | None = None,
+    chunk_size: int | None = None,
+    memory_limit: int | None = None,
+) -> Iterator[PricedGame]:
+    """Price every game sport by sport, yielding rows as each sport finishes.
+
+    ``report`` (if given) is updated in place, so callers can read throughput
+    while the generator is still running.
+
+    With ``chunk_size`` the scan is bounded-memory: each slate is priced that
+    many games at a time and each row is released once the consumer moves
+    past it, so only one chunk's intermediates are ever alive.
+    ``memory_limit`` (bytes) caps the memory pricing one chunk may add on top
+    of what is already held (the fetched slate, the consumer's state);
+    ``ChunkThrottle`` traces occasional chunks and resizes them to fit. With
+    ``chunk_size`` the limit can only shrink chunks below it; with the limit
+    alone the first chunk is ``FIRST_CHUNK_SIZE`` games and chunks may grow to
+    a whole slate.
+    """
+    from .memory import MEMORY, ChunkThrottle
+
+    scraper = scraper or OddsScraper()
+    pricer = pricer or SlatePricer()
+    report = report if report is not None else ScanReport()
+    throttle = ChunkThrottle(chunk_size or FIRST_CHUNK_SIZE, memory_limit) if chunk_size or memory_limit else None
+    scan_started = time.perf_counter()
     for code in sports:
-        teams = teams_for_sport(code)
-        games = scraper.fetch_odds_api(sport=code)
-        print(f"{code}: {len(teams)} teams -> {len(games)} matchups generated")
+        started = time.perf_counter()
+        with MEMORY.stage("fetch"):
+            slate = scraper.fetch_slate(sport=code)
+        latency = time.perf_counter() - started
+        report.sport_latency[code] = latency
+        report.sport_games[code] = 0
+        offset, total = 0, len(slate)
+        if throttle is not None and not chunk_size:
+            throttle.max_size = max(total, throttle.min_size)  # only the memory limit bounds chunks
+        while offset < total:
+            size = throttle.size if throttle is not None else total
+            chunk = slate if offset == 0 and size >= total else slate.slice(offset, offset + size)
+            offset += size
+            started = time.perf_counter()
+            with MEMORY.stage("price") as stage, throttle.probe() if throttle is not None else nullcontext():
+                priced = pricer.price_slates([chunk])
+            del chunk
+            if throttle is not None:
+                if MEMORY.enabled:
+                    throttle.observe(stage.peak - stage.start)
+                report.chunks += 1
+                report.peak_memory = throttle.peak
+            latency += time.perf_counter() - started
+            report.sport_latency[code] = latency
+            report.sport_games[code] += len(priced)
+            priced.reverse()
+            while priced:
+                row = priced.pop()  # The consumer then holds the only reference.
+                report.games += 1
+                report.edges += row.edge is not None
+                report.elapsed = time.perf_counter() - scan_started
+                yield row
+            row = None
+        report.elapsed = time.perf_counter() - scan_started
+
+
+def iter_scan(
+    sports: Iterable[str],
+    scraper: OddsScraper | None = None,
+    pricer: SlatePricer | None = None,
+    report: ScanReport | None = None,
+    chunk_size: int | None = None,
+    memory_limit: int | None = None,
+) -> Iterator[dict]:
+    """``iter_priced`` as flat JSON-serializable records."""
+    return map(
+        scan_record,
+        iter_priced(
+            sports, scraper=scraper, pricer=pricer, report=report, chunk_size=chunk_size, memory_limit=memory_limit
+        ),
+    )
+
+
+def write_jsonl(records: Iterable[dict], stream: TextIO) -> int:
+    """Write one JSON object per line.
+
+    Rows are flushed one at a time only when ``stream`` is a terminal, so a
+    watcher sees them immediately; files and pipes are flushed once at the end.
+    """
+    interactive = stream.isatty()
+    count = 0
+    for record in records:
+        stream.write(json.dumps(record, separators=(",", ":")) + "\n")
+        if interactive:
+            stream.flush()
+        count += 1
+    stream.flush()
+    return count
+
+
+def scan_sports(
+    sport: str | None = None,
+    output: str | None = None,
+    fmt: str = "jsonl",
+    scraper: OddsScraper | None = None,
+    chunk_size: int | None = None,
+    memory_limit: int | None = None,
+    result_cache: ResultCache | None = None,
+) -> ScanReport:
+    """Run the full edge pipeline and write it to ``output`` (stdout by default).
+
+    ``jsonl`` streams one record per priced game; ``csv`` collects only the
+    edges into an ``EdgeTable`` and writes them best EV first. The throughput
+    summary goes to stderr so stdout stays machine-readable. ``chunk_size``
+    and ``memory_limit`` select the bounded-memory mode of ``iter_priced``;
+    ``result_cache`` lets repeat scans skip games whose inputs are unchanged.
+    """
+    scraper = scraper or OddsScraper()
+    pricer = SlatePricer(result_cache=result_cache)
+    sports = [sport] if sport else scraper.list_supported_sports()
+    report = ScanReport()
+    options = {"pricer": pricer, "report": report, "chunk_size": chunk_size, "memory_limit": memory_limit}
+
+    def write(stream: TextIO) -> None:
+        if fmt == "csv":
+            from .edge.table import EdgeTable  # Deferred: only the CSV export needs it.
+
+            priced = iter_priced(sports, scraper=scraper, **options)
+            EdgeTable.from_priced(priced).sort().write_csv(stream)
+        else:
+            write_jsonl(iter_scan(sports, scraper=scraper, **options), stream)
+
+    if output and output != "-":
+        with open(output, "w", encoding="utf-8", newline="") as stream:
+            write(stream)
+    else:
+        write(sys.stdout)
+    for line in report.summary_lines():
+        print(line, file=sys.stderr)
+    return report
+
+
+def synthetic_scraper(games: int, books: int, seed: int = 0) -> OddsScraper:
+    """An ``OddsScraper`` fed ``games`` seeded games per sport, each quoted by ``books`` books."""
+    from .data.synthetic import SyntheticOddsClient, SyntheticSlateGenerator  # Deferred: load testing only.
+
+    return OddsScraper(client=SyntheticOddsClient(SyntheticSlateGenerator(seed=seed, books=books), games))
+
+
+def generate_load(
+    sport: str | None = None,
+    games: int = 1000,
+    books: int = 5,
+    seed: int = 0,
+    moves: int = 0,
+    injury_updates: int = 0,
+    output: str | None = None,
+) -> int:
+    """Write a seeded synthetic slate, then its line moves and injury news, as JSON Lines.
+
+    Rows stream straight from the generator, so memory stays flat at any size.
+    Returns the number of rows written.
+    """
+    from .data.synthetic import LineMove, SyntheticSlateGenerator  # Deferred: load testing only.
+
+    generator = SyntheticSlateGenerator(seed=seed, books=books)
+    sports = [sport] if sport else OddsScraper.list_supported_sports()
+
+    def records() -> Iterator[dict]:
+        for code in sports:
+            for game in generator.games(code, games):
+                yield {"type": "game", "sport": code, **game}
+            for event in generator.events(code, games, moves, injury_updates):
+                kind = "line_move" if isinstance(event, LineMove) else "injury"
+                yield {"type": kind, **asdict(event)}
+
+    if output and output != "-":
+        with open(output, "w", encoding="utf-8") as stream:
+            return write_jsonl(records(), stream)
+    return write_jsonl(records(), sys.stdout)
+
+
+def run_daemon(
+    sport: str | None = None,
+    cpu_budget: float = 0.25,
+    max_cycles: int | None = None,
+    metrics_port: int | None = None,
+    metrics_host: str = "127.0.0.1",
+) -> None:
+    """Keep every game's edge fresh, rescanning more often as start time nears."""
+    from .daemon import ScanDaemon  # Deferred so one-shot commands start fast.
+
+    if metrics_port is not None:
+        from .metrics import serve_metrics
+
+        serve_metrics(metrics_port, host=metrics_host)
+    daemon = ScanDaemon(sports=[sport] if sport else None, cpu_budget=cpu_budget)
+
+    def log(report) -> None:
+        print(
+            f"priced {report.priced} games, {report.edges} edges, {report.queued} queued "
+            f"(cpu {report.cpu_seconds * 1000:.1f} ms, idle {report.idle:.2f}s)",
+            file=sys.stderr,
+        )
+
+    try:
+        daemon.run(max_cycles=max_cycles, on_cycle=log)
+    except KeyboardInterrupt:
+        pass
+
+
+def profile_imports(module: str = "src.agent") -> list[tuple[str, int, int]]:
+    """Import ``module`` in a fresh interpreter under ``-X importtime``.
+
+    Returns ``(module, self_us, cumulative_us)`` rows, slowest cumulative first.
+    """
+    import subprocess  # Only needed for this diagnostic.
+
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=root,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        if not self_us.strip().isdigit():
+            continue  # column header
+        rows.append((name.strip(), int(self_us), int(cumulative_us)))
+    return sorted(rows, key=lambda row: row[2], reverse=True)
+
+
+def print_import_profile(module: str = "src.agent", limit: int = 25) -> None:
+    rows = profile_imports(module)
+    print(f"{'module':<45} {'self ms':>9} {'total ms':>9}")
+    for name, self_us, cumulative_us in rows[:limit]:
+        print(f"{name:<45} {self_us / 1000:>9.1f} {cumulative_us / 1000:>9.1f}")
 
 
 def main(argv: list[str] | None = None) -> None:
     parser = argparse.ArgumentParser(description="OT betting demo agent")
-    parser.add_argument("command", choices=["demo", "scan"], help="Which command to run")
+    parser.add_argument("command", nargs="?", choices=["demo", "scan", "daemon", "loadgen"], help="Which command to run")
     parser.add_argument("--sport", default="basketball_nba", help="Sport code to scan/demo")
     parser.add_argument("--max-games", dest="max_games", type=int, default=None, help="Limit demo games")
+    parser.add_argument(
+        "--result-cache", dest="result_cache", default=None, help="SQLite file for persisted analysis results"
+    )
+    parser.add_argument("--output", default=None, help="File for scan results (default: stdout)")
+    parser.add_argument(
+        "--format", dest="fmt", choices=["jsonl", "csv"], default="jsonl",
+        help="Scan output: every priced game as JSON Lines, or the edges as CSV",
+    )
+    parser.add_argument(
+        "--chunk-size", dest="chunk_size", type=int, default=None,
+        help="Scan: bounded-memory mode, pricing this many games at a time",
+    )
+    parser.add_argument(
+        "--memory-limit", dest="memory_limit", type=float, default=None,
+        help="Scan: ceiling in MiB on the memory pricing one chunk may add; resizes chunks to fit",
+    )
+    parser.add_argument(
+        "--memory", action="store_true",
+        help="Trace allocations and print per-stage memory and the top allocation sites to stderr",
+    )
+    parser.add_argument(
+        "--synthetic-games", dest="synthetic_games", type=int, default=None,
+        help="Scan/loadgen: seeded synthetic games per sport instead of the default feed",
+    )
+    parser.add_argument("--books", type=int, default=5, help="Scan/loadgen: books quoting each synthetic game")
+    parser.add_argument("--seed", type=int, default=0, help="Scan/loadgen: synthetic generator seed")
+    parser.add_argument("--moves", type=int, default=0, help="Loadgen: line-move events per sport")
+    parser.add_argument(
+        "--injury-updates", dest="injury_updates", type=int, default=0, help="Loadgen: injury news events per sport"
+    )
+    parser.add_argument(
+        "--cpu-budget", dest="cpu_budget", type=float, default=0.25, help="Daemon: max share of wall time spent pricing"
+    )
+    parser.add_argument("--max-cycles", dest="max_cycles", type=int, default=None, help="Daemon: stop after N cycles")
+    parser.add_argument(
+        "--metrics", action="store_true", help="Print per-stage latency and counters to stderr when done"
+    )
+    parser.add_argument(
+        "--metrics-port", dest="metrics_port", type=int, default=None,
+        help="Daemon: serve Prometheus metrics on this port at /metrics",
+    )
+    parser.add_argument(
+        "--metrics-host", dest="metrics_host", default="127.0.0.1",
+        help="Daemon: interface for --metrics-port (0.0.0.0 exposes it beyond this machine)",
+    )
+    parser.add_argument(
+        "--profile-imports", dest="profile_imports", action="store_true", help="Report import time per module and exit"
+    )
     args = parser.parse_args(argv)
+    if args.profile_imports:
+        print_import_profile()
+        return
+    if args.command is None:
+        parser.error("a command is required (demo, scan, daemon or loadgen)")
+    # Deferred so only a command that runs loads them, like the command modules.
+    from .edge.result_cache import ResultCache
+    from .memory import MEMORY
+    from .metrics import METRICS
+
+    result_cache = ResultCache(args.result_cache) if args.result_cache else None
+    if args.metrics:
+        METRICS.enable()
+    if args.memory:
+        MEMORY.enable()
 
-    if args.command == "demo":
-        run_demo(sport=args.sport, max_games=args.max_games)
-    elif args.command == "scan":
-        scan_sports(None if args.sport == "all" else args.sport)
+    try:
+        if args.command == "demo":
+            run_demo(sport=args.sport, max_games=args.max_games, result_cache=result_cache)
+        elif args.command == "scan":
+            scraper = OddsScraper()
+            if args.synthetic_games is not None:
+                scraper = synthetic_scraper(args.synthetic_games, args.books, args.seed)
+            with scraper:
+                scan_sports(
+                    None if args.sport == "all" else args.sport,
+                    output=args.output,
+                    fmt=args.fmt,
+                    scraper=scraper,
+                    chunk_size=args.chunk_size,
+                    memory_limit=int(args.memory_limit * 2**20) if args.memory_limit is not None else None,
+                    result_cache=result_cache,
+                )
+        elif args.command == "daemon":
+            run_daemon(
+                None if args.sport == "all" else args.sport,
+                cpu_budget=args.cpu_budget,
+                max_cycles=args.max_cycles,
+                metrics_port=args.metrics_port,
+                metrics_host=args.metrics_host,
+            )
+        elif args.command == "loadgen":
+            generate_load(
+                None if args.sport == "all" else args.sport,
+                games=args.synthetic_games if args.synthetic_games is not None else 1000,
+                books=args.books,
+                seed=args.seed,
+                moves=args.moves,
+                injury_updates=args.injury_updates,
+                output=args.output,
+            )
+    finally:
+        if result_cache is not None:
+            result_cache.close()
+    if args.metrics:
+        for line in METRICS.summary_lines():
+            print(line, file=sys.stderr)
+    if args.memory:
+        for line in MEMORY.summary_lines() + MEMORY.top_allocations():
+            print(line, file=sys.stderr)
 
 
 if __name__ == "__main__":
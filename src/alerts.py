@@ -0,0 +1,212 @@
+"""Push alerts for new or materially changed edges.
+
+Channels subscribe to a sport with an EV threshold. Each time the edge board
+refreshes a sport, ``AlertDispatcher`` diffs the new edge set against the
+previous one and sends only the additions and material changes, packed into
+as few messages per channel as Discord's 2000-character limit allows and
+spaced out per channel.
+"""
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, field
+from typing import Awaitable, Callable, Dict, Hashable, Iterable, List, Tuple
+import asyncio
+import json
+import logging
+import os
+
+from .scanner import EdgeSummary
+
+
+logger = logging.getLogger(__name__)
+
+EdgeKey = Tuple[str, str, str]
+Send = Callable[[Hashable, str], Awaitable[None]]
+
+# Discord rejects messages longer than this.
+MAX_MESSAGE_CHARS = 2000
+
+
+def edge_key(summary: EdgeSummary) -> EdgeKey:
+    return summary.sport, summary.game_id, summary.edge.recommendation
+
+
+@dataclass
+class EdgeChanges:
+    new: List[EdgeSummary] = field(default_factory=list)
+    changed: List[EdgeSummary] = field(default_factory=list)
+    removed: List[EdgeSummary] = field(default_factory=list)
+
+
+def diff_edges(
+    previous: Iterable[EdgeSummary], current: Iterable[EdgeSummary], ev_tolerance: float = 0.01
+) -> EdgeChanges:
+    """Split ``current`` into new and materially changed edges relative to ``previous``.
+
+    An edge changed materially when its line moved or its EV shifted by at
+    least ``ev_tolerance``.
+    """
+    before: Dict[EdgeKey, EdgeSummary] = {edge_key(edge): edge for edge in previous}
+    changes = EdgeChanges()
+    for edge in current:
+        old = before.pop(edge_key(edge), None)
+        if old is None:
+            changes.new.append(edge)
+        elif old.edge.line != edge.edge.line or abs(old.edge.expected_value - edge.edge.expected_value) >= ev_tolerance:
+            changes.changed.append(edge)
+    changes.removed.extend(before.values())
+    return changes
+
+
+@dataclass(frozen=True)
+class Subscription:
+    channel_id: int
+    sport: str
+    min_ev: float
+
+
+class SubscriptionStore:
+    """Channel subscriptions, optionally persisted to a JSON file."""
+
+    def __init__(self, path: str | None = None):
+        self.path = path
+        self._subs: Dict[Tuple[int, str], Subscription] = {}
+        if path and os.path.exists(path):
+            with open(path, encoding="utf-8") as handle:
+                for row in json.load(handle):
+                    sub = Subscription(**row)
+                    self._subs[(sub.channel_id, sub.sport)] = sub
+
+    def subscribe(self, channel_id: int, sport: str, min_ev: float) -> Subscription:
+        sub = Subscription(channel_id=channel_id, sport=sport, min_ev=min_ev)
+        self._subs[(channel_id, sport)] = sub
+        self._save()
+        return sub
+
+    def unsubscribe(self, channel_id: int, sport: str | None = None) -> int:
+        keys = [key for key in self._subs if key[0] == channel_id and (sport is None or key[1] == sport)]
+        for key in keys:
+            del self._subs[key]
+        self._save()
+        return len(keys)
+
+    def for_channel(self, channel_id: int) -> List[Subscription]:
+        return [sub for (channel, _), sub in self._subs.items() if channel == channel_id]
+
+    def for_sport(self, sport: str) -> List[Subscription]:
+        return [sub for (_, code), sub in self._subs.items() if code == sport]
+
+    def __len__(self) -> int:
+        return len(self._subs)
+
+    def _save(self) -> None:
+        if not self.path:
+            return
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as handle:
+            json.dump([asdict(sub) for sub in self._subs.values()], handle)
+        os.replace(tmp, self.path)
+
+
+def pack_messages(lines: Iterable[str], limit: int = MAX_MESSAGE_CHARS) -> List[str]:
+    """Join lines into as few messages as possible without exceeding ``limit``."""
+    messages: List[str] = []
+    current = ""
+    for line in lines:
+        line = line[:limit]
+        if current and len(current) + 1 + len(line) > limit:
+            messages.append(current)
+            current = line
+        else:
+            current = f"{current}\n{line}" if current else line
+    if current:
+        messages.append(current)
+    return messages
+
+
+def format_alert(summary: EdgeSummary, changed: bool) -> str:
+    tag = "🔄 Updated" if changed else "⚡ New"
+    return f"{tag} [{summary.sport}] {summary.as_line()}"
+
+
+class AlertDispatcher:
+    """Fan edge-board updates out to subscribed channels."""
+
+    def __init__(
+        self,
+        store: SubscriptionStore,
+        send: Send,
+        ev_tolerance: float = 0.01,
+        send_interval: float = 1.0,
+    ):
+        self.store = store
+        self.send = send
+        self.ev_tolerance = ev_tolerance
+        self.send_interval = send_interval
+        self.sent = 0
+
+    def plan(
+        self, sport: str, previous: Iterable[EdgeSummary] | None, current: Iterable[EdgeSummary]
+    ) -> Dict[int, List[str]]:
+        """Messages to send per channel for one sport's refresh.
+
+        An edge is new to a channel when it was absent before or its previous
+        EV was below the subscription's ``min_ev``, so edges crossing a
+        threshold by less than ``ev_tolerance`` are still announced. The first
+        snapshot for a sport only seeds the baseline so a restart does not
+        re-announce every open edge.
+        """
+        if previous is None:
+            return {}
+        previous, current = list(previous), list(current)
+        before: Dict[EdgeKey, EdgeSummary] = {edge_key(edge): edge for edge in previous}
+        changed = {edge_key(edge) for edge in diff_edges(previous, current, self.ev_tolerance).changed}
+        plan: Dict[int, List[str]] = {}
+        for sub in self.store.for_sport(sport):
+            new: List[str] = []
+            updated: List[str] = []
+            for edge in current:
+                if edge.edge.expected_value < sub.min_ev:
+                    continue
+                key = edge_key(edge)
+                old = before.get(key)
+                if old is None or old.edge.expected_value < sub.min_ev:
+                    new.append(format_alert(edge, False))
+                elif key in changed:
+                    updated.append(format_alert(edge, True))
+            if new or updated:
+                plan.setdefault(sub.channel_id, []).extend(new + updated)
+        return {channel: pack_messages(lines) for channel, lines in plan.items()}
+
+    async def dispatch(self, plan: Dict[int, List[str]]) -> None:
+        """Send each channel's batch; channels in parallel, messages per channel spaced out."""
+
+        async def deliver(channel_id: int, messages: List[str]) -> None:
+            for idx, message in enumerate(messages):
+                if idx:
+                    await asyncio.sleep(self.send_interval)
+                try:
+                    await self.send(channel_id, message)
+                    self.sent += 1
+                except Exception as exc:  # One bad channel must not stop the rest.
+                    logger.warning("alert delivery to %s failed: %s", channel_id, exc)
+                    return
+
+        await asyncio.gather(*(deliver(channel, messages) for channel, messages in plan.items()))
+
+    async def on_board_update(
+        self, sport: str, previous: List[EdgeSummary] | None, current: List[EdgeSummary]
+    ) -> None:
+        await self.dispatch(self.plan(sport, previous, current))
+
+
+__all__: List[str] = [
+    "AlertDispatcher",
+    "EdgeChanges",
+    "Subscription",
+    "SubscriptionStore",
+    "diff_edges",
+    "edge_key",
+    "format_alert",
+    "pack_messages",
+]
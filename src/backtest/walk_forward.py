@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass, field
+from itertools import groupby
+from typing import Deque, Dict, Iterable, List, Sequence
+import math
+
+try:
+    from ..edge.detector import EdgeDetector, EdgeResult
+    from ..models.distribution import Distribution, american_to_decimal
+except ImportError:  # Allows imports when src/ is on sys.path directly
+    from edge.detector import EdgeDetector, EdgeResult
+    from models.distribution import Distribution, american_to_decimal
+from .metrics import PerformanceMetrics, compute_metrics
+
+
+@dataclass
+class GameRecord:
+    """A completed game with the closing total used for grading."""
+
+    game_id: str
+    date: str
+    home_team: str
+    away_team: str
+    home_score: float
+    away_score: float
+    total_line: float
+    over_odds: int = -110
+    under_odds: int = -110
+
+    @property
+    def total(self) -> float:
+        return self.home_score + self.away_score
+
+
+@dataclass
+class _TeamTotals:
+    games: int = 0
+    points_for: float = 0.0
+    points_against: float = 0.0
+
+
+class IncrementalRatings:
+    """Sliding-window team ratings updated one game at a time.
+
+    Each team keeps running sums of points scored/allowed, and the league keeps
+    running sums of game totals, so adding a result or dropping one that fell
+    out of the training window is O(1). Predictions combine a team's attack with
+    its opponent's defence relative to the league average.
+    """
+
+    def __init__(self, min_games: int = 3, min_std: float = 0.5):
+        self.min_games = min_games
+        self.min_std = min_std
+        self.teams: Dict[str, _TeamTotals] = {}
+        self.num_games = 0
+        self._sum_total = 0.0
+        self._sum_total_sq = 0.0
+
+    def reset(self) -> None:
+        self.teams = {}
+        self.num_games = 0
+        self._sum_total = 0.0
+        self._sum_total_sq = 0.0
+
+    def add(self, game: GameRecord) -> None:
+        self._apply(game, 1)
+
+    def remove(self, game: GameRecord) -> None:
+        self._apply(game, -1)
+
+    def _apply(self, game: GameRecord, sign: int) -> None:
+        home = self.teams.setdefault(game.home_team, _TeamTotals())
+        away = self.teams.setdefault(game.away_team, _TeamTotals())
+        home.games += sign
+        home.points_for += sign * game.home_score
+        home.points_against += sign * game.away_score
+        away.games += sign
+        away.points_for += sign * game.away_score
+        away.points_against += sign * game.home_score
+
+        self.num_games += sign
+        self._sum_total += sign * game.total
+        self._sum_total_sq += sign * game.total ** 2
+
+    @property
+    def league_team_points(self) -> float:
+        if self.num_games <= 0:
+            return 0.0
+        return self._sum_total / (2 * self.num_games)
+
+    @property
+    def league_std(self) -> float:
+        if self.num_games < 2:
+            return self.min_std
+        mean = self._sum_total / self.num_games
+        variance = (self._sum_total_sq - self.num_games * mean ** 2) / (self.num_games - 1)
+        return max(self.min_std, math.sqrt(max(variance, 0.0)))
+
+    def team_stats(self, team: str) -> Dict[str, float]:
+        """Per-game attack/defence for ``team`` shrunk toward the league average."""
+        league = self.league_team_points
+        totals = self.teams.get(team)
+        if totals is None or totals.games <= 0:
+            return {"offensive_rating": league, "defensive_rating": league, "games": 0.0}
+        weight = totals.games / (totals.games + self.min_games)
+        offense = weight * totals.points_for / totals.games + (1 - weight) * league
+        defense = weight * totals.points_against / totals.games + (1 - weight) * league
+        return {"offensive_rating": offense, "defensive_rating": defense, "games": float(totals.games)}
+
+    def predict(self, home_team: str, away_team: str) -> Distribution:
+        league = self.league_team_points
+        home = self.team_stats(home_team)
+        away = self.team_stats(away_team)
+        home_points = home["offensive_rating"] + away["defensive_rating"] - league
+        away_points = away["offensive_rating"] + home["defensive_rating"] - league
+        return Distribution(mean=home_points + away_points, std=self.league_std)
+
+
+@dataclass
+class WalkForwardStep:
+    start_date: str
+    end_date: str
+    train_games: int
+    games_scored: int
+    bets: int
+    returns: List[float] = field(default_factory=list)
+
+
+@dataclass
+class WalkForwardResult:
+    steps: List[WalkForwardStep]
+    metrics: PerformanceMetrics
+    bets: int
+    games_scored: int
+
+
+class WalkForwardBacktest:
+    """Roll a training window through a season and score each following window.
+
+    Games are grouped by ``date``; each step prices every game on the next
+    ``step_days`` dates using ratings fitted to the previous ``train_days``
+    dates, grades the bets and then slides the window forward by adding the
+    newly completed games and evicting the oldest ones.
+    """
+
+    def __init__(
+        self,
+        detector: EdgeDetector | None = None,
+        train_days: int = 30,
+        step_days: int = 1,
+        min_train_games: int = 10,
+        ratings: IncrementalRatings | None = None,
+    ):
+        if train_days <= 0 or step_days <= 0:
+            raise ValueError("train_days and step_days must be positive")
+        self.detector = detector or EdgeDetector()
+        self.train_days = train_days
+        self.step_days = step_days
+        self.min_train_games = min_train_games
+        self.ratings = ratings or IncrementalRatings()
+
+    def run(self, games: Iterable[GameRecord]) -> WalkForwardResult:
+        days: List[List[GameRecord]] = [
+            list(day_games) for _, day_games in groupby(sorted(games, key=lambda g: g.date), key=lambda g: g.date)
+        ]
+        self.ratings.reset()  # each run starts untrained, so the backtest can be rerun
+        window: Deque[List[GameRecord]] = deque()
+        steps: List[WalkForwardStep] = []
+        all_returns: List[float] = []
+        games_scored = 0
+
+        for start in range(0, len(days), self.step_days):
+            block = days[start : start + self.step_days]
+            if self.ratings.num_games >= self.min_train_games:
+                step = self._score_block(block)
+                steps.append(step)
+                all_returns.extend(step.returns)
+                games_scored += step.games_scored
+
+            for day in block:
+                window.append(day)
+                for game in day:
+                    self.ratings.add(game)
+            while len(window) > self.train_days:
+                for game in window.popleft():
+                    self.ratings.remove(game)
+
+        return WalkForwardResult(
+            steps=steps,
+            metrics=compute_metrics(all_returns),
+            bets=len(all_returns),
+            games_scored=games_scored,
+        )
+
+    def _score_block(self, block: Sequence[List[GameRecord]]) -> WalkForwardStep:
+        returns: List[float] = []
+        scored = 0
+        for day in block:
+            for game in day:
+                scored += 1
+                edge = self._price(game)
+                if edge is not None:
+                    returns.append(grade_total_bet(edge, game))
+        return WalkForwardStep(
+            start_date=block[0][0].date,
+            end_date=block[-1][0].date,
+            train_games=self.ratings.num_games,
+            games_scored=scored,
+            bets=len(returns),
+            returns=returns,
+        )
+
+    def _price(self, game: GameRecord) -> EdgeResult | None:
+        true_dist = self.ratings.predict(game.home_team, game.away_team)
+        over_market = Distribution.from_market_total(line=game.total_line, odds=game.over_odds)
+        edge = self.detector.detect(true_dist=true_dist, market_dist=over_market, odds=game.over_odds, bet_on_over=True)
+        if edge is not None:
+            return edge
+        under_market = Distribution.from_market_total(line=game.total_line, odds=game.under_odds)
+        return self.detector.detect(
+            true_dist=true_dist, market_dist=under_market, odds=game.under_odds, bet_on_over=False
+        )
+
+
+def grade_total_bet(edge: EdgeResult, game: GameRecord) -> float:
+    """Return the unit-stake profit of a totals bet: payout, -1 or 0 on a push."""
+    if game.total == edge.line:
+        return 0.0
+    won = game.total > edge.line if edge.recommendation == "OVER" else game.total < edge.line
+    odds = game.over_odds if edge.recommendation == "OVER" else game.under_odds
+    return american_to_decimal(odds) - 1 if won else -1.0
+
+
+__all__: List[str] = [
+    "GameRecord",
+    "IncrementalRatings",
+    "WalkForwardBacktest",
+    "WalkForwardResult",
+    "WalkForwardStep",
+    "grade_total_bet",
+]
@@ -0,0 +1,147 @@
+"""Per-sport edge board kept warm by a background task.
+
+Commands read the latest ``BoardSnapshot`` in O(1) and show its age instead of
+re-running the pipeline. Refreshes are single-flight: while one is running for
+a sport, every other caller awaits that same task rather than starting a
+duplicate scan.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional
+import asyncio
+import logging
+import time
+
+from .metrics import METRICS
+from .scanner import EdgeSummary
+
+
+logger = logging.getLogger(__name__)
+
+Fetch = Callable[[str], Awaitable[List[EdgeSummary]]]
+# Called after each refresh with (sport, previous edges or None, new edges).
+Listener = Callable[[str, Optional[List[EdgeSummary]], List[EdgeSummary]], Awaitable[None]]
+
+
+@dataclass
+class BoardSnapshot:
+    sport: str
+    edges: List[EdgeSummary]
+    computed_at: float
+
+    def age(self, now: float) -> float:
+        return max(0.0, now - self.computed_at)
+
+
+class EdgeBoard:
+    """Cached edges per sport, refreshed every ``refresh_interval`` seconds."""
+
+    def __init__(
+        self,
+        fetch: Fetch,
+        sports: Iterable[str],
+        refresh_interval: float = 120.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.fetch = fetch
+        self.sports = list(sports)
+        self.refresh_interval = refresh_interval
+        self.clock = clock
+        self.refreshes = 0
+        self._snapshots: Dict[str, BoardSnapshot] = {}
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._runner: asyncio.Task | None = None
+        self._listeners: List[Listener] = []
+        self._listener_tasks: set = set()
+
+    def add_listener(self, listener: Listener) -> None:
+        """Run ``listener`` in the background after every successful refresh."""
+        self._listeners.append(listener)
+
+    def snapshot(self, sport: str) -> BoardSnapshot | None:
+        return self._snapshots.get(sport)
+
+    def age(self, sport: str) -> float | None:
+        snap = self._snapshots.get(sport)
+        return snap.age(self.clock()) if snap is not None else None
+
+    async def get(self, sport: str) -> BoardSnapshot:
+        """Serve the cached snapshot; only the very first request waits for a scan."""
+        snap = self._snapshots.get(sport)
+        if snap is not None:
+            return snap
+        return await self.refresh(sport)
+
+    async def get_all(self) -> List[BoardSnapshot]:
+        return list(await asyncio.gather(*(self.get(sport) for sport in self.sports)))
+
+    async def refresh(self, sport: str) -> BoardSnapshot:
+        task = self._inflight.get(sport)
+        if task is None:
+            task = asyncio.get_running_loop().create_task(self._refresh(sport))
+            self._inflight[sport] = task
+        # Shield so one caller's cancellation does not abort the shared refresh.
+        return await asyncio.shield(task)
+
+    async def refresh_all(self) -> None:
+        results = await asyncio.gather(*(self.refresh(sport) for sport in self.sports), return_exceptions=True)
+        for sport, result in zip(self.sports, results):
+            if isinstance(result, BaseException):
+                logger.warning("edge board refresh failed for %s: %s", sport, result)
+
+    def start(self) -> asyncio.Task:
+        """Start the background refresh loop on the running event loop."""
+        if self._runner is None or self._runner.done():
+            self._runner = asyncio.get_running_loop().create_task(self._run())
+        return self._runner
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            self._runner.cancel()
+            try:
+                await self._runner
+            except asyncio.CancelledError:
+                pass
+            self._runner = None
+
+    async def _run(self) -> None:
+        while True:
+            await self.refresh_all()
+            await asyncio.sleep(self.refresh_interval)
+
+    async def _refresh(self, sport: str) -> BoardSnapshot:
+        try:
+            with METRICS.timer("board_refresh"):
+                edges = await self.fetch(sport)
+            snap = BoardSnapshot(sport=sport, edges=edges, computed_at=self.clock())
+            previous = self._snapshots.get(sport)
+            self._snapshots[sport] = snap
+            self.refreshes += 1
+            self._notify(sport, previous.edges if previous is not None else None, edges)
+            return snap
+        finally:
+            self._inflight.pop(sport, None)
+
+    def _notify(self, sport: str, previous: List[EdgeSummary] | None, edges: List[EdgeSummary]) -> None:
+        # Listeners (e.g. alert fan-out) must not delay callers waiting on the refresh.
+        for listener in self._listeners:
+            task = asyncio.get_running_loop().create_task(listener(sport, previous, edges))
+            self._listener_tasks.add(task)
+            task.add_done_callback(self._listener_done)
+
+    def _listener_done(self, task: asyncio.Task) -> None:
+        self._listener_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning("edge board listener failed: %s", task.exception())
+
+
+def format_age(seconds: float) -> str:
+    if seconds < 60:
+        return f"{seconds:.0f}s ago"
+    if seconds < 3600:
+        return f"{seconds / 60:.0f}m ago"
+    return f"{seconds / 3600:.1f}h ago"
+
+
+__all__: List[str] = ["BoardSnapshot", "EdgeBoard", "format_age"]
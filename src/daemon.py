@@ -0,0 +1,175 @@
+"""Long-running scanner that keeps edges fresh on a fixed CPU budget.
+
+Every known game sits in a heap keyed by its next rescan time. The rescan
+interval is a fraction of the time left before the game starts, so a game
+tipping off in ten minutes is re-priced every minute while one three days out
+is revisited every few hours. Odds are re-polled through ``OddsCache``: new
+or moved lines jump to the front of the queue and removed games are dropped.
+After each batch the daemon idles long enough that pricing stays within
+``cpu_budget`` of wall-clock time.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Tuple
+import heapq
+import time
+
+from .data.odds_cache import OddsCache
+from .data.odds_scraper import OddsScraper
+from .data.slate import start_timestamp
+from .sports import PricedGame, SlatePricer
+
+
+GameKey = Tuple[str, str]
+
+
+def rescan_interval(seconds_to_start: float, min_interval: float, max_interval: float, fraction: float = 0.1) -> float:
+    """Rescan after ``fraction`` of the time left, clamped to the interval bounds."""
+    return max(min_interval, min(max_interval, seconds_to_start * fraction))
+
+
+@dataclass
+class CycleReport:
+    priced: int
+    edges: int
+    cpu_seconds: float
+    idle: float
+    queued: int
+
+
+class ScanDaemon:
+    """Priority-scheduled rescans of every supported sport, state held in memory."""
+
+    def __init__(
+        self,
+        sports: Iterable[str] | None = None,
+        scraper: OddsScraper | None = None,
+        pricer: SlatePricer | None = None,
+        cpu_budget: float = 0.25,
+        odds_interval: float = 300.0,
+        min_interval: float = 60.0,
+        max_interval: float = 6 * 3600.0,
+        default_lead: float = 24 * 3600.0,
+        batch_size: int = 256,
+        clock: Callable[[], float] = time.time,
+        cpu_clock: Callable[[], float] = time.process_time,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        if not 0 < cpu_budget <= 1:
+            raise ValueError("cpu_budget must be in (0, 1]")
+        scraper = scraper or OddsScraper()
+        self.sports = list(sports) if sports is not None else scraper.list_supported_sports()
+        self.pricer = pricer or SlatePricer()
+        self.cpu_budget = cpu_budget
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.default_lead = default_lead
+        self.batch_size = batch_size
+        self.clock = clock
+        self.cpu_clock = cpu_clock
+        self.sleep = sleep
+        self.odds = OddsCache(scraper, ttl=odds_interval, clock=clock)
+
+        self.games: Dict[GameKey, dict] = {}
+        self.starts: Dict[GameKey, float] = {}
+        self.results: Dict[GameKey, PricedGame] = {}
+        self._due: Dict[GameKey, float] = {}
+        self._heap: List[Tuple[float, int, GameKey]] = []
+        self._seq = 0
+
+    def poll_odds(self) -> int:
+        """Refresh stale odds snapshots; returns how many games were (re)queued."""
+        now = self.clock()
+        queued = 0
+        for sport in self.sports:
+            if self.odds.is_fresh(sport):
+                continue
+            diff = self.odds.refresh(sport)
+            for game in diff.removed:
+                self._forget((sport, game["game_id"]))
+            for game in diff.games_to_price:
+                key = (sport, game["game_id"])
+                self.games[key] = game
+                start = start_timestamp(game)
+                self.starts[key] = start if start is not None else self.starts.get(key, now + self.default_lead)
+                self._schedule(key, now)
+                queued += 1
+        return queued
+
+    def run_cycle(self) -> CycleReport:
+        """Poll odds if due, then price every game whose rescan time has come."""
+        self.poll_odds()
+        now = self.clock()
+        due: List[GameKey] = []
+        while self._heap and self._heap[0][0] <= now and len(due) < self.batch_size:
+            when, _, key = heapq.heappop(self._heap)
+            if self._due.get(key) != when:
+                continue  # superseded by a later reschedule
+            del self._due[key]
+            if self.starts[key] <= now:
+                self._forget(key)  # started: the pregame model no longer applies
+                continue
+            due.append(key)
+
+        cpu_started = self.cpu_clock()
+        edges = 0
+        if due:
+            by_sport: Dict[str, List[dict]] = {}
+            for sport, game_id in due:
+                by_sport.setdefault(sport, []).append(self.games[(sport, game_id)])
+            for row in self.pricer.price(by_sport):
+                key = (row.sport, row.game_id)
+                self.results[key] = row
+                edges += row.edge is not None
+                interval = rescan_interval(self.starts[key] - now, self.min_interval, self.max_interval)
+                self._schedule(key, now + interval)
+        cpu_seconds = self.cpu_clock() - cpu_started
+        # Idle so that pricing uses at most ``cpu_budget`` of wall-clock time.
+        idle = cpu_seconds * (1 / self.cpu_budget - 1)
+        return CycleReport(priced=len(due), edges=edges, cpu_seconds=cpu_seconds, idle=idle, queued=len(self._due))
+
+    def run(self, max_cycles: int | None = None, on_cycle: Callable[[CycleReport], None] | None = None) -> None:
+        cycles = 0
+        while max_cycles is None or cycles < max_cycles:
+            report = self.run_cycle()
+            cycles += 1
+            if on_cycle is not None:
+                on_cycle(report)
+            if max_cycles is not None and cycles >= max_cycles:
+                break
+            self.sleep(max(report.idle, self.seconds_until_due()))
+
+    def seconds_until_due(self) -> float:
+        """Time until the next queued rescan or odds poll, whichever comes first."""
+        now = self.clock()
+        waits = [self.odds.ttl]
+        heap = self._heap
+        while heap and self._due.get(heap[0][2]) != heap[0][0]:
+            heapq.heappop(heap)  # superseded by a later reschedule
+        if heap:
+            waits.append(heap[0][0] - now)
+        for sport in self.sports:
+            snap = self.odds.snapshot(sport)
+            if snap is not None:
+                waits.append(snap.fetched_at + self.odds.ttl - now)
+        return max(0.0, min(waits))
+
+    def edges(self) -> List[PricedGame]:
+        """Latest priced games with an edge, best expected value first."""
+        rows = [row for row in self.results.values() if row.edge is not None]
+        return sorted(rows, key=lambda row: row.edge.expected_value, reverse=True)
+
+    def _schedule(self, key: GameKey, when: float) -> None:
+        self._due[key] = when
+        self._seq += 1
+        heapq.heappush(self._heap, (when, self._seq, key))
+
+    def _forget(self, key: GameKey) -> None:
+        self.games.pop(key, None)
+        self.starts.pop(key, None)
+        self.results.pop(key, None)
+        self._due.pop(key, None)
+
+
+__all__: List[str] = ["CycleReport", "ScanDaemon", "rescan_interval", "start_timestamp"]
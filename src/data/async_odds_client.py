@@ -0,0 +1,346 @@
+"""Asyncio odds client with pooled keep-alive connections.
+
+The client speaks plain HTTP/1.1 over ``asyncio`` streams so the repo keeps its
+no-dependency default. Each provider gets a token-bucket rate limit, failed
+requests are retried with exponential backoff and full jitter, and
+``fetch_all`` requests every sport concurrently so a refresh costs roughly the
+slowest request instead of the sum.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import random
+import ssl
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Tuple
+from urllib.parse import urlencode, urlsplit
+
+from .team_registry import supported_sports
+
+
+REQUIRED_GAME_FIELDS = ("game_id", "home_team", "away_team", "total_line", "over_odds", "under_odds")
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+logger = logging.getLogger(__name__)
+
+
+class OddsClientError(RuntimeError):
+    """Raised when a provider request fails after all retries."""
+
+
+class TokenBucket:
+    """Async token bucket: ``rate`` tokens per second with a ``capacity`` burst."""
+
+    def __init__(self, rate: float, capacity: float | None = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated: float | None = None
+        self._lock: asyncio.Lock | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    async def acquire(self, tokens: float = 1.0) -> None:
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._loop is not loop:
+            self._lock, self._loop, self._updated = asyncio.Lock(), loop, None
+        async with self._lock:
+            while True:
+                now = loop.time()
+                if self._updated is not None:
+                    self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                await asyncio.sleep((tokens - self._tokens) / self.rate)
+
+
+@dataclass
+class HTTPResponse:
+    status: int
+    headers: Dict[str, str]
+    body: bytes
+
+    def json(self):
+        return json.loads(self.body.decode("utf-8"))
+
+
+@dataclass
+class _Connection:
+    reader: asyncio.StreamReader
+    writer: asyncio.StreamWriter
+
+
+class ConnectionPool:
+    """Keep-alive connections to one ``(host, port)`` capped at ``max_connections``."""
+
+    def __init__(self, host: str, port: int, use_ssl: bool = False, max_connections: int = 8):
+        self.host = host
+        self.port = port
+        self.ssl = ssl.create_default_context() if use_ssl else None
+        self._idle: List[_Connection] = []
+        self._slots = asyncio.Semaphore(max_connections)
+        self.opened = 0
+
+    async def acquire(self) -> Tuple[_Connection, bool]:
+        """Return a connection and whether it was reused from the idle list."""
+        await self._slots.acquire()
+        while self._idle:
+            conn = self._idle.pop()
+            if not conn.writer.is_closing() and not conn.reader.at_eof():
+                return conn, True
+            conn.writer.close()
+        try:
+            reader, writer = await asyncio.open_connection(self.host, self.port, ssl=self.ssl)
+        except BaseException:
+            self._slots.release()
+            raise
+        self.opened += 1
+        return _Connection(reader, writer), False
+
+    def release(self, conn: _Connection, reusable: bool) -> None:
+        if reusable and not conn.writer.is_closing():
+            self._idle.append(conn)
+        else:
+            conn.writer.close()
+        self._slots.release()
+
+    async def close(self) -> None:
+        idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.writer.close()
+        for conn in idle:
+            try:
+                await conn.writer.wait_closed()
+            except (ConnectionError, OSError):
+                pass
+
+
+class AsyncHTTPSession:
+    """Minimal HTTP/1.1 GET session that pools connections per origin."""
+
+    def __init__(self, max_connections_per_host: int = 8, timeout: float = 10.0):
+        self.max_connections_per_host = max_connections_per_host
+        self.timeout = timeout
+        self._pools: Dict[Tuple[str, str, int], ConnectionPool] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def _pool_for(self, scheme: str, host: str, port: int) -> ConnectionPool:
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # Streams are bound to the loop that opened them; start fresh pools.
+            self._pools = {}
+            self._loop = loop
+        key = (scheme, host, port)
+        pool = self._pools.get(key)
+        if pool is None:
+            pool = ConnectionPool(host, port, use_ssl=scheme == "https", max_connections=self.max_connections_per_host)
+            self._pools[key] = pool
+        return pool
+
+    @property
+    def connections_opened(self) -> int:
+        return sum(pool.opened for pool in self._pools.values())
+
+    async def get(self, url: str, headers: Dict[str, str] | None = None) -> HTTPResponse:
+        parts = urlsplit(url)
+        scheme = parts.scheme or "http"
+        port = parts.port or (443 if scheme == "https" else 80)
+        host = parts.hostname or "localhost"
+        target = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        pool = self._pool_for(scheme, host, port)
+
+        request_headers = {
+            "Host": host if parts.port is None else f"{host}:{port}",
+            "Accept": "application/json",
+            "Accept-Encoding": "identity",
+            "Connection": "keep-alive",
+            **(headers or {}),
+        }
+        request = f"GET {target} HTTP/1.1\r\n" + "".join(f"{k}: {v}\r\n" for k, v in request_headers.items()) + "\r\n"
+
+        conn, reused = await pool.acquire()
+        try:
+            conn.writer.write(request.encode("latin-1"))
+            await conn.writer.drain()
+            response, keep_alive = await asyncio.wait_for(_read_response(conn.reader), self.timeout)
+        except (ConnectionError, OSError, asyncio.IncompleteReadError, asyncio.TimeoutError) as exc:
+            pool.release(conn, reusable=False)
+            if reused and not isinstance(exc, asyncio.TimeoutError):
+                # Keep-alive sockets may have been closed by the server while idle.
+                return await self.get(url, headers)
+            raise
+        except BaseException:
+            pool.release(conn, reusable=False)
+            raise
+        pool.release(conn, reusable=keep_alive)
+        return response
+
+    async def close(self) -> None:
+        pools, self._pools = list(self._pools.values()), {}
+        for pool in pools:
+            await pool.close()
+
+
+async def _read_response(reader: asyncio.StreamReader) -> Tuple[HTTPResponse, bool]:
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionResetError("connection closed before response")
+    version, status, *_ = status_line.decode("latin-1").split(" ", 2)
+
+    headers: Dict[str, str] = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    if headers.get("transfer-encoding", "").lower() == "chunked":
+        chunks = []
+        while True:
+            size = int((await reader.readline()).split(b";", 1)[0].strip() or b"0", 16)
+            if size == 0:
+                await reader.readline()
+                break
+            chunks.append(await reader.readexactly(size))
+            await reader.readexactly(2)
+        body = b"".join(chunks)
+        framed = True
+    elif "content-length" in headers:
+        body = await reader.readexactly(int(headers["content-length"]))
+        framed = True
+    else:
+        body = await reader.read()
+        framed = False
+
+    connection = headers.get("connection", "").lower()
+    keep_alive = framed and connection != "close" and (version != "HTTP/1.0" or connection == "keep-alive")
+    return HTTPResponse(status=int(status), headers=headers, body=body), keep_alive
+
+
+@dataclass
+class ProviderConfig:
+    """Where and how fast to query an odds provider."""
+
+    name: str
+    base_url: str
+    path_template: str = "/sports/{sport}/odds"
+    requests_per_second: float = 5.0
+    burst: float = 5.0
+    api_key: str | None = None
+    extra_params: Dict[str, str] = field(default_factory=dict)
+
+
+class AsyncOddsClient:
+    """Fetch odds for many sports concurrently from one provider."""
+
+    def __init__(
+        self,
+        provider: ProviderConfig,
+        session: AsyncHTTPSession | None = None,
+        rate_limiter: TokenBucket | None = None,
+        max_retries: int = 3,
+        backoff: float = 0.25,
+        max_backoff: float = 5.0,
+    ):
+        self.provider = provider
+        self.session = session or AsyncHTTPSession()
+        self.rate_limiter = rate_limiter or TokenBucket(provider.requests_per_second, provider.burst)
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        # Per-sport failures from the most recent ``fetch_all``.
+        self.errors: Dict[str, Exception] = {}
+
+    def url_for(self, sport: str) -> str:
+        params = dict(self.provider.extra_params)
+        if self.provider.api_key:
+            params["apiKey"] = self.provider.api_key
+        url = self.provider.base_url.rstrip("/") + self.provider.path_template.format(sport=sport)
+        return f"{url}?{urlencode(params)}" if params else url
+
+    async def get(self, url: str, headers: Dict[str, str] | None = None) -> HTTPResponse:
+        """GET ``url`` under the provider rate limit, retrying transient failures."""
+        last_error: Exception | None = None
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                # Full jitter keeps concurrent retries from stampeding the provider.
+                await asyncio.sleep(random.uniform(0, min(self.max_backoff, self.backoff * 2 ** (attempt - 1))))
+            await self.rate_limiter.acquire()
+            try:
+                response = await self.session.get(url, headers)
+            except (ConnectionError, OSError, asyncio.IncompleteReadError, asyncio.TimeoutError) as exc:
+                last_error = exc
+                continue
+            if response.status in RETRYABLE_STATUS:
+                last_error = OddsClientError(f"{self.provider.name} returned HTTP {response.status} for {url}")
+                continue
+            return response
+        raise OddsClientError(f"{self.provider.name} request failed after {self.max_retries + 1} attempts: {last_error}")
+
+    async def fetch_sport(self, sport: str) -> List[dict]:
+        response = await self.get(self.url_for(sport))
+        if response.status != 200:
+            raise OddsClientError(f"{self.provider.name} returned HTTP {response.status} for {sport}")
+        return [normalize_game(game) for game in response.json()]
+
+    async def fetch_sport_conditional(self, sport: str, etag: str | None = None) -> Tuple[List[dict] | None, str | None]:
+        """Fetch with ``If-None-Match``; returns ``(None, etag)`` when the provider answers 304."""
+        headers = {"If-None-Match": etag} if etag else None
+        response = await self.get(self.url_for(sport), headers)
+        if response.status == 304:
+            return None, etag
+        if response.status != 200:
+            raise OddsClientError(f"{self.provider.name} returned HTTP {response.status} for {sport}")
+        return [normalize_game(game) for game in response.json()], response.headers.get("etag")
+
+    async def fetch_all(self, sports: Iterable[str] | None = None) -> Dict[str, List[dict]]:
+        """Fetch every sport concurrently; sports that fail are logged, kept in ``errors`` and left out."""
+        codes = list(sports) if sports is not None else supported_sports()
+        results = await asyncio.gather(*(self.fetch_sport(code) for code in codes), return_exceptions=True)
+        odds: Dict[str, List[dict]] = {}
+        self.errors = {}
+        for code, result in zip(codes, results):
+            if isinstance(result, Exception):
+                logger.warning("odds fetch failed for %s: %s", code, result)
+                self.errors[code] = result
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                odds[code] = result
+        return odds
+
+    async def close(self) -> None:
+        await self.session.close()
+
+
+def normalize_game(game: dict) -> dict:
+    """Coerce a provider payload into the shape the analyzers expect."""
+    missing = [name for name in REQUIRED_GAME_FIELDS if name not in game]
+    if missing:
+        raise OddsClientError(f"odds payload missing fields: {', '.join(missing)}")
+    return {
+        "game_id": str(game["game_id"]),
+        "home_team": game["home_team"],
+        "away_team": game["away_team"],
+        "total_line": float(game["total_line"]),
+        "over_odds": int(game["over_odds"]),
+        "under_odds": int(game["under_odds"]),
+    }
+
+
+__all__: List[str] = [
+    "AsyncHTTPSession",
+    "AsyncOddsClient",
+    "ConnectionPool",
+    "HTTPResponse",
+    "OddsClientError",
+    "ProviderConfig",
+    "TokenBucket",
+    "normalize_game",
+]
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List
+import time
+
+from .odds_scraper import OddsScraper
+
+
+PRICE_FIELDS = ("total_line", "over_odds", "under_odds")
+
+
+@dataclass
+class OddsSnapshot:
+    sport: str
+    games: List[dict]
+    etag: str | None
+    fetched_at: float
+
+
+@dataclass
+class OddsDiff:
+    """Per-game changes between two snapshots of the same sport."""
+
+    sport: str
+    new: List[dict] = field(default_factory=list)
+    changed: List[dict] = field(default_factory=list)
+    removed: List[dict] = field(default_factory=list)
+    unchanged: int = 0
+
+    @property
+    def has_changes(self) -> bool:
+        return bool(self.new or self.changed or self.removed)
+
+    @property
+    def games_to_price(self) -> List[dict]:
+        """Games whose lines are new or moved and therefore need re-pricing."""
+        return self.new + self.changed
+
+
+def diff_games(sport: str, previous: List[dict], current: List[dict]) -> OddsDiff:
+    before = {game["game_id"]: game for game in previous}
+    diff = OddsDiff(sport=sport)
+    for game in current:
+        old = before.pop(game["game_id"], None)
+        if old is None:
+            diff.new.append(game)
+        elif any(old.get(name) != game.get(name) for name in PRICE_FIELDS):
+            diff.changed.append(game)
+        else:
+            diff.unchanged += 1
+    diff.removed.extend(before.values())
+    return diff
+
+
+class OddsCache:
+    """Keep the latest odds snapshot per sport and report what moved.
+
+    Snapshots younger than ``ttl`` seconds are served without touching the
+    scraper. Older ones are revalidated with the snapshot's etag, so providers
+    that answer "not modified" cost one cheap request and no re-analysis.
+    """
+
+    def __init__(
+        self,
+        scraper: OddsScraper | None = None,
+        ttl: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.scraper = scraper or OddsScraper()
+        self.ttl = ttl
+        self.clock = clock
+        self._snapshots: Dict[str, OddsSnapshot] = {}
+
+    def snapshot(self, sport: str) -> OddsSnapshot | None:
+        return self._snapshots.get(sport)
+
+    def is_fresh(self, sport: str) -> bool:
+        snap = self._snapshots.get(sport)
+        return snap is not None and self.clock() - snap.fetched_at < self.ttl
+
+    def get(self, sport: str, max_games: int | None = None) -> List[dict]:
+        if not self.is_fresh(sport):
+            self.refresh(sport)
+        games = self._snapshots[sport].games
+        return games[:max_games] if max_games else list(games)
+
+    def refresh(self, sport: str, force: bool = False) -> OddsDiff:
+        """Revalidate ``sport`` (unless still fresh) and return the per-game diff."""
+        previous = self._snapshots.get(sport)
+        if previous is not None and not force and self.is_fresh(sport):
+            return OddsDiff(sport=sport, unchanged=len(previous.games))
+
+        etag = previous.etag if previous is not None and not force else None
+        games, new_etag = self.scraper.fetch_odds_conditional(sport, etag)
+        now = self.clock()
+        if games is None and previous is not None:
+            previous.fetched_at = now
+            return OddsDiff(sport=sport, unchanged=len(previous.games))
+
+        games = games or []
+        self._snapshots[sport] = OddsSnapshot(sport=sport, games=games, etag=new_etag, fetched_at=now)
+        return diff_games(sport, previous.games if previous is not None else [], games)
+
+    def invalidate(self, sport: str | None = None) -> None:
+        if sport is None:
+            self._snapshots.clear()
+        else:
+            self._snapshots.pop(sport, None)
+
+
+__all__ = ["OddsCache", "OddsDiff", "OddsSnapshot", "diff_games"]
@@ -1,58 +1,136 @@
 from __future__ import annotations
 
-from typing import List
+import hashlib
+import json
+from typing import Dict, Iterable, List, Tuple
 
-from .team_registry import supported_sports, teams_for_sport
+from .slate import Slate
+from .team_registry import supported_sports
+
+
+# Typical game totals used by the synthetic generators.
+DEFAULT_TOTALS: Dict[str, float] = {
+    "basketball_nba": 215.5,
+    "basketball_cbb_division1": 143.5,
+    "football_nfl": 44.5,
+    "football_cfb_fbs": 55.5,
+    "hockey_nhl": 6.0,
+    "soccer_epl": 2.5,
+    "soccer_laliga": 2.4,
+    "soccer_bundesliga": 3.0,
+    "soccer_serie_a": 2.4,
+    "soccer_ligue1": 2.7,
+    "soccer_champions_league": 2.9,
+}
 
 
 class OddsScraper:
     """Stub odds scraper with canned examples.
 
     Real integrations can be added behind this interface without
-    affecting the modeling stack.
+    affecting the modeling stack. Pass an ``AsyncOddsClient`` as ``client`` to
+    fetch live odds instead of the synthetic templates. The scraper then keeps
+    one event loop for its lifetime, so the client's pooled connections carry
+    over from call to call; ``close()`` it (or use it as a context manager)
+    when done.
     """
 
+    def __init__(self, client=None):
+        self.client = client
+        self._loop = None
+
+    def __enter__(self) -> "OddsScraper":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the client and the scraper's event loop (no-op without a client)."""
+        loop, self._loop = self._loop, None
+        if loop is None:
+            return
+        try:
+            loop.run_until_complete(self.client.close())
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        finally:
+            loop.close()
+
     def fetch_odds_api(self, sport: str = "basketball_nba", max_games: int | None = None) -> List[dict]:
-        teams = teams_for_sport(sport)
-        if len(teams) < 2:
-            return []
-
-        game_templates = []
-        default_totals = {
-            "basketball_nba": 215.5,
-            "basketball_cbb_division1": 143.5,
-            "football_nfl": 44.5,
-            "football_cfb_fbs": 55.5,
-            "hockey_nhl": 6.0,
-            "soccer_epl": 2.5,
-            "soccer_laliga": 2.4,
-            "soccer_bundesliga": 3.0,
-            "soccer_serie_a": 2.4,
-            "soccer_ligue1": 2.7,
-            "soccer_champions_league": 2.9,
-        }
-
-        target_games = max_games or (len(teams) // 2)
+        if self.client is not None:
+            games = self._run_client(self.client.fetch_sport(sport))
+            return games[:max_games] if max_games else games
+        return self._synthetic_odds(sport, max_games)
+
+    def fetch_slate(self, sport: str = "basketball_nba", max_games: int | None = None) -> Slate:
+        """Fetch one sport as a columnar ``Slate``; synthetic games skip the per-game dicts."""
+        if self.client is not None:
+            return Slate.from_games(sport, self.fetch_odds_api(sport=sport, max_games=max_games))
+        return self._synthetic_slate(sport, max_games)
+
+    def fetch_all_odds(self, sports: Iterable[str] | None = None) -> Dict[str, List[dict]]:
+        """Fetch every sport at once; with a client the requests run concurrently."""
+        codes = list(sports) if sports is not None else self.list_supported_sports()
+        if self.client is not None:
+            return self._run_client(self.client.fetch_all(codes))
+        return {code: self._synthetic_odds(code, None) for code in codes}
+
+    def fetch_odds_conditional(self, sport: str, etag: str | None = None) -> Tuple[List[dict] | None, str | None]:
+        """Return ``(games, etag)``, or ``(None, etag)`` when nothing changed since ``etag``.
+
+        Providers that support ``If-None-Match`` skip the download entirely;
+        otherwise the etag is a fingerprint of the fetched games.
+        """
+        if self.client is not None and hasattr(self.client, "fetch_sport_conditional"):
+            games, new_etag = self._run_client(self.client.fetch_sport_conditional(sport, etag))
+            if games is None:
+                return None, etag
+            if new_etag:
+                return games, new_etag
+        else:
+            games = self.fetch_odds_api(sport=sport)
+        fingerprint = odds_fingerprint(games)
+        if etag is not None and fingerprint == etag:
+            return None, etag
+        return games, fingerprint
+
+    def _run_client(self, coro):
+        if self._loop is None:
+            import asyncio  # Deferred: only live clients need an event loop.
+
+            # A private loop, never installed as the thread's current one, so
+            # callers that run their own loop are unaffected.
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(coro)
+
+    @staticmethod
+    def _synthetic_odds(sport: str, max_games: int | None) -> List[dict]:
+        slate = OddsScraper._synthetic_slate(sport, max_games)
+        return list(slate.games())
+
+    @staticmethod
+    def _synthetic_slate(sport: str, max_games: int | None) -> Slate:
+        slate = Slate(sport)
+        teams = len(slate.teams)
+        if teams < 2:
+            return slate
+
+        target_games = max_games or (teams // 2)
+        total_line = DEFAULT_TOTALS.get(sport, 50.0)
         for idx in range(target_games):
-            home_team = teams[(idx * 2) % len(teams)]
-            away_team = teams[(idx * 2 + 1) % len(teams)]
-            total_line = default_totals.get(sport, 50.0)
-            game_templates.append(
-                {
-                    "game_id": f"{sport}_{idx:03d}",
-                    "home_team": home_team,
-                    "away_team": away_team,
-                    "total_line": total_line,
-                    "over_odds": -110,
-                    "under_odds": -110,
-                }
-            )
-
-        return game_templates
+            # Registry order is the TeamIndex order, so positions are team IDs.
+            slate.append(f"{sport}_{idx:03d}", (idx * 2) % teams, (idx * 2 + 1) % teams, total_line, -110, -110)
+
+        return slate
 
     @staticmethod
     def list_supported_sports() -> List[str]:
         return supported_sports()
 
 
-__all__ = ["OddsScraper"]
+def odds_fingerprint(games: List[dict]) -> str:
+    payload = json.dumps(games, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return hashlib.sha1(payload).hexdigest()
+
+
+__all__ = ["DEFAULT_TOTALS", "OddsScraper", "odds_fingerprint"]
@@ -0,0 +1,158 @@
+"""Columnar container for one sport's slate of totals markets.
+
+A ``Slate`` stores each field as a typed ``array`` column indexed by game
+position: team IDs interned through ``TeamIndex``, total lines, over/under
+odds and start times. The odds layer fills the columns directly and
+``SlatePricer.price_slates`` reads them without building a dict per game;
+``game(i)`` materializes a feed-shaped dict only when a caller needs one.
+"""
+from __future__ import annotations
+
+from array import array
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Sequence
+import math
+
+from .team_registry import TeamIndex, team_index
+
+
+def start_timestamp(game: dict) -> float | None:
+    """Parse ``commence_time`` (epoch seconds or ISO 8601) if the feed provides it."""
+    value = game.get("commence_time")
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        return datetime.fromisoformat(str(value).replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+
+class Slate:
+    """Games for one sport as parallel columns.
+
+    Feed names the registry cannot resolve get IDs past the end of the
+    sport's ``TeamIndex``, local to this slate.
+    """
+
+    def __init__(self, sport: str, teams: TeamIndex | None = None):
+        self.sport = sport
+        self.teams = teams or team_index(sport)
+        self.game_ids: List[str] = []
+        self.home = array("i")
+        self.away = array("i")
+        self.total_line = array("d")
+        self.over_odds = array("i")
+        self.under_odds = array("i")
+        self.start = array("d")  # epoch seconds, NaN when the feed has none
+        self.injuries: Dict[int, List[dict]] = {}  # sparse: most games have none
+        self.extra_teams: List[str] = []
+        self._extra_ids: Dict[str, int] = {}
+        self._source: List[dict] | None = None
+
+    @classmethod
+    def from_games(cls, sport: str, games: Iterable[dict], fuzzy: bool = False) -> "Slate":
+        """Build a slate from feed dicts, which ``game(i)`` then returns as-is."""
+        slate = cls(sport)
+        source = list(games)
+        for game in source:
+            start = start_timestamp(game)
+            slate.append(
+                game["game_id"],
+                slate.team_id(game["home_team"], fuzzy),
+                slate.team_id(game["away_team"], fuzzy),
+                game["total_line"],
+                game["over_odds"],
+                game["under_odds"],
+                start if start is not None else math.nan,
+                game.get("injuries"),
+            )
+        slate._source = source
+        return slate
+
+    def append(
+        self,
+        game_id: str,
+        home: int,
+        away: int,
+        total_line: float,
+        over_odds: int,
+        under_odds: int,
+        start: float = math.nan,
+        injuries: Sequence[dict] | None = None,
+    ) -> int:
+        idx = len(self.game_ids)
+        self.game_ids.append(game_id)
+        self.home.append(home)
+        self.away.append(away)
+        self.total_line.append(total_line)
+        self.over_odds.append(over_odds)
+        self.under_odds.append(under_odds)
+        self.start.append(start)
+        if injuries:
+            self.injuries[idx] = list(injuries)
+        self._source = None
+        return idx
+
+    def slice(self, start: int, stop: int) -> "Slate":
+        """Games ``start:stop`` as a new slate; team IDs (including unresolved names) stay valid."""
+        start, stop, _ = slice(start, stop).indices(len(self))
+        part = Slate(self.sport, self.teams)
+        part.game_ids = self.game_ids[start:stop]
+        part.home = self.home[start:stop]
+        part.away = self.away[start:stop]
+        part.total_line = self.total_line[start:stop]
+        part.over_odds = self.over_odds[start:stop]
+        part.under_odds = self.under_odds[start:stop]
+        part.start = self.start[start:stop]
+        part.injuries = {idx - start: value for idx, value in self.injuries.items() if start <= idx < stop}
+        part.extra_teams = self.extra_teams
+        part._extra_ids = self._extra_ids
+        if self._source is not None:
+            part._source = self._source[start:stop]
+        return part
+
+    def team_id(self, name: str, fuzzy: bool = False) -> int:
+        team = self.teams.resolve(name, fuzzy=fuzzy)
+        if team is not None:
+            return team
+        team = self._extra_ids.get(name)
+        if team is None:
+            team = self._extra_ids[name] = len(self.teams) + len(self.extra_teams)
+            self.extra_teams.append(name)
+        return team
+
+    def team_name(self, team: int) -> str:
+        offset = team - len(self.teams)
+        return self.extra_teams[offset] if offset >= 0 else self.teams.name_of(team)
+
+    def team_ids(self) -> List[int]:
+        """Distinct team IDs playing on this slate."""
+        return list(dict.fromkeys(self.home + self.away))
+
+    def game(self, idx: int) -> dict:
+        if self._source is not None:
+            return self._source[idx]
+        game = {
+            "game_id": self.game_ids[idx],
+            "home_team": self.team_name(self.home[idx]),
+            "away_team": self.team_name(self.away[idx]),
+            "total_line": self.total_line[idx],
+            "over_odds": self.over_odds[idx],
+            "under_odds": self.under_odds[idx],
+        }
+        if not math.isnan(self.start[idx]):
+            game["commence_time"] = self.start[idx]
+        if idx in self.injuries:
+            game["injuries"] = self.injuries[idx]
+        return game
+
+    def games(self) -> Iterator[dict]:
+        return (self.game(idx) for idx in range(len(self)))
+
+    def __len__(self) -> int:
+        return len(self.game_ids)
+
+
+__all__: List[str] = ["Slate", "start_timestamp"]
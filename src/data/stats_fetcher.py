@@ -1,6 +1,20 @@
 from __future__ import annotations
 
-from typing import Dict, List
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Callable, Dict, Iterable, List, Tuple
+import threading
+import time
+
+
+BASELINES: Dict[str, Dict[str, float]] = {
+    "basketball_nba": {"pace": 100.0, "offensive_rating": 112.0, "defensive_rating": 111.0},
+    "basketball_cbb_division1": {"pace": 68.0, "offensive_rating": 102.0, "defensive_rating": 101.0},
+    "football_nfl": {"pace": 63.0, "offensive_rating": 23.0, "defensive_rating": 23.0},
+    "football_cfb_fbs": {"pace": 70.0, "offensive_rating": 29.0, "defensive_rating": 29.0},
+    "hockey_nhl": {"pace": 60.0, "offensive_rating": 3.1, "defensive_rating": 3.1},
+    "soccer": {"pace": 1.0, "offensive_rating": 1.4, "defensive_rating": 1.2},
+}
 
 
 class StatsFetcher:
@@ -10,9 +24,21 @@ class StatsFetcher:
     in external clients (NBA API, odds API, etc.) without changing the rest of
     the modeling stack. If no client is provided, baseline heuristics are used
     to keep the demo self-contained.
+
+    Results are memoized per ``(sport, team)`` for ``cache_ttl`` seconds in an
+    LRU of ``cache_size`` entries, and concurrent callers asking for the same
+    team share one in-flight fetch, so a slate scan hits each client at most
+    once per team.
     """
 
-    def __init__(self, nba_api_client=None, odds_api_client=None):
+    def __init__(
+        self,
+        nba_api_client=None,
+        odds_api_client=None,
+        cache_ttl: float = 300.0,
+        cache_size: int = 4096,
+        clock: Callable[[], float] = time.monotonic,
+    ):
         self.nba_api_client = nba_api_client
         self.odds_api_client = odds_api_client
         self.team_adjustments: Dict[str, Dict[str, Dict[str, float]]] = {
@@ -21,36 +47,117 @@ class StatsFetcher:
                 "Memphis Grizzlies": {"pace": 99.5, "defensive_rating": 110.0},
             }
         }
+        # Explicit per-team updates layered over whichever source answered.
+        self.overrides: Dict[str, Dict[str, Dict[str, float]]] = {}
+        self.cache_ttl = cache_ttl
+        self.cache_size = cache_size
+        self.clock = clock
+        self.fetches = 0
+        self._cache: "OrderedDict[Tuple[str, str], Tuple[float, Dict[str, float]]]" = OrderedDict()
+        self._inflight: Dict[Tuple[str, str], Future] = {}
+        self._lock = threading.Lock()
 
     def fetch_team_stats(self, team: str, sport: str = "basketball_nba") -> Dict[str, float]:
+        return self.fetch_team_stats_many([team], sport)[team]
+
+    def fetch_team_stats_many(self, teams: Iterable[str], sport: str = "basketball_nba") -> Dict[str, Dict[str, float]]:
+        """Fetch stats for every team in one pass, loading only cache misses."""
+        results: Dict[str, Dict[str, float]] = {}
+        owned: Dict[str, Future] = {}
+        waiting: Dict[str, Future] = {}
+        now = self.clock()
+
+        with self._lock:
+            for team in dict.fromkeys(teams):
+                key = (sport, team)
+                cached = self._cache.get(key)
+                if cached is not None and cached[0] > now:
+                    self._cache.move_to_end(key)
+                    results[team] = cached[1]
+                elif key in self._inflight:
+                    waiting[team] = self._inflight[key]
+                else:
+                    owned[team] = self._inflight[key] = Future()
+
+        if owned:
+            try:
+                loaded = self._load_many(list(owned), sport)
+            except BaseException as exc:
+                with self._lock:
+                    for team, future in owned.items():
+                        self._inflight.pop((sport, team), None)
+                        future.set_exception(exc)
+                raise
+            expires = self.clock() + self.cache_ttl
+            with self._lock:
+                for team, future in owned.items():
+                    key = (sport, team)
+                    self._cache[key] = (expires, loaded[team])
+                    self._cache.move_to_end(key)
+                    self._inflight.pop(key, None)
+                    future.set_result(loaded[team])
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+            results.update(loaded)
+
+        for team, future in waiting.items():
+            results[team] = future.result()
+        return {team: dict(stats) for team, stats in results.items()}
+
+    def update_team_stats(self, team: str, sport: str, stats: Dict[str, float]) -> None:
+        """Override ``team``'s stats (e.g. from a live feed) and drop its cached entry."""
+        self.overrides.setdefault(sport, {}).setdefault(team, {}).update(stats)
+        self.invalidate(team=team, sport=sport)
+
+    def invalidate(self, team: str | None = None, sport: str | None = None) -> None:
+        with self._lock:
+            if team is None and sport is None:
+                self._cache.clear()
+                return
+            for key in [k for k in self._cache if (sport is None or k[0] == sport) and (team is None or k[1] == team)]:
+                del self._cache[key]
+
+    def _load_many(self, teams: List[str], sport: str) -> Dict[str, Dict[str, float]]:
+        self.fetches += len(teams)
+        baseline = self._baseline_for(sport)
+        loaded: Dict[str, Dict[str, float]] = {}
+        pending = list(teams)
+
         # NBA API hook
         if sport == "basketball_nba" and self.nba_api_client:
-            data = self.nba_api_client.fetch_team_metrics(team)
-            if data:
-                return {**self._baseline_for(sport), **data}
+            for team, data in self._client_many(self.nba_api_client, "fetch_team_metrics", pending).items():
+                if data:
+                    loaded[team] = {**baseline, **data}
+            pending = [team for team in pending if team not in loaded]
 
         # Odds API hook (for market-implied priors such as totals pace)
-        if self.odds_api_client:
-            hint = self.odds_api_client.fetch_team_context(team, sport)
-            if hint:
-                return {**self._baseline_for(sport), **hint}
+        if pending and self.odds_api_client:
+            for team, hint in self._client_many(self.odds_api_client, "fetch_team_context", pending, sport).items():
+                if hint:
+                    loaded[team] = {**baseline, **hint}
+            pending = [team for team in pending if team not in loaded]
 
         adjustments = self.team_adjustments.get(sport, {})
-        return {**self._baseline_for(sport), **adjustments.get(team, {})}
+        for team in pending:
+            loaded[team] = {**baseline, **adjustments.get(team, {})}
+        for team, override in self.overrides.get(sport, {}).items():
+            if team in loaded:
+                loaded[team] = {**loaded[team], **override}
+        return loaded
 
-    def _baseline_for(self, sport: str) -> Dict[str, float]:
-        baselines: Dict[str, Dict[str, float]] = {
-            "basketball_nba": {"pace": 100.0, "offensive_rating": 112.0, "defensive_rating": 111.0},
-            "basketball_cbb_division1": {"pace": 68.0, "offensive_rating": 102.0, "defensive_rating": 101.0},
-            "football_nfl": {"pace": 63.0, "offensive_rating": 23.0, "defensive_rating": 23.0},
-            "football_cfb_fbs": {"pace": 70.0, "offensive_rating": 29.0, "defensive_rating": 29.0},
-            "hockey_nhl": {"pace": 60.0, "offensive_rating": 3.1, "defensive_rating": 3.1},
-            "soccer": {"pace": 1.0, "offensive_rating": 1.4, "defensive_rating": 1.2},
-        }
+    @staticmethod
+    def _client_many(client, method: str, teams: List[str], *args) -> Dict[str, Dict[str, float] | None]:
+        # Prefer a bulk endpoint (``<method>_many``) when the client offers one.
+        bulk = getattr(client, f"{method}_many", None)
+        if bulk is not None:
+            return bulk(teams, *args) or {}
+        single = getattr(client, method)
+        return {team: single(team, *args) for team in teams}
 
+    def _baseline_for(self, sport: str) -> Dict[str, float]:
         if sport.startswith("soccer_"):
-            return baselines["soccer"]
-        return baselines.get(sport, baselines["basketball_nba"])
+            return BASELINES["soccer"]
+        return BASELINES.get(sport, BASELINES["basketball_nba"])
 
 
 __all__: List[str] = ["StatsFetcher"]
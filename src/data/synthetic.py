@@ -0,0 +1,299 @@
+"""Seeded synthetic slates, line movement and injury news for load testing.
+
+``SyntheticSlateGenerator`` produces any number of games per sport, each
+quoted by several books with realistic dispersion: consensus totals spread
+around the sport's typical total, book-to-book line offsets, over/under
+prices with a varying overround, start times over a horizon and occasional
+injuries. Games, quotes and news are generators (or fixed-size ``Slate``
+chunks), so their memory stays flat however many games are requested. The
+line-move stream is the exception: it tracks every quote's current total, so
+it holds O(quotes) memory, 4 bytes per quote (20MB for a million five-book
+games), independent of how many moves it emits.
+
+The same seed always yields the same stream, so a stress run can be replayed
+exactly. ``SyntheticOddsClient`` plugs the generator into ``OddsScraper`` in
+place of a live provider.
+"""
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Dict, Iterator, List, Sequence, Tuple
+import heapq
+import math
+import random
+
+from .odds_scraper import DEFAULT_TOTALS
+from .slate import Slate
+from .team_registry import team_index
+
+
+DEFAULT_BOOKS: Tuple[str, ...] = ("pinnacle", "draftkings", "fanduel", "betmgm", "caesars")
+# 2026-01-01T00:00:00Z; a fixed origin keeps start times reproducible.
+EPOCH = 1_767_225_600.0
+# Book-to-book deviation from the consensus total, in half points.
+BOOK_OFFSETS = (-1.0, -0.5, 0.0, 0.0, 0.0, 0.0, 0.5, 1.0)
+INJURY_STATUSES = ("out", "out", "doubtful", "questionable", "questionable")
+
+# (game_id, event_id, book, home_id, away_id, total_line, over_odds, under_odds, start, injuries)
+Quote = Tuple[str, str, str, int, int, float, int, int, float, List[dict] | None]
+
+
+@dataclass(frozen=True)
+class LineMove:
+    ts: float
+    sport: str
+    game_id: str
+    total_line: float
+    over_odds: int
+    under_odds: int
+
+
+@dataclass(frozen=True)
+class InjuryUpdate:
+    ts: float
+    sport: str
+    team: str
+    injuries: List[dict]
+
+
+def probability_to_american(prob: float) -> int:
+    """American odds for an implied probability (vig included), clamped to [1%, 99%]."""
+    prob = min(0.99, max(0.01, prob))
+    if prob >= 0.5:
+        return -round(100 * prob / (1 - prob))
+    return round(100 * (1 - prob) / prob)
+
+
+class SyntheticSlateGenerator:
+    """Reproducible stream of games, quotes and market events for any sport."""
+
+    def __init__(
+        self,
+        seed: int = 0,
+        books: int | Sequence[str] = DEFAULT_BOOKS,
+        injury_rate: float = 0.1,
+        line_dispersion: float = 0.06,
+        horizon_days: float = 7.0,
+        start: float = EPOCH,
+    ):
+        self.seed = seed
+        if isinstance(books, int):
+            # Named books first, then numbered ones for very wide markets.
+            books = list(DEFAULT_BOOKS[:books]) + [f"book{idx:02d}" for idx in range(len(DEFAULT_BOOKS), books)]
+        self.books = list(books)
+        if not self.books:
+            raise ValueError("At least one book is required")
+        self.injury_rate = injury_rate
+        self.line_dispersion = line_dispersion
+        self.horizon = horizon_days * 86400.0
+        self.start = start
+
+    def games(self, sport: str, count: int) -> Iterator[dict]:
+        """Feed-shaped game dicts, one per (game, book); ``event_id`` groups a game's quotes."""
+        index = team_index(sport)
+        for game_id, event_id, book, home, away, line, over, under, start, injuries in self._quotes(sport, count):
+            game = {
+                "game_id": game_id,
+                "event_id": event_id,
+                "book": book,
+                "home_team": index.name_of(home),
+                "away_team": index.name_of(away),
+                "total_line": line,
+                "over_odds": over,
+                "under_odds": under,
+                "commence_time": start,
+            }
+            if injuries:
+                game["injuries"] = injuries
+            yield game
+
+    def slates(self, sport: str, count: int, chunk_size: int = 10_000) -> Iterator[Slate]:
+        """The same quotes as ``games`` in columnar chunks of at most ``chunk_size`` rows."""
+        slate = Slate(sport)
+        for game_id, _, _, home, away, line, over, under, start, injuries in self._quotes(sport, count):
+            slate.append(game_id, home, away, line, over, under, start, injuries)
+            if len(slate) >= chunk_size:
+                yield slate
+                slate = Slate(sport)
+        if len(slate):
+            yield slate
+
+    def line_moves(self, sport: str, count: int, moves: int, mean_gap: float = 5.0) -> Iterator[LineMove]:
+        """``moves`` price updates on the quotes of ``games(sport, count)``, in time order."""
+        # Quote ``slot`` is game ``slot // books`` at book ``slot % books``, so ids are rebuilt on demand.
+        # Each move redraws both prices, so only the totals carry state; half points are exact in float32.
+        lines = array("f", (quote[5] for quote in self._quotes(sport, count)))
+        if not lines:
+            return
+        books = self.books
+        rng = self._rng(sport, "moves")
+        base = DEFAULT_TOTALS.get(sport, 50.0)
+        ts = self.start
+        for _ in range(moves):
+            ts += rng.expovariate(1.0 / mean_gap)
+            slot = rng.randrange(len(lines))
+            # High totals move in half points; low ones mostly through the price.
+            if base >= 20 or rng.random() < 0.1:
+                lines[slot] = max(0.5, lines[slot] + rng.choice((-0.5, 0.5)))
+            over, under = self.prices(rng)
+            game, book = divmod(slot, len(books))
+            game_id = f"{sport}_{game:07d}_{books[book]}"
+            yield LineMove(ts, sport, game_id, lines[slot], over, under)
+
+    def injury_updates(self, sport: str, updates: int, mean_gap: float = 60.0) -> Iterator[InjuryUpdate]:
+        """News feed of full injury lists per team, in time order."""
+        index = team_index(sport)
+        if not len(index):
+            return
+        rng = self._rng(sport, "injuries")
+        base = DEFAULT_TOTALS.get(sport, 50.0)
+        ts = self.start
+        for _ in range(updates):
+            ts += rng.expovariate(1.0 / mean_gap)
+            team = rng.randrange(len(index))
+            injuries = [self._injury(rng, index.name_of(team), base) for _ in range(rng.choice((0, 1, 1, 2)))]
+            yield InjuryUpdate(ts, sport, index.name_of(team), injuries)
+
+    def events(self, sport: str, count: int, moves: int, injury_updates: int) -> Iterator[LineMove | InjuryUpdate]:
+        """Line moves and injury news interleaved by timestamp."""
+        return heapq.merge(
+            self.line_moves(sport, count, moves),
+            self.injury_updates(sport, injury_updates),
+            key=lambda event: event.ts,
+        )
+
+    def game_records(self, sport: str, count: int, games_per_day: int = 10, first_day: date = date(2026, 1, 1)):
+        """Completed games with scores for the walk-forward backtester, graded against the first book's line."""
+        try:
+            from ..backtest.walk_forward import GameRecord
+        except ImportError:  # Allows imports when src/ is on sys.path directly
+            from backtest.walk_forward import GameRecord
+
+        index = team_index(sport)
+        rng = self._rng(sport, "scores")
+        base = DEFAULT_TOTALS.get(sport, 50.0)
+        # Fixed per-team scoring strength so ratings have something to learn.
+        strength = [rng.gauss(0.0, 0.05) for _ in range(len(index))]
+        first_book = self.books[0]
+        for idx, (game_id, _, _, home, away, line, over, under, _, _) in enumerate(
+            quote for quote in self._quotes(sport, count) if quote[2] == first_book
+        ):
+            home_mean = base / 2 * (1 + strength[home] - strength[away])
+            away_mean = base / 2 * (1 + strength[away] - strength[home])
+            yield GameRecord(
+                game_id=game_id,
+                date=(first_day + timedelta(days=idx // games_per_day)).isoformat(),
+                home_team=index.name_of(home),
+                away_team=index.name_of(away),
+                home_score=self._score(rng, home_mean, base),
+                away_score=self._score(rng, away_mean, base),
+                total_line=line,
+                over_odds=over,
+                under_odds=under,
+            )
+
+    @staticmethod
+    def prices(rng: random.Random) -> Tuple[int, int]:
+        """One book's (over, under) American odds: a fair split near 50/50 plus a 2-6% overround."""
+        fair_over = min(0.65, max(0.35, rng.gauss(0.5, 0.04)))
+        overround = 1 + rng.uniform(0.02, 0.06)
+        return probability_to_american(fair_over * overround), probability_to_american((1 - fair_over) * overround)
+
+    def _quotes(self, sport: str, count: int) -> Iterator[Quote]:
+        index = team_index(sport)
+        teams = len(index)
+        if teams < 2:
+            return
+        rng = self._rng(sport, "games")
+        base = DEFAULT_TOTALS.get(sport, 50.0)
+        for idx in range(count):
+            home = rng.randrange(teams)
+            away = rng.randrange(teams - 1)
+            away += away >= home
+            consensus = _round_half(base * (1 + rng.gauss(0.0, self.line_dispersion)))
+            start = round(self.start + rng.uniform(0.0, self.horizon))
+            injuries = None
+            if rng.random() < self.injury_rate:
+                side = index.name_of(rng.choice((home, away)))
+                injuries = [self._injury(rng, side, base) for _ in range(rng.choice((1, 1, 2)))]
+            event_id = f"{sport}_{idx:07d}"
+            for book in self.books:
+                line = (consensus + rng.choice(BOOK_OFFSETS)) if base >= 20 else consensus
+                over, under = self.prices(rng)
+                yield f"{event_id}_{book}", event_id, book, home, away, max(0.5, line), over, under, start, injuries
+
+    def _rng(self, sport: str, stream: str) -> random.Random:
+        # String seeds hash deterministically (unlike ``hash()``), so runs replay across processes.
+        return random.Random(f"{self.seed}:{sport}:{stream}")
+
+    @staticmethod
+    def _injury(rng: random.Random, team: str, base: float) -> dict:
+        return {
+            "player": f"{team} #{rng.randrange(1, 100)}",
+            "status": rng.choice(INJURY_STATUSES),
+            "impact": round(base * rng.uniform(0.005, 0.02), 2),
+        }
+
+    @staticmethod
+    def _score(rng: random.Random, mean: float, base: float) -> float:
+        if base < 10:
+            return float(_poisson(rng, mean))
+        return float(max(0, round(rng.gauss(mean, max(math.sqrt(mean), 0.055 * base)))))
+
+
+class SyntheticOddsClient:
+    """Async odds-client stand-in backed by the generator.
+
+    Each ``fetch_sport`` after the first re-prices ``move_fraction`` of the
+    sport's quotes, so ``OddsCache`` and the daemon see realistic churn.
+    """
+
+    def __init__(self, generator: SyntheticSlateGenerator, games_per_sport: int, move_fraction: float = 0.05):
+        self.generator = generator
+        self.games_per_sport = games_per_sport
+        self.move_fraction = move_fraction
+        self._games: Dict[str, List[dict]] = {}
+        self._rng = random.Random(f"{generator.seed}:client")
+
+    async def fetch_sport(self, sport: str) -> List[dict]:
+        games = self._games.get(sport)
+        if games is None:
+            games = self._games[sport] = list(self.generator.games(sport, self.games_per_sport))
+        elif games:
+            for _ in range(max(1, int(len(games) * self.move_fraction))):
+                slot = self._rng.randrange(len(games))
+                over, under = self.generator.prices(self._rng)
+                games[slot] = {**games[slot], "over_odds": over, "under_odds": under}
+        return list(games)
+
+    async def fetch_all(self, sports: Sequence[str]) -> Dict[str, List[dict]]:
+        return {sport: await self.fetch_sport(sport) for sport in sports}
+
+    async def close(self) -> None:
+        return None
+
+
+def _round_half(value: float) -> float:
+    return max(0.5, round(value * 2) / 2)
+
+
+def _poisson(rng: random.Random, mean: float) -> int:
+    # Knuth's method; fine for the single-digit means of low-scoring sports.
+    threshold = math.exp(-mean)
+    count, product = 0, rng.random()
+    while product > threshold:
+        count += 1
+        product *= rng.random()
+    return count
+
+
+__all__: List[str] = [
+    "DEFAULT_BOOKS",
+    "InjuryUpdate",
+    "LineMove",
+    "SyntheticOddsClient",
+    "SyntheticSlateGenerator",
+    "probability_to_american",
+]
@@ -1,798 +1,213 @@
 """League team registries used by the demo scanners.
 
-These lists are intentionally explicit so the stubbed odds generator can
-iterate over every club/school in each supported competition. The module
-focuses on breadth of coverage rather than deep statistics so the rest of
-the modeling stack can assume the team universe is complete.
+These lists (stored in ``teams.json``) are intentionally explicit so the
+stubbed odds generator can iterate over every club/school in each supported
+competition. The module focuses on breadth of coverage rather than deep
+statistics so the rest of the modeling stack can assume the team universe is
+complete.
 """
 from __future__ import annotations
 
-from typing import Dict, List
-
-
-# NBA
-NBA_TEAMS: List[str] = [
-    "Atlanta Hawks",
-    "Boston Celtics",
-    "Brooklyn Nets",
-    "Charlotte Hornets",
-    "Chicago Bulls",
-    "Cleveland Cavaliers",
-    "Dallas Mavericks",
-    "Denver Nuggets",
-    "Detroit Pistons",
-    "Golden State Warriors",
-    "Houston Rockets",
-    "Indiana Pacers",
-    "LA Clippers",
-    "Los Angeles Lakers",
-    "Memphis Grizzlies",
-    "Miami Heat",
-    "Milwaukee Bucks",
-    "Minnesota Timberwolves",
-    "New Orleans Pelicans",
-    "New York Knicks",
-    "Oklahoma City Thunder",
-    "Orlando Magic",
-    "Philadelphia 76ers",
-    "Phoenix Suns",
-    "Portland Trail Blazers",
-    "Sacramento Kings",
-    "San Antonio Spurs",
-    "Toronto Raptors",
-    "Utah Jazz",
-    "Washington Wizards",
-]
-
-# NFL
-NFL_TEAMS: List[str] = [
-    "Arizona Cardinals",
-    "Atlanta Falcons",
-    "Baltimore Ravens",
-    "Buffalo Bills",
-    "Carolina Panthers",
-    "Chicago Bears",
-    "Cincinnati Bengals",
-    "Cleveland Browns",
-    "Dallas Cowboys",
-    "Denver Broncos",
-    "Detroit Lions",
-    "Green Bay Packers",
-    "Houston Texans",
-    "Indianapolis Colts",
-    "Jacksonville Jaguars",
-    "Kansas City Chiefs",
-    "Las Vegas Raiders",
-    "Los Angeles Chargers",
-    "Los Angeles Rams",
-    "Miami Dolphins",
-    "Minnesota Vikings",
-    "New England Patriots",
-    "New Orleans Saints",
-    "New York Giants",
-    "New York Jets",
-    "Philadelphia Eagles",
-    "Pittsburgh Steelers",
-    "San Francisco 49ers",
-    "Seattle Seahawks",
-    "Tampa Bay Buccaneers",
-    "Tennessee Titans",
-    "Washington Commanders",
-]
-
-# NHL
-NHL_TEAMS: List[str] = [
-    "Anaheim Ducks",
-    "Arizona Coyotes",
-    "Boston Bruins",
-    "Buffalo Sabres",
-    "Calgary Flames",
-    "Carolina Hurricanes",
-    "Chicago Blackhawks",
-    "Colorado Avalanche",
-    "Columbus Blue Jackets",
-    "Dallas Stars",
-    "Detroit Red Wings",
-    "Edmonton Oilers",
-    "Florida Panthers",
-    "Los Angeles Kings",
-    "Minnesota Wild",
-    "Montreal Canadiens",
-    "Nashville Predators",
-    "New Jersey Devils",
-    "New York Islanders",
-    "New York Rangers",
-    "Ottawa Senators",
-    "Philadelphia Flyers",
-    "Pittsburgh Penguins",
-    "San Jose Sharks",
-    "Seattle Kraken",
-    "St. Louis Blues",
-    "Tampa Bay Lightning",
-    "Toronto Maple Leafs",
-    "Vancouver Canucks",
-    "Vegas Golden Knights",
-    "Washington Capitals",
-    "Winnipeg Jets",
-]
-
-# College football (FBS)
-FBS_TEAMS: List[str] = [
-    "Air Force Falcons",
-    "Akron Zips",
-    "Alabama Crimson Tide",
-    "Appalachian State Mountaineers",
-    "Arizona Wildcats",
-    "Arizona State Sun Devils",
-    "Arkansas Razorbacks",
-    "Arkansas State Red Wolves",
-    "Army Black Knights",
-    "Auburn Tigers",
-    "Ball State Cardinals",
-    "Baylor Bears",
-    "Boise State Broncos",
-    "Boston College Eagles",
-    "Bowling Green Falcons",
-    "Buffalo Bulls",
-    "BYU Cougars",
-    "California Golden Bears",
-    "Central Michigan Chippewas",
-    "Charlotte 49ers",
-    "Cincinnati Bearcats",
-    "Clemson Tigers",
-    "Coastal Carolina Chanticleers",
-    "Colorado Buffaloes",
-    "Colorado State Rams",
-    "Duke Blue Devils",
-    "East Carolina Pirates",
-    "Eastern Michigan Eagles",
-    "FIU Panthers",
-    "Florida Atlantic Owls",
-    "Florida Gators",
-    "Florida International Panthers",
-    "Florida State Seminoles",
-    "Fresno State Bulldogs",
-    "Georgia Bulldogs",
-    "Georgia Southern Eagles",
-    "Georgia State Panthers",
-    "Georgia Tech Yellow Jackets",
-    "Hawai'i Rainbow Warriors",
-    "Houston Cougars",
-    "Illinois Fighting Illini",
-    "Indiana Hoosiers",
-    "Iowa Hawkeyes",
-    "Iowa State Cyclones",
-    "Jacksonville State Gamecocks",
-    "James Madison Dukes",
-    "Kansas Jayhawks",
-    "Kansas State Wildcats",
-    "Kennesaw State Owls",
-    "Kent State Golden Flashes",
-    "Kentucky Wildcats",
-    "Liberty Flames",
-    "Louisiana Ragin' Cajuns",
-    "Louisiana Tech Bulldogs",
-    "Louisiana-Monroe Warhawks",
-    "Louisville Cardinals",
-    "LSU Tigers",
-    "Marshall Thundering Herd",
-    "Maryland Terrapins",
-    "Memphis Tigers",
-    "Miami Hurricanes",
-    "Miami RedHawks",
-    "Michigan State Spartans",
-    "Michigan Wolverines",
-    "Middle Tennessee Blue Raiders",
-    "Minnesota Golden Gophers",
-    "Mississippi State Bulldogs",
-    "Missouri Tigers",
-    "Navy Midshipmen",
-    "NC State Wolfpack",
-    "Nebraska Cornhuskers",
-    "Nevada Wolf Pack",
-    "New Mexico Lobos",
-    "New Mexico State Aggies",
-    "North Carolina Tar Heels",
-    "North Texas Mean Green",
-    "Northern Illinois Huskies",
-    "Northwestern Wildcats",
-    "Notre Dame Fighting Irish",
-    "Ohio Bobcats",
-    "Ohio State Buckeyes",
-    "Oklahoma Sooners",
-    "Oklahoma State Cowboys",
-    "Old Dominion Monarchs",
-    "Ole Miss Rebels",
-    "Oregon Ducks",
-    "Oregon State Beavers",
-    "Penn State Nittany Lions",
-    "Pittsburgh Panthers",
-    "Purdue Boilermakers",
-    "Rice Owls",
-    "Rutgers Scarlet Knights",
-    "Sam Houston Bearkats",
-    "San Diego State Aztecs",
-    "San Jose State Spartans",
-    "SMU Mustangs",
-    "South Alabama Jaguars",
-    "South Carolina Gamecocks",
-    "South Florida Bulls",
-    "Southern Miss Golden Eagles",
-    "Stanford Cardinal",
-    "Syracuse Orange",
-    "TCU Horned Frogs",
-    "Temple Owls",
-    "Tennessee Volunteers",
-    "Texas A&M Aggies",
-    "Texas Longhorns",
-    "Texas State Bobcats",
-    "Texas Tech Red Raiders",
-    "Toledo Rockets",
-    "Troy Trojans",
-    "Tulane Green Wave",
-    "Tulsa Golden Hurricane",
-    "UAB Blazers",
-    "UCF Knights",
-    "UCLA Bruins",
-    "UConn Huskies",
-    "UMass Minutemen",
-    "UNLV Rebels",
-    "USC Trojans",
-    "UTEP Miners",
-    "UTSA Roadrunners",
-    "Utah State Aggies",
-    "Utah Utes",
-    "Vanderbilt Commodores",
-    "Virginia Cavaliers",
-    "Virginia Tech Hokies",
-    "Wake Forest Demon Deacons",
-    "Washington Huskies",
-    "Washington State Cougars",
-    "West Virginia Mountaineers",
-    "Western Kentucky Hilltoppers",
-    "Western Michigan Broncos",
-    "Wisconsin Badgers",
-    "Wyoming Cowboys",
-]
-
-# Soccer top five European leagues + Champions League (club list focuses on 2023-24 participants)
-SOCCER_EPL_TEAMS: List[str] = [
-    "Arsenal",
-    "Aston Villa",
-    "Bournemouth",
-    "Brentford",
-    "Brighton & Hove Albion",
-    "Burnley",
-    "Chelsea",
-    "Crystal Palace",
-    "Everton",
-    "Fulham",
-    "Liverpool",
-    "Luton Town",
-    "Manchester City",
-    "Manchester United",
-    "Newcastle United",
-    "Nottingham Forest",
-    "Sheffield United",
-    "Tottenham Hotspur",
-    "West Ham United",
-    "Wolverhampton Wanderers",
-]
+from collections import Counter
+from typing import Dict, Iterable, List, Tuple
+import json
+import os
+import re
+import sys
+import unicodedata
+
+
+# Team lists live in a compact JSON file and are parsed on first use, so
+# importing this module (and the CLI) does not pay for the full registry.
+_TEAMS_PATH = os.path.join(os.path.dirname(__file__), "teams.json")
+_TEAM_LIST_NAMES: Dict[str, str] = {
+    "NBA_TEAMS": "basketball_nba",
+    "NFL_TEAMS": "football_nfl",
+    "NHL_TEAMS": "hockey_nhl",
+    "FBS_TEAMS": "football_cfb_fbs",
+    "SOCCER_EPL_TEAMS": "soccer_epl",
+    "SOCCER_LALIGA_TEAMS": "soccer_laliga",
+    "SOCCER_BUNDESLIGA_TEAMS": "soccer_bundesliga",
+    "SOCCER_SERIE_A_TEAMS": "soccer_serie_a",
+    "SOCCER_LIGUE1_TEAMS": "soccer_ligue1",
+    "SOCCER_CHAMPIONS_LEAGUE_TEAMS": "soccer_champions_league",
+    "CBB_DIVISION_I_TEAMS": "basketball_cbb_division1",
+}
+_SPORT_TEAM_MAP: Dict[str, List[str]] | None = None
 
-SOCCER_LALIGA_TEAMS: List[str] = [
-    "Alavés",
-    "Almería",
-    "Athletic Club",
-    "Atlético Madrid",
-    "Barcelona",
-    "Cádiz",
-    "Celta Vigo",
-    "Getafe",
-    "Girona",
-    "Granada",
-    "Las Palmas",
-    "Mallorca",
-    "Osasuna",
-    "Rayo Vallecano",
-    "Real Betis",
-    "Real Madrid",
-    "Real Sociedad",
-    "Sevilla",
-    "Valencia",
-    "Villarreal",
-]
 
-SOCCER_BUNDESLIGA_TEAMS: List[str] = [
-    "1. FC Köln",
-    "1. FC Union Berlin",
-    "1. FSV Mainz 05",
-    "Bayern Munich",
-    "Bayer Leverkusen",
-    "Borussia Dortmund",
-    "Borussia Mönchengladbach",
-    "Darmstadt",
-    "Eintracht Frankfurt",
-    "FC Augsburg",
-    "FC Heidenheim",
-    "Hertha BSC",
-    "RB Leipzig",
-    "SC Freiburg",
-    "TSG Hoffenheim",
-    "VfB Stuttgart",
-    "VfL Bochum",
-    "Werder Bremen",
-]
+def _team_map() -> Dict[str, List[str]]:
+    global _SPORT_TEAM_MAP
+    if _SPORT_TEAM_MAP is None:
+        with open(_TEAMS_PATH, encoding="utf-8") as handle:
+            _SPORT_TEAM_MAP = json.load(handle)
+    return _SPORT_TEAM_MAP
 
-SOCCER_SERIE_A_TEAMS: List[str] = [
-    "AC Milan",
-    "AS Roma",
-    "Atalanta",
-    "Bologna",
-    "Cagliari",
-    "Empoli",
-    "Fiorentina",
-    "Frosinone",
-    "Genoa",
-    "Inter Milan",
-    "Juventus",
-    "Lazio",
-    "Lecce",
-    "Monza",
-    "Napoli",
-    "Salernitana",
-    "Sassuolo",
-    "Torino",
-    "Udinese",
-    "Verona",
-]
 
-SOCCER_LIGUE1_TEAMS: List[str] = [
-    "Clermont Foot",
-    "Havre AC",
-    "Lens",
-    "Lille",
-    "Lorient",
-    "Lyon",
-    "Marseille",
-    "Metz",
-    "Monaco",
-    "Montpellier",
-    "Nantes",
-    "Nice",
-    "Paris Saint-Germain",
-    "Reims",
-    "Rennes",
-    "Strasbourg",
-    "Toulouse",
-    "Brest",
-]
+def __getattr__(name: str):
+    # ``SPORT_TEAM_MAP`` and the per-league lists stay importable, loaded lazily.
+    if name == "SPORT_TEAM_MAP":
+        return _team_map()
+    if name in _TEAM_LIST_NAMES:
+        return _team_map()[_TEAM_LIST_NAMES[name]]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-SOCCER_CHAMPIONS_LEAGUE_TEAMS: List[str] = [
-    "Arsenal",
-    "Atlético Madrid",
-    "Barcelona",
-    "Bayern Munich",
-    "Benfica",
-    "Celtic",
-    "Chelsea",
-    "Copenhagen",
-    "Crvena Zvezda",
-    "Borussia Dortmund",
-    "Feyenoord",
-    "Galatasaray",
-    "Inter Milan",
-    "Juventus",
-    "Lazio",
-    "Liverpool",
-    "Manchester City",
-    "Manchester United",
-    "Marseille",
-    "Milan",
-    "Napoli",
-    "Paris Saint-Germain",
-    "Porto",
-    "PSV Eindhoven",
-    "Real Madrid",
-    "Real Sociedad",
-    "RB Leipzig",
-    "Sevilla",
-    "Shakhtar Donetsk",
-    "Sporting CP",
-    "Union Berlin",
-    "Villarreal",
-]
 
-# College basketball (Division I) – explicit list for scanner coverage
-CBB_DIVISION_I_TEAMS: List[str] = [
-    "Abilene Christian Wildcats",
-    "Air Force Falcons",
-    "Akron Zips",
-    "Alabama A&M Bulldogs",
-    "Alabama Crimson Tide",
-    "Alabama State Hornets",
-    "Albany Great Danes",
-    "Alcorn State Braves",
-    "American Eagles",
-    "Appalachian State Mountaineers",
-    "Arizona State Sun Devils",
-    "Arizona Wildcats",
-    "Arkansas State Red Wolves",
-    "Arkansas Razorbacks",
-    "Arkansas-Pine Bluff Golden Lions",
-    "Army Black Knights",
-    "Auburn Tigers",
-    "Austin Peay Governors",
-    "Ball State Cardinals",
-    "Baylor Bears",
-    "Bellarmine Knights",
-    "Belmont Bruins",
-    "Bethune-Cookman Wildcats",
-    "Binghamton Bearcats",
-    "Boise State Broncos",
-    "Boston College Eagles",
-    "Boston University Terriers",
-    "Bowling Green Falcons",
-    "Bradley Braves",
-    "Brown Bears",
-    "Bryant Bulldogs",
-    "Bucknell Bison",
-    "Buffalo Bulls",
-    "Butler Bulldogs",
-    "BYU Cougars",
-    "Cal Baptist Lancers",
-    "Cal Poly Mustangs",
-    "Cal State Bakersfield Roadrunners",
-    "Cal State Fullerton Titans",
-    "Cal State Northridge Matadors",
-    "California Golden Bears",
-    "Campbell Fighting Camels",
-    "Canisius Golden Griffins",
-    "Central Arkansas Bears",
-    "Central Connecticut Blue Devils",
-    "Central Michigan Chippewas",
-    "Charleston Cougars",
-    "Charleston Southern Buccaneers",
-    "Charlotte 49ers",
-    "Chattanooga Mocs",
-    "Chicago State Cougars",
-    "Cincinnati Bearcats",
-    "Clemson Tigers",
-    "Cleveland State Vikings",
-    "Coastal Carolina Chanticleers",
-    "Colgate Raiders",
-    "Colorado Buffaloes",
-    "Colorado State Rams",
-    "Columbia Lions",
-    "Coppin State Eagles",
-    "Cornell Big Red",
-    "Creighton Bluejays",
-    "Dartmouth Big Green",
-    "Davidson Wildcats",
-    "Dayton Flyers",
-    "Delaware Blue Hens",
-    "Delaware State Hornets",
-    "Denver Pioneers",
-    "DePaul Blue Demons",
-    "Detroit Mercy Titans",
-    "Drake Bulldogs",
-    "Drexel Dragons",
-    "Duke Blue Devils",
-    "Duquesne Dukes",
-    "East Carolina Pirates",
-    "East Tennessee State Buccaneers",
-    "Eastern Illinois Panthers",
-    "Eastern Kentucky Colonels",
-    "Eastern Michigan Eagles",
-    "Eastern Washington Eagles",
-    "Elon Phoenix",
-    "Evansville Purple Aces",
-    "Fairfield Stags",
-    "Fairleigh Dickinson Knights",
-    "Florida A&M Rattlers",
-    "Florida Atlantic Owls",
-    "Florida Gators",
-    "Florida Gulf Coast Eagles",
-    "Florida International Panthers",
-    "Florida State Seminoles",
-    "Fordham Rams",
-    "Fresno State Bulldogs",
-    "Furman Paladins",
-    "Gardner-Webb Runnin' Bulldogs",
-    "George Mason Patriots",
-    "George Washington Revolutionaries",
-    "Georgetown Hoyas",
-    "Georgia Bulldogs",
-    "Georgia Southern Eagles",
-    "Georgia State Panthers",
-    "Georgia Tech Yellow Jackets",
-    "Gonzaga Bulldogs",
-    "Grambling State Tigers",
-    "Grand Canyon Antelopes",
-    "Green Bay Phoenix",
-    "Hampton Pirates",
-    "Harvard Crimson",
-    "Hawaii Rainbow Warriors",
-    "High Point Panthers",
-    "Hofstra Pride",
-    "Holy Cross Crusaders",
-    "Houston Christian Huskies",
-    "Houston Cougars",
-    "Howard Bison",
-    "Idaho State Bengals",
-    "Idaho Vandals",
-    "Illinois Fighting Illini",
-    "Illinois State Redbirds",
-    "Incarnate Word Cardinals",
-    "Indiana Hoosiers",
-    "Indiana State Sycamores",
-    "Iona Gaels",
-    "Iowa Hawkeyes",
-    "Iowa State Cyclones",
-    "IUPUI Jaguars",
-    "Kansas City Roos",
-    "Jackson State Tigers",
-    "Jacksonville Dolphins",
-    "Jacksonville State Gamecocks",
-    "James Madison Dukes",
-    "Kansas Jayhawks",
-    "Kansas State Wildcats",
-    "Kennesaw State Owls",
-    "Kent State Golden Flashes",
-    "Kentucky Wildcats",
-    "La Salle Explorers",
-    "Lafayette Leopards",
-    "Lamar Cardinals",
-    "Lehigh Mountain Hawks",
-    "Le Moyne Dolphins",
-    "Liberty Flames",
-    "Lindenwood Lions",
-    "Lipscomb Bisons",
-    "Little Rock Trojans",
-    "Long Beach State Beach",
-    "Long Island Sharks",
-    "Longwood Lancers",
-    "Louisiana Ragin' Cajuns",
-    "Louisiana Tech Bulldogs",
-    "Louisiana-Monroe Warhawks",
-    "Louisville Cardinals",
-    "Loyola Chicago Ramblers",
-    "Loyola Marymount Lions",
-    "Loyola Maryland Greyhounds",
-    "LSU Tigers",
-    "Maine Black Bears",
-    "Manhattan Jaspers",
-    "Marist Red Foxes",
-    "Marquette Golden Eagles",
-    "Marshall Thundering Herd",
-    "Maryland Eastern Shore Hawks",
-    "Maryland Terrapins",
-    "Massachusetts Minutemen",
-    "McNeese Cowboys",
-    "Memphis Tigers",
-    "Mercer Bears",
-    "Merrimack Warriors",
-    "Miami Hurricanes",
-    "Miami RedHawks",
-    "Michigan State Spartans",
-    "Michigan Wolverines",
-    "Middle Tennessee Blue Raiders",
-    "Milwaukee Panthers",
-    "Minnesota Golden Gophers",
-    "Mississippi State Bulldogs",
-    "Mississippi Valley State Delta Devils",
-    "Missouri State Bears",
-    "Missouri Tigers",
-    "Monmouth Hawks",
-    "Montana Grizzlies",
-    "Montana State Bobcats",
-    "Morehead State Eagles",
-    "Morgan State Bears",
-    "Mount St. Mary's Mountaineers",
-    "Murray State Racers",
-    "Navy Midshipmen",
-    "Nebraska Cornhuskers",
-    "Nebraska Omaha Mavericks",
-    "Nevada Wolf Pack",
-    "New Hampshire Wildcats",
-    "New Mexico Lobos",
-    "New Mexico State Aggies",
-    "New Orleans Privateers",
-    "Niagara Purple Eagles",
-    "Nicholls Colonels",
-    "NJIT Highlanders",
-    "Norfolk State Spartans",
-    "North Alabama Lions",
-    "North Carolina A&T Aggies",
-    "North Carolina Central Eagles",
-    "North Carolina State Wolfpack",
-    "North Carolina Tar Heels",
-    "North Dakota Fighting Hawks",
-    "North Dakota State Bison",
-    "North Florida Ospreys",
-    "North Texas Mean Green",
-    "Northeastern Huskies",
-    "Northern Arizona Lumberjacks",
-    "Northern Colorado Bears",
-    "Northern Illinois Huskies",
-    "Northern Iowa Panthers",
-    "Northern Kentucky Norse",
-    "Northwestern State Demons",
-    "Northwestern Wildcats",
-    "Notre Dame Fighting Irish",
-    "Oakland Golden Grizzlies",
-    "Ohio Bobcats",
-    "Ohio State Buckeyes",
-    "Oklahoma Sooners",
-    "Oklahoma State Cowboys",
-    "Old Dominion Monarchs",
-    "Ole Miss Rebels",
-    "Oral Roberts Golden Eagles",
-    "Oregon Ducks",
-    "Oregon State Beavers",
-    "Pacific Tigers",
-    "Penn Quakers",
-    "Penn State Nittany Lions",
-    "Pepperdine Waves",
-    "Pittsburgh Panthers",
-    "Portland Pilots",
-    "Portland State Vikings",
-    "Prairie View A&M Panthers",
-    "Presbyterian Blue Hose",
-    "Purdue Fort Wayne Mastodons",
-    "Princeton Tigers",
-    "Providence Friars",
-    "Purdue Boilermakers",
-    "Queens Royals",
-    "Quinnipiac Bobcats",
-    "Radford Highlanders",
-    "Rhode Island Rams",
-    "Rice Owls",
-    "Richmond Spiders",
-    "Rider Broncs",
-    "Robert Morris Colonials",
-    "Rutgers Scarlet Knights",
-    "Sacramento State Hornets",
-    "Sacred Heart Pioneers",
-    "Saint Francis Red Flash",
-    "Saint Joseph's Hawks",
-    "Saint Louis Billikens",
-    "Saint Mary's Gaels",
-    "Saint Peter's Peacocks",
-    "Sam Houston Bearkats",
-    "Samford Bulldogs",
-    "San Diego State Aztecs",
-    "San Diego Toreros",
-    "San Francisco Dons",
-    "San Jose State Spartans",
-    "Santa Clara Broncos",
-    "Seattle Redhawks",
-    "Seton Hall Pirates",
-    "Siena Saints",
-    "South Alabama Jaguars",
-    "South Carolina Gamecocks",
-    "South Carolina State Bulldogs",
-    "South Dakota Coyotes",
-    "South Dakota State Jackrabbits",
-    "South Florida Bulls",
-    "Southeast Missouri State Redhawks",
-    "Southeastern Louisiana Lions",
-    "Southern Illinois Salukis",
-    "Southern Indiana Screaming Eagles",
-    "SIU Edwardsville Cougars",
-    "Southern Miss Golden Eagles",
-    "Southern Utah Thunderbirds",
-    "Southern Jaguars",
-    "St. Bonaventure Bonnies",
-    "St. John's Red Storm",
-    "St. Thomas Tommies",
-    "Stanford Cardinal",
-    "Stephen F. Austin Lumberjacks",
-    "Stetson Hatters",
-    "Stonehill Skyhawks",
-    "Stony Brook Seawolves",
-    "Syracuse Orange",
-    "Tarleton State Texans",
-    "TCU Horned Frogs",
-    "Temple Owls",
-    "Tennessee Martin Skyhawks",
-    "Tennessee State Tigers",
-    "Tennessee Tech Golden Eagles",
-    "Tennessee Volunteers",
-    "Texas A&M Aggies",
-    "Texas A&M-Commerce Lions",
-    "Texas A&M-Corpus Christi Islanders",
-    "Texas Longhorns",
-    "Texas Southern Tigers",
-    "Texas State Bobcats",
-    "Texas Tech Red Raiders",
-    "The Citadel Bulldogs",
-    "Toledo Rockets",
-    "Towson Tigers",
-    "Troy Trojans",
-    "Tulane Green Wave",
-    "Tulsa Golden Hurricane",
-    "UAB Blazers",
-    "UC Davis Aggies",
-    "UC Irvine Anteaters",
-    "UC Riverside Highlanders",
-    "UC San Diego Tritons",
-    "UC Santa Barbara Gauchos",
-    "UCF Knights",
-    "UCLA Bruins",
-    "UIC Flames",
-    "UConn Huskies",
-    "UMass Lowell River Hawks",
-    "UMBC Retrievers",
-    "UNC Asheville Bulldogs",
-    "UNC Greensboro Spartans",
-    "UNC Wilmington Seahawks",
-    "UNLV Rebels",
-    "USC Trojans",
-    "USC Upstate Spartans",
-    "UT Arlington Mavericks",
-    "UT Rio Grande Valley Vaqueros",
-    "UTEP Miners",
-    "UTSA Roadrunners",
-    "Utah State Aggies",
-    "Utah Tech Trailblazers",
-    "Utah Utes",
-    "Utah Valley Wolverines",
-    "Valparaiso Beacons",
-    "Vanderbilt Commodores",
-    "VCU Rams",
-    "Vermont Catamounts",
-    "Villanova Wildcats",
-    "Virginia Cavaliers",
-    "Virginia Military Institute Keydets",
-    "Virginia Tech Hokies",
-    "Wagner Seahawks",
-    "Wake Forest Demon Deacons",
-    "Washington Huskies",
-    "Washington State Cougars",
-    "Weber State Wildcats",
-    "West Virginia Mountaineers",
-    "Western Carolina Catamounts",
-    "Western Illinois Leathernecks",
-    "Western Kentucky Hilltoppers",
-    "Western Michigan Broncos",
-    "Wichita State Shockers",
-    "William & Mary Tribe",
-    "Winthrop Eagles",
-    "Wisconsin Badgers",
-    "Wofford Terriers",
-    "Wright State Raiders",
-    "Wyoming Cowboys",
-    "Xavier Musketeers",
-    "Yale Bulldogs",
-    "Youngstown State Penguins",
-]
+# Feed spellings that normalization alone cannot recover.
+TEAM_ALIASES: Dict[str, Dict[str, str]] = {
+    "soccer_epl": {"Spurs": "Tottenham Hotspur", "Wolves": "Wolverhampton Wanderers", "Brighton": "Brighton & Hove Albion"},
+    "soccer_ligue1": {"PSG": "Paris Saint-Germain"},
+    "soccer_champions_league": {"PSG": "Paris Saint-Germain", "Red Star Belgrade": "Crvena Zvezda"},
+    "soccer_bundesliga": {"Cologne": "1. FC Köln", "Gladbach": "Borussia Mönchengladbach"},
+    "soccer_serie_a": {"Inter": "Inter Milan", "Roma": "AS Roma", "Milan": "AC Milan"},
+}
 
-SPORT_TEAM_MAP: Dict[str, List[str]] = {
-    "basketball_nba": NBA_TEAMS,
-    "football_nfl": NFL_TEAMS,
-    "hockey_nhl": NHL_TEAMS,
-    "football_cfb_fbs": FBS_TEAMS,
-    "soccer_epl": SOCCER_EPL_TEAMS,
-    "soccer_laliga": SOCCER_LALIGA_TEAMS,
-    "soccer_bundesliga": SOCCER_BUNDESLIGA_TEAMS,
-    "soccer_serie_a": SOCCER_SERIE_A_TEAMS,
-    "soccer_ligue1": SOCCER_LIGUE1_TEAMS,
-    "soccer_champions_league": SOCCER_CHAMPIONS_LEAGUE_TEAMS,
-    "basketball_cbb_division1": CBB_DIVISION_I_TEAMS,
+_TOKEN_EXPANSIONS: Dict[str, str] = {
+    "la": "los angeles",
+    "ny": "new york",
+    "man": "manchester",
+    "utd": "united",
+    "saint": "st",
 }
+_DROPPED_TOKENS = {"fc", "afc", "cf"}
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
 
 
 def teams_for_sport(sport: str) -> List[str]:
-    return SPORT_TEAM_MAP.get(sport, [])
+    return list(_team_map().get(sport, []))
 
 
 def supported_sports() -> List[str]:
-    return sorted(SPORT_TEAM_MAP.keys())
+    return sorted(_team_map().keys())
+
+
+def normalize_team_name(name: str) -> str:
+    """Fold accents, case, punctuation and common abbreviations into one key."""
+    folded = unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode("ascii").lower()
+    folded = folded.replace("&", " and ").replace("'", "").replace(".", " ")
+    tokens = []
+    for token in _NON_ALNUM.sub(" ", folded).split():
+        if token in _DROPPED_TOKENS or token.isdigit():
+            continue
+        tokens.append(_TOKEN_EXPANSIONS.get(token, token))
+    return " ".join(tokens)
+
+
+def _trigrams(text: str) -> set:
+    padded = f"  {text} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+class TeamIndex:
+    """Interned integer IDs for one sport's teams plus a name-resolution index.
+
+    IDs are positions in the registry list, so they are stable for a given
+    team universe. ``resolve`` is a dict lookup on the normalized name, its
+    unambiguous nickname/city forms and ``TEAM_ALIASES``; the optional fuzzy
+    fallback scores candidates through a precomputed trigram inverted index.
+    """
+
+    def __init__(self, sport: str, teams: Iterable[str], aliases: Dict[str, str] | None = None):
+        self.sport = sport
+        self.names: Tuple[str, ...] = tuple(sys.intern(team) for team in teams)
+        self._exact: Dict[str, int] = {name: idx for idx, name in enumerate(self.names)}
+        self._alias: Dict[str, int] = {}
+        self._trigram_index: Dict[str, List[int]] | None = None
+        self._alias_targets: List[int] = []
+        self._alias_sizes: List[int] = []
+
+        normalized = [normalize_team_name(name) for name in self.names]
+        for idx, key in enumerate(normalized):
+            self._alias.setdefault(key, idx)
+
+        # Nicknames ("clippers") and city forms ("golden state") only when unique.
+        partials: Dict[str, List[int]] = {}
+        for idx, key in enumerate(normalized):
+            tokens = key.split()
+            if len(tokens) < 2:
+                continue
+            for part in (tokens[-1], " ".join(tokens[:-1])):
+                partials.setdefault(part, []).append(idx)
+        for part, ids in partials.items():
+            if len(ids) == 1:
+                self._alias.setdefault(part, ids[0])
+
+        for alias, target in (aliases or {}).items():
+            if target in self._exact:
+                self._alias[normalize_team_name(alias)] = self._exact[target]
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def name_of(self, team_id: int) -> str:
+        return self.names[team_id]
+
+    def resolve(self, name: str, fuzzy: bool = False, min_score: float = 0.6) -> int | None:
+        """Return the team ID for a feed name, or ``None`` when nothing matches."""
+        team_id = self._exact.get(name)
+        if team_id is not None:
+            return team_id
+        key = normalize_team_name(name)
+        team_id = self._alias.get(key)
+        if team_id is not None or not fuzzy:
+            return team_id
+        return self._fuzzy(key, min_score)
+
+    def _fuzzy(self, key: str, min_score: float) -> int | None:
+        if self._trigram_index is None:
+            self._build_trigram_index()
+        grams = _trigrams(key)
+        shared: Counter = Counter()
+        for gram in grams:
+            for alias_idx in self._trigram_index.get(gram, ()):
+                shared[alias_idx] += 1
+        best_id, best_score = None, 0.0
+        for alias_idx, overlap in shared.items():
+            # Dice coefficient between the query and the alias trigram sets.
+            score = 2.0 * overlap / (len(grams) + self._alias_sizes[alias_idx])
+            if score > best_score:
+                best_id, best_score = self._alias_targets[alias_idx], score
+        return best_id if best_score >= min_score else None
+
+    def _build_trigram_index(self) -> None:
+        index: Dict[str, List[int]] = {}
+        for alias_idx, (alias, team_id) in enumerate(self._alias.items()):
+            grams = _trigrams(alias)
+            self._alias_targets.append(team_id)
+            self._alias_sizes.append(len(grams))
+            for gram in grams:
+                index.setdefault(gram, []).append(alias_idx)
+        self._trigram_index = index
+
+
+_TEAM_INDEXES: Dict[str, TeamIndex] = {}
+
+
+def team_index(sport: str) -> TeamIndex:
+    index = _TEAM_INDEXES.get(sport)
+    if index is None:
+        index = TeamIndex(sport, _team_map().get(sport, []), TEAM_ALIASES.get(sport))
+        _TEAM_INDEXES[sport] = index
+    return index
+
+
+def team_id(sport: str, name: str, fuzzy: bool = False) -> int | None:
+    return team_index(sport).resolve(name, fuzzy=fuzzy)
+
+
+def team_name(sport: str, team_id: int) -> str:
+    return team_index(sport).name_of(team_id)
 
 
 __all__ = [
     "teams_for_sport",
     "supported_sports",
+    "normalize_team_name",
+    "team_id",
+    "team_index",
+    "team_name",
+    "TeamIndex",
+    "TEAM_ALIASES",
     "NBA_TEAMS",
     "NFL_TEAMS",
     "NHL_TEAMS",
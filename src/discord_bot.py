@@ -1,51 +1,59 @@
 from __future__ import annotations
 
 import os
-from dataclasses import dataclass
 from typing import List
 
 import discord
 from discord import app_commands
 
-from .agent import resolve_analyzer
-from .data.odds_scraper import OddsScraper
+from .alerts import AlertDispatcher, SubscriptionStore
+from .board import EdgeBoard, format_age
 from .data.team_registry import supported_sports
-from .edge.detector import EdgeResult
-
-
-@dataclass
-class EdgeSummary:
-    sport: str
-    game_id: str
-    matchup: str
-    edge: EdgeResult
-
-    def as_line(self) -> str:
-        ev_pct = self.edge.expected_value * 100
-        kelly_pct = self.edge.kelly_fraction * 100
-        return (
-            f"{self.matchup} → {self.edge.recommendation} {self.edge.line:.1f} "
-            f"(EV {ev_pct:.1f}%, Kelly {kelly_pct:.1f}%)"
-        )
+from .metrics import serve_metrics
+from .scanner import EdgeSummary, ScanExecutor, ScanTimeout, top_edges
+
+
+# Scans run in worker processes so the event loop keeps serving heartbeats and
+# other commands. Results persist across restarts when RESULT_CACHE_PATH is set;
+# each worker revalidates odds at most every ODDS_TTL_SECONDS and skips
+# re-pricing a sport whose odds have not moved.
+SCAN_EXECUTOR = ScanExecutor(
+    max_workers=int(os.environ.get("SCAN_WORKERS", "0")) or None,
+    timeout=float(os.environ.get("SCAN_TIMEOUT", "30")),
+    result_cache_path=os.environ.get("RESULT_CACHE_PATH") or None,
+    odds_ttl=float(os.environ.get("ODDS_TTL_SECONDS", "60")),
+)
+TIMEOUT_MESSAGE = "The scan took too long and was cancelled. Please try again in a moment."
+
+# Lowest EV any command shows; stricter tiers filter the cached board further.
+BOARD_MIN_EV = 0.03
+
+
+async def _scan_board_sport(sport: str) -> List[EdgeSummary]:
+    return await SCAN_EXECUTOR.edges_for_sports([sport], min_ev=BOARD_MIN_EV)
+
+
+# Commands are served from this board; a background task keeps it fresh.
+EDGE_BOARD = EdgeBoard(
+    _scan_board_sport,
+    supported_sports(),
+    refresh_interval=float(os.environ.get("BOARD_REFRESH_SECONDS", "120")),
+)
 
 
-def _fetch_edges_for_sport(sport: str, min_ev: float, limit: int | None = None) -> List[EdgeSummary]:
-    analyzer = resolve_analyzer(sport)
-    scraper = OddsScraper()
-    games = scraper.fetch_odds_api(sport=sport, max_games=limit)
+async def _send_to_channel(channel_id: int, message: str) -> None:
+    channel = bot.get_channel(channel_id) or await bot.fetch_channel(channel_id)
+    await channel.send(message)
 
-    results: List[EdgeSummary] = []
-    for game in games:
-        payload = {**game, "injuries": []}
-        # Soccer analyzer needs the sport code for league-level context.
-        if sport.startswith("soccer_"):
-            payload["sport"] = sport
-        edge = analyzer.analyze_game(**payload)
-        if edge and edge.expected_value >= min_ev:
-            matchup = f"{game['away_team']} @ {game['home_team']}"
-            results.append(EdgeSummary(sport=sport, game_id=game["game_id"], matchup=matchup, edge=edge))
 
-    return sorted(results, key=lambda e: e.edge.expected_value, reverse=True)
+# Board refreshes are diffed and new/changed edges pushed to subscribed channels.
+SUBSCRIPTIONS = SubscriptionStore(os.environ.get("SUBSCRIPTIONS_PATH") or None)
+ALERTS = AlertDispatcher(SUBSCRIPTIONS, _send_to_channel)
+EDGE_BOARD.add_listener(ALERTS.on_board_update)
+
+# Prometheus scrape endpoint (/metrics) for per-stage latencies; off unless set.
+METRICS_PORT = int(os.environ.get("METRICS_PORT", "0")) or None
+METRICS_HOST = os.environ.get("METRICS_HOST") or "127.0.0.1"
 
 
 class BettingBot(discord.Client):
@@ -57,8 +65,12 @@ class BettingBot(discord.Client):
         self.tree = app_commands.CommandTree(self)
         self.guild_id = guild_id
         self.premium_role = premium_role or "premium"
+        self.metrics_server = None
 
     async def setup_hook(self):
+        if METRICS_PORT:
+            self.metrics_server = serve_metrics(METRICS_PORT, host=METRICS_HOST)
+        EDGE_BOARD.start()
         if self.guild_id:
             guild = discord.Object(self.guild_id)
             self.tree.copy_global_to(guild=guild)
@@ -74,6 +86,13 @@ class BettingBot(discord.Client):
     async def on_ready(self):
         print(f"Bot connected as {self.user} (premium role: {self.premium_role})")
 
+    async def close(self):
+        await EDGE_BOARD.stop()
+        SCAN_EXECUTOR.shutdown()
+        if self.metrics_server is not None:
+            self.metrics_server.shutdown()
+        await super().close()
+
 
 # Slash commands
 bot = BettingBot(
@@ -85,17 +104,21 @@ bot = BettingBot(
 @bot.tree.command(name="scan", description="Free tier: top 5 edges across all sports")
 async def scan_all(interaction: discord.Interaction):
     await interaction.response.defer(thinking=True)
-    edges: List[EdgeSummary] = []
-    for sport in supported_sports():
-        edges.extend(_fetch_edges_for_sport(sport, min_ev=0.03, limit=None))
+    try:
+        snapshots = await EDGE_BOARD.get_all()
+    except ScanTimeout:
+        await interaction.followup.send(TIMEOUT_MESSAGE)
+        return
 
-    top_edges = edges[:5]
-    if not top_edges:
+    # Each snapshot is sorted best first, so the global top five needs no full merge.
+    best: List[EdgeSummary] = top_edges((snap.edges for snap in snapshots), k=5)
+    if not best:
         await interaction.followup.send("No edges found right now. Try again soon!")
         return
 
-    lines = [f"**Top {len(top_edges)} edges (free tier):**"]
-    for idx, edge in enumerate(top_edges, start=1):
+    oldest = max(EDGE_BOARD.age(snap.sport) or 0.0 for snap in snapshots)
+    lines = [f"**Top {len(best)} edges (free tier, updated {format_age(oldest)}):**"]
+    for idx, edge in enumerate(best, start=1):
         lines.append(f"{idx}. [{edge.sport}] {edge.as_line()}")
 
     await interaction.followup.send("\n".join(lines))
@@ -118,19 +141,62 @@ async def scan_sport(interaction: discord.Interaction, sport: str):
         return
 
     await interaction.response.defer(thinking=True)
-    edges = _fetch_edges_for_sport(sport, min_ev=0.04, limit=None)
+    try:
+        snapshot = await EDGE_BOARD.get(sport)
+    except ScanTimeout:
+        await interaction.followup.send(TIMEOUT_MESSAGE)
+        return
+
+    edges = [edge for edge in snapshot.edges if edge.edge.expected_value >= 0.04]
     if not edges:
         await interaction.followup.send(f"No qualifying edges (EV ≥ 4%) for {sport} right now.")
         return
 
-    lines: List[str] = [f"**{sport} edges (premium, EV ≥ 4%):**"]
+    age = format_age(EDGE_BOARD.age(sport) or 0.0)
+    lines: List[str] = [f"**{sport} edges (premium, EV ≥ 4%, updated {age}):**"]
     for idx, edge in enumerate(edges, start=1):
-        ev_pct = edge.edge.expected_value * 100
         lines.append(f"{idx}. {edge.as_line()} — true p={edge.edge.true_prob:.3f}, market p={edge.edge.market_prob:.3f}")
 
     await interaction.followup.send("\n".join(lines))
 
 
+@bot.tree.command(name="subscribe", description="Premium: push new edges for a sport to this channel")
+@app_commands.describe(sport="Sport code (e.g., basketball_nba)", min_ev="Minimum EV as a fraction (default 0.04)")
+async def subscribe(interaction: discord.Interaction, sport: str, min_ev: float = 0.04):
+    if sport not in supported_sports():
+        await interaction.response.send_message(
+            f"Unknown sport '{sport}'. Supported: {', '.join(supported_sports())}", ephemeral=True
+        )
+        return
+
+    if not bot.user_is_premium(interaction):
+        await interaction.response.send_message("Premium required for edge alerts.", ephemeral=True)
+        return
+
+    sub = SUBSCRIPTIONS.subscribe(interaction.channel_id, sport, max(min_ev, BOARD_MIN_EV))
+    await interaction.response.send_message(
+        f"Subscribed this channel to {sport} edges with EV ≥ {sub.min_ev * 100:.1f}%. "
+        "Only new or materially changed edges are posted."
+    )
+
+
+@bot.tree.command(name="unsubscribe", description="Stop edge alerts in this channel")
+@app_commands.describe(sport="Sport code to stop (omit to stop all)")
+async def unsubscribe(interaction: discord.Interaction, sport: str | None = None):
+    removed = SUBSCRIPTIONS.unsubscribe(interaction.channel_id, sport)
+    await interaction.response.send_message(f"Removed {removed} subscription(s).", ephemeral=True)
+
+
+@bot.tree.command(name="subscriptions", description="List edge alerts for this channel")
+async def subscriptions(interaction: discord.Interaction):
+    subs = SUBSCRIPTIONS.for_channel(interaction.channel_id)
+    if not subs:
+        await interaction.response.send_message("No alerts set up for this channel.", ephemeral=True)
+        return
+    lines = [f"- {sub.sport} (EV ≥ {sub.min_ev * 100:.1f}%)" for sub in subs]
+    await interaction.response.send_message("\n".join(lines), ephemeral=True)
+
+
 def main():
     token = os.environ.get("DISCORD_TOKEN")
     if not token:
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List
+from typing import List, Sequence
 
 try:
+    from ..metrics import METRICS
     from ..models.ot_engine import OTEngine, OTResult
     from ..models.distribution import Distribution
 except ImportError:  # Allows top-level imports when src/ is on sys.path
+    from metrics import METRICS
     from models.ot_engine import OTEngine, OTResult
     from models.distribution import Distribution
 from .ev_calculator import ExpectedValueResult, compute_expected_value
@@ -32,12 +34,98 @@ class EdgeDetector:
         self.engine = OTEngine()
 
     def detect(
-        self, true_dist: Distribution, market_dist: Distribution, odds: int, bet_on_over: bool = True
+        self,
+        true_dist: Distribution,
+        market_dist: Distribution,
+        odds: int,
+        bet_on_over: bool = True,
+        true_prob: float | None = None,
+        push_prob: float = 0.0,
     ) -> EdgeResult | None:
-        ot_result: OTResult = self.engine.distance_between_distributions(true_dist, market_dist)
-        true_prob = self._probability_true_beats_line(true_dist, market_dist.mean, bet_on_over)
-        ev_result: ExpectedValueResult = compute_expected_value(true_prob=true_prob, odds=odds)
-        kelly = min(self.kelly_cap, kelly_fraction(win_prob=true_prob, odds=odds, fraction=0.5))
+        """Return an edge when OT distance and EV clear the thresholds.
+
+        ``true_prob``/``push_prob`` let exact (e.g. discrete) models supply the
+        win and push probabilities instead of the normal approximation.
+        """
+        with METRICS.timer("ot"):
+            ot_result: OTResult = self.engine.distance_between_distributions(true_dist, market_dist)
+        with METRICS.timer("ev_kelly"):
+            return self._evaluate(ot_result, true_dist, market_dist, odds, bet_on_over, true_prob, push_prob)
+
+    def detect_many(
+        self,
+        true_dists: Sequence[Distribution],
+        market_dists: Sequence[Distribution],
+        odds: Sequence[int],
+        bet_on_over: bool = True,
+        true_probs: Sequence[float | None] | None = None,
+        push_probs: Sequence[float] | None = None,
+    ) -> List[EdgeResult | None]:
+        """Vectorized ``detect`` over aligned sequences of games."""
+        count = len(true_dists)
+        true_probs = true_probs if true_probs is not None else [None] * count
+        push_probs = push_probs if push_probs is not None else [0.0] * count
+        with METRICS.timer("ot"):
+            ot_results = self.engine.distances_between_distributions(list(zip(true_dists, market_dists)))
+        with METRICS.timer("ev_kelly"):
+            return [
+                self._evaluate(ot_result, true_dist, market_dist, game_odds, bet_on_over, prob, push)
+                for ot_result, true_dist, market_dist, game_odds, prob, push in zip(
+                    ot_results, true_dists, market_dists, odds, true_probs, push_probs
+                )
+            ]
+
+    def detect_outcome(
+        self,
+        recommendation: str,
+        line: float,
+        odds: int,
+        true_prob: float,
+        push_prob: float = 0.0,
+    ) -> EdgeResult | None:
+        """EV-only check for markets without a market distribution (spreads, moneylines)."""
+        with METRICS.timer("ev_kelly"):
+            return self._evaluate_outcome(recommendation, line, odds, true_prob, push_prob)
+
+    def _evaluate_outcome(
+        self, recommendation: str, line: float, odds: int, true_prob: float, push_prob: float
+    ) -> EdgeResult | None:
+        ev_result = compute_expected_value(true_prob=true_prob, odds=odds, push_prob=push_prob)
+        if ev_result.expected_value < self.min_ev:
+            return None
+        return EdgeResult(
+            recommendation=recommendation,
+            line=line,
+            expected_value=ev_result.expected_value,
+            kelly_fraction=self._kelly(true_prob, push_prob, odds),
+            true_prob=true_prob,
+            market_prob=ev_result.market_prob,
+            wasserstein_distance=0.0,
+        )
+
+    def _kelly(self, true_prob: float, push_prob: float, odds: int) -> float:
+        # A push refunds the stake, so growth depends only on the graded outcomes:
+        # the optimum (b*p - q) / (b*(p + q)) is Kelly on P(win | action), unscaled.
+        action = 1 - push_prob
+        kelly = 0.0
+        if action > 0:
+            kelly = kelly_fraction(win_prob=min(1.0, true_prob / action), odds=odds, fraction=0.5)
+        return min(self.kelly_cap, kelly)
+
+    def _evaluate(
+        self,
+        ot_result: OTResult,
+        true_dist: Distribution,
+        market_dist: Distribution,
+        odds: int,
+        bet_on_over: bool,
+        true_prob: float | None = None,
+        push_prob: float = 0.0,
+    ) -> EdgeResult | None:
+        if true_prob is None:
+            true_prob = self._probability_true_beats_line(true_dist, market_dist.mean, bet_on_over)
+        ev_result: ExpectedValueResult = compute_expected_value(true_prob=true_prob, odds=odds, push_prob=push_prob)
+        kelly = self._kelly(true_prob, push_prob, odds)
 
         if ot_result.distance < self.ot_threshold or ev_result.expected_value < self.min_ev:
             return None
@@ -16,14 +16,14 @@ class ExpectedValueResult:
     market_prob: float
 
 
-def compute_expected_value(true_prob: float, odds: int) -> ExpectedValueResult:
+def compute_expected_value(true_prob: float, odds: int, push_prob: float = 0.0) -> ExpectedValueResult:
     market_prob = american_to_probability(odds)
     payout = american_to_decimal(odds) - 1
     # Expected return per unit stake: win probability multiplied by payout
     # minus the probability of losing the stake entirely. Using the market
     # implied probability here would understate value for true-positive edges
-    # because it bakes in the bookmaker's vig.
-    ev = true_prob * payout - (1 - true_prob)
+    # because it bakes in the bookmaker's vig. A push returns the stake.
+    ev = true_prob * payout - (1 - true_prob - push_prob)
     return ExpectedValueResult(expected_value=ev, true_prob=true_prob, market_prob=market_prob)
 
 
@@ -0,0 +1,85 @@
+"""Price every market on a game from one set of joint score samples.
+
+Games are the usual odds dicts; markets beyond the total are priced when their
+optional fields are present:
+
+* spreads: ``spread_line`` (home handicap, e.g. ``-3.5``), ``home_spread_odds``, ``away_spread_odds``
+* moneylines: ``home_ml_odds``, ``away_ml_odds`` and, for three-way markets, ``draw_odds``
+* team totals: ``home_total_line``/``home_over_odds``/``home_under_odds`` and the ``away_`` equivalents
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import List
+
+try:
+    from ..models.distribution import Distribution
+    from ..models.joint_score import JointScores, OutcomeProbabilities
+except ImportError:  # Allows top-level imports when src/ is on sys.path
+    from models.distribution import Distribution
+    from models.joint_score import JointScores, OutcomeProbabilities
+from .detector import EdgeDetector, EdgeResult
+
+
+@dataclass
+class MarketEdge:
+    market: str
+    selection: str
+    edge: EdgeResult
+
+
+def price_markets(scores: JointScores, game: dict, detector: EdgeDetector) -> List[MarketEdge]:
+    """Return every over/under, spread, moneyline and team-total edge on ``game``."""
+    edges: List[MarketEdge] = []
+
+    def add(market: str, selection: str, line: float, odds, outcome: OutcomeProbabilities) -> None:
+        if odds is None:
+            return
+        edge = detector.detect_outcome(selection.upper(), line, odds, outcome.win, outcome.push)
+        if edge is not None:
+            edges.append(MarketEdge(market=market, selection=selection, edge=edge))
+
+    if game.get("total_line") is not None:
+        line = game["total_line"]
+        true_dist = scores.total_distribution()
+        over = scores.total(line)
+        for selection, odds, outcome, bet_on_over in (
+            ("over", game.get("over_odds"), over, True),
+            ("under", game.get("under_odds"), over.flipped(), False),
+        ):
+            if odds is None:
+                continue
+            edge = detector.detect(
+                true_dist,
+                Distribution.from_market_total(line=line, odds=odds),
+                odds,
+                bet_on_over=bet_on_over,
+                true_prob=outcome.win,
+                push_prob=outcome.push,
+            )
+            if edge is not None:
+                edges.append(MarketEdge(market="total", selection=selection, edge=edge))
+
+    if game.get("spread_line") is not None:
+        line = game["spread_line"]
+        add("spread", "home", line, game.get("home_spread_odds"), scores.spread("home", line))
+        add("spread", "away", -line, game.get("away_spread_odds"), scores.spread("away", -line))
+
+    three_way = game.get("draw_odds") is not None
+    add("moneyline", "home", 0.0, game.get("home_ml_odds"), scores.moneyline("home", three_way))
+    add("moneyline", "away", 0.0, game.get("away_ml_odds"), scores.moneyline("away", three_way))
+    if three_way:
+        draw = scores.draw()
+        add("moneyline", "draw", 0.0, game["draw_odds"], OutcomeProbabilities(win=draw, lose=1 - draw))
+
+    for side in ("home", "away"):
+        line = game.get(f"{side}_total_line")
+        if line is None:
+            continue
+        outcome = scores.team_total(side, line)
+        add(f"{side}_total", "over", line, game.get(f"{side}_over_odds"), outcome)
+        add(f"{side}_total", "under", line, game.get(f"{side}_under_odds"), outcome.flipped())
+    return edges
+
+
+__all__: List[str] = ["MarketEdge", "price_markets"]
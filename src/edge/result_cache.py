@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, Iterable, Iterator, List
+import hashlib
+import json
+import os
+import threading
+import time
+
+try:
+    from ..metrics import METRICS
+    from ..models.distribution import Distribution
+except ImportError:  # Allows imports when edge is treated as a top-level package
+    from metrics import METRICS
+    from models.distribution import Distribution
+from .detector import EdgeDetector, EdgeResult
+
+
+# Bump whenever a modeling change should invalidate previously cached results.
+MODEL_VERSION = "2"
+
+
+@dataclass
+class CachedAnalysis:
+    distribution: Distribution
+    edge: EdgeResult | None
+
+
+def analysis_inputs(
+    sport: str,
+    home_stats: dict,
+    away_stats: dict,
+    injuries: Iterable[dict],
+    total_line: float,
+    over_odds: int,
+    under_odds: int,
+    base_std: float,
+    simulator,
+    detector: EdgeDetector,
+    scoring: str = "normal",
+) -> dict:
+    """Everything that determines an ``analyze_game`` result, as plain JSON data."""
+    return {
+        "sport": sport,
+        "home_stats": home_stats,
+        "away_stats": away_stats,
+        "injuries": list(injuries),
+        "total_line": total_line,
+        "over_odds": over_odds,
+        "under_odds": under_odds,
+        "base_std": base_std,
+        "scoring": scoring,
+        "num_paths": simulator.config.num_paths,
+        "detector": [detector.ot_threshold, detector.min_ev, detector.kelly_cap],
+    }
+
+
+class ResultCache:
+    """SQLite-backed map from hashed analysis inputs to distributions and edges.
+
+    Keys are SHA-256 digests of the canonical JSON inputs plus ``model_version``
+    so any change to stats, injuries, line, odds or model settings misses. The
+    table is kept under ``max_entries`` by evicting the least recently used
+    rows.
+
+    Writes are buffered: new results and the ``last_used`` touches of hits
+    are written in one transaction, immediately for a lone ``put`` or once
+    when a ``batch()`` block ends. Eviction counts the rows inside that
+    transaction, so the bound holds when several processes share the file.
+    """
+
+    # Hits are touched in bulk; outside a batch, flush once this many are pending.
+    TOUCH_FLUSH = 1024
+
+    def __init__(self, path: str = ":memory:", max_entries: int = 100_000, model_version: str = MODEL_VERSION):
+        if path != ":memory:" and os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.path = path
+        self.max_entries = max_entries
+        self.model_version = model_version
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._pending: Dict[str, str] = {}  # key -> payload not yet written
+        self._touched: Dict[str, float] = {}  # key -> last_used not yet written
+        self._batch_depth = 0
+        import sqlite3  # Deferred so importing the pipeline does not load SQLite.
+
+        # Autocommit mode: write transactions are opened explicitly in ``_flush``.
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            " key TEXT PRIMARY KEY, payload TEXT NOT NULL, last_used REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS results_last_used ON results(last_used)")
+
+    def key_for(self, inputs: dict) -> str:
+        canonical = json.dumps(inputs, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha256(f"{self.model_version}:{canonical}".encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> CachedAnalysis | None:
+        with self._lock:
+            payload = self._pending.get(key)
+            if payload is None:
+                row = self._conn.execute("SELECT payload FROM results WHERE key = ?", (key,)).fetchone()
+                if row is None:
+                    self.misses += 1
+                    return None
+                payload = row[0]
+                self._touched[key] = time.time()
+                if not self._batch_depth and len(self._touched) >= self.TOUCH_FLUSH:
+                    self._flush()
+            self.hits += 1
+        payload = json.loads(payload)
+        edge = EdgeResult(**payload["edge"]) if payload["edge"] is not None else None
+        return CachedAnalysis(distribution=Distribution(**payload["distribution"]), edge=edge)
+
+    def put(self, key: str, analysis: CachedAnalysis) -> None:
+        payload = json.dumps(
+            {
+                "distribution": {"mean": analysis.distribution.mean, "std": analysis.distribution.std},
+                "edge": asdict(analysis.edge) if analysis.edge is not None else None,
+            }
+        )
+        with self._lock:
+            self._pending[key] = payload
+            self._touched.pop(key, None)
+            if not self._batch_depth:
+                self._flush()
+
+    @contextmanager
+    def batch(self) -> Iterator["ResultCache"]:
+        """Defer writes until the block ends, then commit them in one transaction."""
+        with self._lock:
+            self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+                if not self._batch_depth:
+                    self._flush()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush()
+
+    def get_or_compute(self, inputs: dict, compute: Callable[[], CachedAnalysis]) -> CachedAnalysis:
+        key = self.key_for(inputs)
+        cached = self.get(key)
+        if cached is not None:
+            METRICS.inc("result_cache_hits")
+            return cached
+        METRICS.inc("result_cache_misses")
+        analysis = compute()
+        self.put(key, analysis)
+        return analysis
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._flush()
+            return self._conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._pending.clear()
+            self._touched.clear()
+            self._conn.execute("DELETE FROM results")
+
+    def close(self) -> None:
+        with self._lock:
+            self._flush()
+            self._conn.close()
+
+    def _flush(self) -> None:
+        # Caller holds ``_lock``.
+        if not self._pending and not self._touched:
+            return
+        now = time.time()
+        conn = self._conn
+        conn.execute("BEGIN IMMEDIATE")  # take the write lock before counting rows
+        try:
+            conn.executemany(
+                "INSERT OR REPLACE INTO results (key, payload, last_used) VALUES (?, ?, ?)",
+                [(key, payload, now) for key, payload in self._pending.items()],
+            )
+            conn.executemany(
+                "UPDATE results SET last_used = ? WHERE key = ?",
+                [(used, key) for key, used in self._touched.items()],
+            )
+            self._evict()
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        self._pending.clear()
+        self._touched.clear()
+
+    def _evict(self) -> None:
+        count = self._conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+        if count <= self.max_entries:
+            return
+        # Evict a little extra so a full cache does not run this on every write.
+        excess = count - self.max_entries + max(1, self.max_entries // 20)
+        self._conn.execute(
+            "DELETE FROM results WHERE key IN (SELECT key FROM results ORDER BY last_used ASC LIMIT ?)",
+            (excess,),
+        )
+
+
+def cached_analysis(cache: ResultCache | None, inputs: dict, compute: Callable[[], CachedAnalysis]) -> CachedAnalysis:
+    if cache is None:
+        return compute()
+    return cache.get_or_compute(inputs, compute)
+
+
+__all__: List[str] = [
+    "CachedAnalysis",
+    "MODEL_VERSION",
+    "ResultCache",
+    "analysis_inputs",
+    "cached_analysis",
+]
@@ -0,0 +1,179 @@
+"""Struct-of-arrays container for a scan's edges.
+
+``EdgeTable`` keeps every ``EdgeResult`` field as a column (``array('d')``
+for the numbers, lists for the labels). Filters, sorts and top-k only compute
+row-index lists with C-level ``compress``/``sorted``/``heapq`` over one
+column and return views that share the columns; values are gathered per
+column when a caller reads or exports them. Post-processing tens of
+thousands of candidate lines therefore never builds per-edge objects.
+``to_arrow`` (needs the optional ``pyarrow``) wraps the numeric buffers of an
+unfiltered table without copying them.
+
+The table backs the bulk exports (``agent scan --format csv``). The Discord
+bot keeps ``EdgeSummary`` lists: a board holds tens of edges per sport, which
+its listeners and formatters consume row by row.
+"""
+from __future__ import annotations
+
+from array import array
+from itertools import compress
+from operator import itemgetter
+from typing import Dict, Iterable, Iterator, List, Sequence, TextIO
+import csv
+import heapq
+import json
+
+from .detector import EdgeResult
+
+
+LABEL_COLUMNS = ("sport", "game_id", "matchup", "market", "recommendation")
+VALUE_COLUMNS = ("line", "expected_value", "kelly_fraction", "true_prob", "market_prob", "wasserstein_distance")
+COLUMNS = LABEL_COLUMNS + VALUE_COLUMNS
+
+
+class EdgeTable:
+    """Edges from a scan held column-wise.
+
+    ``filter``, ``sort``, ``topk`` and ``groupby_sport`` return read-only views
+    over the same columns; ``take`` on a view composes the row indices.
+    """
+
+    def __init__(self, data: Dict[str, Sequence] | None = None, rows: Sequence[int] | None = None):
+        if data is None:
+            data = {name: [] for name in LABEL_COLUMNS}
+            data.update((name, array("d")) for name in VALUE_COLUMNS)
+        self._data = data
+        self._rows = rows  # None: every row of ``_data`` in order
+
+    @classmethod
+    def from_summaries(cls, summaries: Iterable) -> "EdgeTable":
+        """Build from objects with ``sport``, ``game_id``, ``matchup`` and ``edge`` (e.g. ``EdgeSummary``)."""
+        table = cls()
+        for summary in summaries:
+            table.append(summary.sport, summary.game_id, summary.matchup, summary.edge)
+        return table
+
+    @classmethod
+    def from_priced(cls, rows: Iterable) -> "EdgeTable":
+        """Build from ``PricedGame`` rows, skipping games without an edge."""
+        table = cls()
+        for row in rows:
+            if row.edge is not None:
+                table.append(row.sport, row.game_id, row.matchup, row.edge)
+        return table
+
+    def append(self, sport: str, game_id: str, matchup: str, edge: EdgeResult, market: str = "total") -> None:
+        if self._rows is not None:
+            raise ValueError("Cannot append to an EdgeTable view")
+        data = self._data
+        data["sport"].append(sport)
+        data["game_id"].append(game_id)
+        data["matchup"].append(matchup)
+        data["market"].append(market)
+        data["recommendation"].append(edge.recommendation)
+        data["line"].append(edge.line)
+        data["expected_value"].append(edge.expected_value)
+        data["kelly_fraction"].append(edge.kelly_fraction)
+        data["true_prob"].append(edge.true_prob)
+        data["market_prob"].append(edge.market_prob)
+        data["wasserstein_distance"].append(edge.wasserstein_distance)
+
+    def __len__(self) -> int:
+        return len(self._data["expected_value"]) if self._rows is None else len(self._rows)
+
+    def column(self, name: str) -> Sequence:
+        """Values of ``name`` for this table's rows (the stored column itself when unfiltered)."""
+        if name not in COLUMNS:
+            raise KeyError(f"Unknown column {name!r}")
+        values = self._data[name]
+        if self._rows is None:
+            return values
+        gathered = _gather(self._rows, values)
+        return array("d", gathered) if name in VALUE_COLUMNS else list(gathered)
+
+    def take(self, indices: Sequence[int]) -> "EdgeTable":
+        """View of the rows at ``indices`` (positions in this table), in that order."""
+        rows = list(indices) if self._rows is None else list(_gather(indices, self._rows))
+        return EdgeTable(self._data, rows)
+
+    def filter(
+        self, min_ev: float | None = None, sport: str | Iterable[str] | None = None, market: str | None = None
+    ) -> "EdgeTable":
+        positions: Sequence[int] = range(len(self))
+        if min_ev is not None:
+            positions = list(compress(positions, map(min_ev.__le__, self._values("expected_value", positions))))
+        if sport is not None:
+            sports = frozenset({sport} if isinstance(sport, str) else sport)
+            positions = list(compress(positions, map(sports.__contains__, self._values("sport", positions))))
+        if market is not None:
+            positions = list(compress(positions, map(market.__eq__, self._values("market", positions))))
+        return self.take(positions)
+
+    def argsort(self, by: str = "expected_value", descending: bool = True) -> List[int]:
+        """Row order for ``by``; stable, so ties keep scan order."""
+        return sorted(range(len(self)), key=self.column(by).__getitem__, reverse=descending)
+
+    def sort(self, by: str = "expected_value", descending: bool = True) -> "EdgeTable":
+        return self.take(self.argsort(by, descending))
+
+    def topk(self, k: int, by: str = "expected_value") -> "EdgeTable":
+        """Best ``k`` rows by ``by``, best first, without sorting the whole table."""
+        return self.take(heapq.nlargest(k, range(len(self)), key=self.column(by).__getitem__))
+
+    def groupby_sport(self) -> Dict[str, "EdgeTable"]:
+        groups: Dict[str, List[int]] = {}
+        for idx, sport in enumerate(self.column("sport")):
+            groups.setdefault(sport, []).append(idx)
+        return {sport: self.take(positions) for sport, positions in groups.items()}
+
+    def edge(self, idx: int) -> EdgeResult:
+        row = idx if self._rows is None else self._rows[idx]
+        return EdgeResult(**{name: self._data[name][row] for name in ("recommendation",) + VALUE_COLUMNS})
+
+    def rows(self) -> Iterator[tuple]:
+        return zip(*(self.column(name) for name in COLUMNS))
+
+    def write_jsonl(self, stream: TextIO) -> int:
+        for row in self.rows():
+            stream.write(json.dumps(dict(zip(COLUMNS, row)), separators=(",", ":")) + "\n")
+        return len(self)
+
+    def write_csv(self, stream: TextIO) -> int:
+        writer = csv.writer(stream)
+        writer.writerow(COLUMNS)
+        writer.writerows(self.rows())
+        return len(self)
+
+    def to_arrow(self):
+        """A ``pyarrow.Table`` of this table's rows.
+
+        Numeric columns of an unfiltered table are wrapped without copying;
+        the arrays stay exported while the Arrow table is alive, so appending
+        in the meantime raises ``BufferError``. Views gather their rows first.
+        """
+        try:
+            import pyarrow as pa
+        except ImportError as exc:
+            raise ImportError("EdgeTable.to_arrow requires pyarrow (pip install pyarrow)") from exc
+        columns = {name: pa.array(self.column(name), type=pa.string()) for name in LABEL_COLUMNS}
+        for name in VALUE_COLUMNS:
+            values = self.column(name)
+            columns[name] = pa.Array.from_buffers(pa.float64(), len(values), [None, pa.py_buffer(values)])
+        return pa.table(columns)
+
+    def _values(self, name: str, positions: Sequence[int]) -> Sequence:
+        if isinstance(positions, range):
+            return self.column(name)
+        return _gather(positions, self.column(name))
+
+
+def _gather(indices: Sequence[int], values: Sequence) -> Sequence:
+    """``values`` at ``indices`` via one C-level ``itemgetter`` call."""
+    if not indices:
+        return ()
+    if len(indices) == 1:
+        return (values[indices[0]],)
+    return itemgetter(*indices)(values)
+
+
+__all__: List[str] = ["COLUMNS", "EdgeTable"]
@@ -0,0 +1,225 @@
+"""Per-stage memory accounting and an adaptive chunk size for bounded scans.
+
+Code wraps each stage in ``MEMORY.stage("name")``. While the profiler is
+enabled, ``tracemalloc`` traces every Python allocation and each stage
+records its net change in traced memory (what it left alive) and its peak
+(the most it held at once), both relative to where the stage started.
+Nested stages are handled: a parent's peak includes its children's. While
+disabled (the default) ``stage`` returns a shared no-op context manager.
+Enable with ``MEMORY.enable()`` or ``SPORTSMODEL_MEMORY=1``; tracing makes
+the pricing hot path roughly 25-40x slower, so leave it off outside
+diagnostics.
+
+``ChunkThrottle`` sizes the chunks of a bounded-memory scan: when a traced
+chunk's peak is over the ceiling, or under half of it, the next chunk is
+resized in one step to the size expected to use 80% of the ceiling.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, List
+import os
+
+
+def _tracemalloc():
+    import tracemalloc  # Deferred: it loads pickle, and only enabled profiling traces.
+
+    return tracemalloc
+
+
+@dataclass
+class StageMemory:
+    calls: int = 0
+    net: int = 0  # bytes still allocated at stage exit, summed over calls
+    peak: int = 0  # largest in-stage peak above the stage's starting point
+
+
+class _Stage:
+    __slots__ = ("profiler", "name", "start", "peak", "net")
+
+    def __init__(self, profiler: "MemoryProfiler", name: str):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self) -> "_Stage":
+        tracemalloc = _tracemalloc()
+        current, peak = tracemalloc.get_traced_memory()
+        stack = self.profiler._stack
+        if stack:
+            # The reset below would hide the parent's peak so far; carry it over.
+            stack[-1].peak = max(stack[-1].peak, peak)
+        tracemalloc.reset_peak()
+        self.start = self.peak = current
+        stack.append(self)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        current, peak = _tracemalloc().get_traced_memory()
+        stack = self.profiler._stack
+        stack.pop()
+        self.peak = max(self.peak, peak)  # absolute traced bytes
+        self.net = current - self.start
+        if stack:
+            stack[-1].peak = max(stack[-1].peak, self.peak)
+        self.profiler._record(self.name, self.net, self.peak - self.start)
+
+
+class _NullStage:
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullStage":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        return None
+
+
+_NULL_STAGE = _NullStage()
+
+
+class MemoryProfiler:
+    """Traced-memory totals per stage for one thread of work.
+
+    ``tracemalloc`` counts are process-wide, so stages running concurrently
+    in other threads show up in each other's numbers.
+    """
+
+    def __init__(self, enabled: bool = False, frames: int = 1):
+        self.frames = frames
+        self.enabled = False
+        self.stages: Dict[str, StageMemory] = {}
+        self._stack: List[_Stage] = []
+        self._owns_tracing = False
+        if enabled:
+            self.enable()
+
+    def enable(self) -> None:
+        tracemalloc = _tracemalloc()
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+            self._owns_tracing = True
+        self.enabled = True
+
+    def disable(self) -> None:
+        self.enabled = False
+        if self._owns_tracing:
+            _tracemalloc().stop()
+            self._owns_tracing = False
+
+    def stage(self, name: str):
+        """Context manager recording ``name``'s net and peak traced memory.
+
+        The returned object exposes ``peak`` (absolute traced bytes) and
+        ``net`` after the block exits.
+        """
+        if not self.enabled:
+            return _NULL_STAGE
+        return _Stage(self, name)
+
+    def current(self) -> int:
+        """Bytes currently traced (0 while tracing is off)."""
+        tracemalloc = _tracemalloc()
+        return tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else 0
+
+    def reset(self) -> None:
+        self.stages = {}
+
+    def _record(self, name: str, net: int, peak: int) -> None:
+        stats = self.stages.get(name)
+        if stats is None:
+            stats = self.stages[name] = StageMemory()
+        stats.calls += 1
+        stats.net += net
+        stats.peak = max(stats.peak, peak)
+
+    def summary_lines(self) -> List[str]:
+        """Fixed-width table of stages, largest peak first."""
+        rows = sorted(self.stages.items(), key=lambda item: item[1].peak, reverse=True)
+        lines = [f"{'stage':<16} {'calls':>8} {'net KiB':>10} {'peak KiB':>10}"]
+        for name, stats in rows:
+            lines.append(f"{name:<16} {stats.calls:>8} {stats.net / 1024:>10.1f} {stats.peak / 1024:>10.1f}")
+        if _tracemalloc().is_tracing():
+            lines.append(f"{'traced now':<16} {'':>8} {self.current() / 1024:>10.1f}")
+        return lines
+
+    def top_allocations(self, limit: int = 10) -> List[str]:
+        """Source lines holding the most traced memory right now."""
+        tracemalloc = _tracemalloc()
+        if not tracemalloc.is_tracing():
+            return []
+        statistics = tracemalloc.take_snapshot().statistics("lineno")
+        return [str(stat) for stat in statistics[:limit]]
+
+
+class _Probe:
+    __slots__ = ("throttle",)
+
+    def __init__(self, throttle: "ChunkThrottle"):
+        self.throttle = throttle
+
+    def __enter__(self) -> "_Probe":
+        _tracemalloc().start(1)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        # Tracing started inside the block, so its peak is exactly what the block added.
+        tracemalloc = _tracemalloc()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        self.throttle.observe(peak)
+
+
+class ChunkThrottle:
+    """Adaptive chunk size that keeps each chunk's working set under ``memory_limit`` bytes.
+
+    Working sets grow linearly with chunk size, so one measurement is enough
+    to resize: over the limit, or under half of it, the next size aims at 80%
+    of the limit. ``probe()`` traces one chunk in every ``probe_every`` (and
+    the first chunk after each resize) rather than all of them.
+    """
+
+    def __init__(self, chunk_size: int, memory_limit: int | None = None, min_size: int = 16, probe_every: int = 64):
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
+        self.max_size = chunk_size
+        self.min_size = min(min_size, chunk_size)
+        self.memory_limit = memory_limit
+        self.probe_every = max(1, probe_every)
+        self.size = chunk_size
+        self.peak = 0  # largest working set measured so far
+        self.resizes = 0
+        self._since_probe = self.probe_every - 1  # measure the first chunk
+
+    def probe(self):
+        """Context manager around one chunk's work; traces it when a measurement is due.
+
+        A no-op while tracing is already on (e.g. ``MEMORY`` is enabled):
+        callers then pass the stage's working set to ``observe`` themselves.
+        """
+        if self.memory_limit is None or _tracemalloc().is_tracing():
+            return _NULL_STAGE
+        self._since_probe += 1
+        if self._since_probe < self.probe_every:
+            return _NULL_STAGE
+        self._since_probe = 0
+        return _Probe(self)
+
+    def observe(self, peak: int) -> int:
+        """Feed a finished chunk's peak bytes; returns the next chunk size."""
+        self.peak = max(self.peak, peak)
+        if self.memory_limit is None or peak <= 0:
+            return self.size
+        if peak > self.memory_limit or (peak < self.memory_limit // 2 and self.size < self.max_size):
+            target = int(self.size * 0.8 * self.memory_limit / peak)
+            size = max(self.min_size, min(self.max_size, target))
+            if size != self.size:
+                self.size = size
+                self.resizes += 1
+                self._since_probe = self.probe_every - 1  # check the new size straight away
+        return self.size
+
+
+MEMORY = MemoryProfiler(enabled=os.environ.get("SPORTSMODEL_MEMORY") == "1")
+
+
+__all__: List[str] = ["ChunkThrottle", "MEMORY", "MemoryProfiler", "StageMemory"]
@@ -0,0 +1,224 @@
+"""Per-stage latency histograms and counters for the pricing pipeline.
+
+Code wraps each stage in ``METRICS.timer("stage")`` and bumps counters with
+``METRICS.inc("name")``. While the registry is disabled (the default) a
+timer is a shared no-op context manager and ``inc`` returns after one
+attribute check, so instrumented code costs a few hundred nanoseconds per
+call. Enable it with ``METRICS.enable()`` or ``SPORTSMODEL_METRICS=1``.
+
+Results export as Prometheus text (``render_prometheus``, optionally served
+over HTTP by ``serve_metrics``) or as a summary table for the CLI.
+Batched calls such as ``EdgeDetector.detect_many`` record one observation
+per batch.
+"""
+from __future__ import annotations
+
+from bisect import bisect_left
+from typing import Dict, List, Sequence, Tuple
+import os
+import threading
+import time
+
+
+# Upper bounds in seconds; stages range from microseconds (EV math) to seconds (full scans).
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.00001, 0.00005, 0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0,
+)
+
+
+class Histogram:
+    """Cumulative-bucket latency histogram (Prometheus semantics)."""
+
+    __slots__ = ("buckets", "counts", "count", "sum")
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # last slot is +Inf
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def merge(self, other: "Histogram") -> None:
+        if other.buckets != self.buckets:
+            raise ValueError("Cannot merge histograms with different buckets")
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        self.count += other.count
+        self.sum += other.sum
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding quantile ``q`` (``inf`` past the last bucket)."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float("inf")
+
+
+class _Timer:
+    __slots__ = ("metrics", "stage", "started")
+
+    def __init__(self, metrics: "Metrics", stage: str):
+        self.metrics = metrics
+        self.stage = stage
+
+    def __enter__(self) -> "_Timer":
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.metrics.observe(self.stage, time.perf_counter() - self.started)
+
+
+class _NullTimer:
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullTimer":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        return None
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class Metrics:
+    """Thread-safe registry of stage histograms and counters."""
+
+    def __init__(self, enabled: bool = False, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.enabled = enabled
+        self.buckets = tuple(buckets)
+        self.histograms: Dict[str, Histogram] = {}
+        self.counters: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def enable(self) -> None:
+        self.enabled = True
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    def timer(self, stage: str):
+        """Context manager recording the wall time of its block under ``stage``."""
+        if not self.enabled:
+            return _NULL_TIMER
+        return _Timer(self, stage)
+
+    def observe(self, stage: str, seconds: float) -> None:
+        with self._lock:
+            histogram = self.histograms.get(stage)
+            if histogram is None:
+                histogram = self.histograms[stage] = Histogram(self.buckets)
+            histogram.observe(seconds)
+
+    def inc(self, name: str, amount: float = 1) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def reset(self) -> None:
+        with self._lock:
+            self.histograms = {}
+            self.counters = {}
+
+    def drain(self) -> Tuple[Dict[str, Histogram], Dict[str, float]]:
+        """Take everything recorded so far and reset (used to ship worker metrics home)."""
+        with self._lock:
+            drained = self.histograms, self.counters
+            self.histograms, self.counters = {}, {}
+        return drained
+
+    def merge(self, drained: Tuple[Dict[str, Histogram], Dict[str, float]]) -> None:
+        histograms, counters = drained
+        with self._lock:
+            for stage, histogram in histograms.items():
+                own = self.histograms.get(stage)
+                if own is None:
+                    own = self.histograms[stage] = Histogram(self.buckets)
+                own.merge(histogram)
+            for name, value in counters.items():
+                self.counters[name] = self.counters.get(name, 0) + value
+
+    def render_prometheus(self, prefix: str = "sportsmodel") -> str:
+        """Prometheus text exposition format (version 0.0.4)."""
+        with self._lock:
+            histograms = sorted(self.histograms.items())
+            counters = sorted(self.counters.items())
+        lines: List[str] = []
+        if histograms:
+            name = f"{prefix}_stage_seconds"
+            lines.append(f"# HELP {name} Wall time per pipeline stage.")
+            lines.append(f"# TYPE {name} histogram")
+            for stage, histogram in histograms:
+                cumulative = 0
+                for bound, count in zip(histogram.buckets + (float("inf"),), histogram.counts):
+                    cumulative += count
+                    le = "+Inf" if bound == float("inf") else repr(bound)
+                    lines.append(f'{name}_bucket{{stage="{stage}",le="{le}"}} {cumulative}')
+                lines.append(f'{name}_sum{{stage="{stage}"}} {histogram.sum!r}')
+                lines.append(f'{name}_count{{stage="{stage}"}} {histogram.count}')
+        for counter, value in counters:
+            name = f"{prefix}_{counter}_total"
+            lines.append(f"# TYPE {name} counter")
+            lines.append(f"{name} {value}")
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def summary_lines(self) -> List[str]:
+        """Fixed-width table of stage latencies (slowest total first) and counters."""
+        with self._lock:
+            histograms = sorted(self.histograms.items(), key=lambda item: item[1].sum, reverse=True)
+            counters = sorted(self.counters.items())
+        lines = [f"{'stage':<16} {'calls':>8} {'total ms':>10} {'mean us':>10} {'p95 us <=':>10}"]
+        for stage, histogram in histograms:
+            mean = histogram.sum / histogram.count if histogram.count else 0.0
+            lines.append(
+                f"{stage:<16} {histogram.count:>8} {histogram.sum * 1000:>10.1f} "
+                f"{mean * 1e6:>10.1f} {histogram.quantile(0.95) * 1e6:>10.0f}"
+            )
+        lines.extend(f"{name:<16} {value:>8g}" for name, value in counters)
+        return lines
+
+
+METRICS = Metrics(enabled=os.environ.get("SPORTSMODEL_METRICS") == "1")
+
+
+def serve_metrics(port: int, metrics: Metrics = METRICS, host: str = "127.0.0.1"):
+    """Serve ``metrics`` as Prometheus text on ``/metrics`` from a daemon thread.
+
+    Binds to loopback by default; pass ``host="0.0.0.0"`` to let a scraper on
+    another machine reach it. Returns the server; call ``shutdown()`` on it
+    to stop.
+    """
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer  # Only exporters need it.
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = metrics.render_prometheus().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass  # Scrapes every few seconds would flood stderr.
+
+    metrics.enable()
+    server = ThreadingHTTPServer((host, port), Handler)
+    threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+    return server
+
+
+__all__: List[str] = ["DEFAULT_BUCKETS", "Histogram", "METRICS", "Metrics", "serve_metrics"]
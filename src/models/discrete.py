@@ -0,0 +1,234 @@
+"""Exact score distributions for low-scoring sports.
+
+Goals are modelled as counts (Poisson, bivariate Poisson or negative binomial,
+optionally with the Dixon-Coles low-score correction) and the total-goals PMF
+is built by convolving the two team PMFs, switching to an FFT for large
+supports. Over/under and push probabilities are then exact sums, so half-goal
+and whole-goal lines are priced without any sampling.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import List, Sequence
+import cmath
+import math
+
+from .distribution import Distribution
+
+
+# Direct convolution is cheaper than the FFT below this many multiply-adds.
+FFT_THRESHOLD = 4096
+
+
+def support_size(mean: float, variance: float | None = None) -> int:
+    """Number of PMF points needed to cover all but a negligible tail."""
+    spread = math.sqrt(max(variance if variance is not None else mean, 1e-9))
+    return int(math.ceil(mean + 12 * spread + 10))
+
+
+def poisson_pmf(lam: float, size: int) -> List[float]:
+    lam = max(lam, 1e-9)
+    pmf = [math.exp(-lam)]
+    for k in range(1, size):
+        pmf.append(pmf[-1] * lam / k)
+    return pmf
+
+
+def negative_binomial_pmf(mean: float, dispersion: float, size: int) -> List[float]:
+    """NB with ``mean`` and size parameter ``dispersion`` (variance = mean + mean²/dispersion)."""
+    r = max(dispersion, 1e-9)
+    p = r / (r + max(mean, 1e-9))
+    pmf = [p ** r]
+    for k in range(1, size):
+        pmf.append(pmf[-1] * (k - 1 + r) / k * (1 - p))
+    return pmf
+
+
+def convolve(a: Sequence[float], b: Sequence[float]) -> List[float]:
+    if not a or not b:
+        return []
+    if len(a) * len(b) <= FFT_THRESHOLD:
+        out = [0.0] * (len(a) + len(b) - 1)
+        for i, x in enumerate(a):
+            if x == 0.0:
+                continue
+            for j, y in enumerate(b):
+                out[i + j] += x * y
+        return out
+    return _fft_convolve(a, b)
+
+
+def _fft_convolve(a: Sequence[float], b: Sequence[float]) -> List[float]:
+    n_out = len(a) + len(b) - 1
+    size = 1 << (n_out - 1).bit_length()
+    fa = _fft([complex(x) for x in a] + [0j] * (size - len(a)), invert=False)
+    fb = _fft([complex(x) for x in b] + [0j] * (size - len(b)), invert=False)
+    product = _fft([x * y for x, y in zip(fa, fb)], invert=True)
+    # Round-off can leave tiny negatives in zero-probability bins.
+    return [max(0.0, v.real / size) for v in product[:n_out]]
+
+
+def _fft(values: List[complex], invert: bool) -> List[complex]:
+    """Iterative radix-2 Cooley-Tukey FFT; ``len(values)`` must be a power of two."""
+    n = len(values)
+    out = list(values)
+    j = 0
+    for i in range(1, n):
+        bit = n >> 1
+        while j & bit:
+            j ^= bit
+            bit >>= 1
+        j |= bit
+        if i < j:
+            out[i], out[j] = out[j], out[i]
+    length = 2
+    sign = 1 if invert else -1
+    while length <= n:
+        w_len = cmath.exp(sign * 2j * math.pi / length)
+        half = length // 2
+        for start in range(0, n, length):
+            w = 1 + 0j
+            for k in range(start, start + half):
+                u = out[k]
+                v = out[k + half] * w
+                out[k] = u + v
+                out[k + half] = u - v
+                w *= w_len
+        length <<= 1
+    return out
+
+
+def dixon_coles_tau(home_goals: int, away_goals: int, lam_home: float, lam_away: float, rho: float) -> float:
+    """Dixon-Coles (1997) dependence factor for the four low-score cells."""
+    if home_goals == 0 and away_goals == 0:
+        return 1 - lam_home * lam_away * rho
+    if home_goals == 0 and away_goals == 1:
+        return 1 + lam_home * rho
+    if home_goals == 1 and away_goals == 0:
+        return 1 + lam_away * rho
+    if home_goals == 1 and away_goals == 1:
+        return 1 - rho
+    return 1.0
+
+
+@dataclass
+class ScorePMF:
+    """Exact PMFs of the home score, away score and the total."""
+
+    home: List[float]
+    away: List[float]
+    total: List[float]
+    joint: List[List[float]] | None = None
+
+    @property
+    def mean(self) -> float:
+        return sum(k * p for k, p in enumerate(self.total))
+
+    @property
+    def std(self) -> float:
+        mean = self.mean
+        return math.sqrt(max(sum((k - mean) ** 2 * p for k, p in enumerate(self.total)), 0.0))
+
+    def prob_over(self, line: float) -> float:
+        return sum(p for k, p in enumerate(self.total) if k > line)
+
+    def prob_under(self, line: float) -> float:
+        return sum(p for k, p in enumerate(self.total) if k < line)
+
+    def prob_push(self, line: float) -> float:
+        if line != int(line) or not 0 <= line < len(self.total):
+            return 0.0
+        return self.total[int(line)]
+
+    def to_distribution(self) -> Distribution:
+        return Distribution(mean=self.mean, std=max(self.std, 0.1))
+
+
+class DiscreteScoreModel:
+    """Build ``ScorePMF``s for a family of count models.
+
+    ``family`` is ``"poisson"``, ``"bivariate_poisson"`` (``covariance`` is the
+    shared-goal rate λ₃) or ``"negative_binomial"`` (``dispersion`` is the NB
+    size). ``rho`` applies the Dixon-Coles correction to independent families.
+    """
+
+    FAMILIES = ("poisson", "bivariate_poisson", "negative_binomial")
+
+    def __init__(self, family: str = "poisson", rho: float = 0.0, covariance: float = 0.0, dispersion: float = 20.0):
+        if family not in self.FAMILIES:
+            raise ValueError(f"Unknown discrete family '{family}'")
+        self.family = family
+        self.rho = rho
+        self.covariance = covariance
+        self.dispersion = dispersion
+
+    def score_pmf(self, home_mean: float, away_mean: float, with_joint: bool = False) -> ScorePMF:
+        if self.family == "bivariate_poisson":
+            return self._bivariate(home_mean, away_mean, with_joint)
+
+        if self.family == "negative_binomial":
+            home_size = support_size(home_mean, home_mean + home_mean ** 2 / self.dispersion)
+            away_size = support_size(away_mean, away_mean + away_mean ** 2 / self.dispersion)
+            home = negative_binomial_pmf(home_mean, self.dispersion, home_size)
+            away = negative_binomial_pmf(away_mean, self.dispersion, away_size)
+        else:
+            home = poisson_pmf(home_mean, support_size(home_mean))
+            away = poisson_pmf(away_mean, support_size(away_mean))
+
+        total = convolve(home, away)
+        if self.rho:
+            # Only four cells change, so patch the convolved total directly.
+            for i, j in ((0, 0), (0, 1), (1, 0), (1, 1)):
+                tau = dixon_coles_tau(i, j, home_mean, away_mean, self.rho)
+                total[i + j] += home[i] * away[j] * (tau - 1)
+            norm = sum(total)
+            total = [p / norm for p in total]
+
+        joint = None
+        if with_joint:
+            joint = [[h * a for a in away] for h in home]
+            if self.rho:
+                for i, j in ((0, 0), (0, 1), (1, 0), (1, 1)):
+                    joint[i][j] *= dixon_coles_tau(i, j, home_mean, away_mean, self.rho)
+                norm = sum(map(sum, joint))
+                joint = [[p / norm for p in row] for row in joint]
+            home = [sum(row) for row in joint]
+            away = [sum(col) for col in zip(*joint)]
+        return ScorePMF(home=home, away=away, total=total, joint=joint)
+
+    def _bivariate(self, home_mean: float, away_mean: float, with_joint: bool) -> ScorePMF:
+        # X = X1 + X3, Y = X2 + X3 with X3 ~ Poisson(λ₃) shared by both sides.
+        lam3 = max(0.0, min(self.covariance, home_mean - 1e-6, away_mean - 1e-6))
+        lam1, lam2 = home_mean - lam3, away_mean - lam3
+        home = poisson_pmf(home_mean, support_size(home_mean))
+        away = poisson_pmf(away_mean, support_size(away_mean))
+
+        # X + Y = (X1 + X2) + 2·X3, and X1 + X2 ~ Poisson(λ1 + λ2).
+        independent = poisson_pmf(lam1 + lam2, support_size(lam1 + lam2))
+        shared = poisson_pmf(lam3, support_size(lam3)) if lam3 > 0 else [1.0]
+        doubled = [0.0] * (2 * len(shared) - 1)
+        for k, p in enumerate(shared):
+            doubled[2 * k] = p
+        total = convolve(independent, doubled)
+
+        joint = None
+        if with_joint:
+            p1 = poisson_pmf(lam1, len(home))
+            p2 = poisson_pmf(lam2, len(away))
+            p3 = poisson_pmf(lam3, min(len(home), len(away))) if lam3 > 0 else [1.0]
+            joint = [
+                [sum(p1[x - k] * p2[y - k] * p3[k] for k in range(min(x, y, len(p3) - 1) + 1)) for y in range(len(away))]
+                for x in range(len(home))
+            ]
+        return ScorePMF(home=home, away=away, total=total, joint=joint)
+
+
+__all__: List[str] = [
+    "DiscreteScoreModel",
+    "ScorePMF",
+    "convolve",
+    "dixon_coles_tau",
+    "negative_binomial_pmf",
+    "poisson_pmf",
+    "support_size",
+]
@@ -0,0 +1,136 @@
+"""Joint (home, away) score samples shared by every market on a game.
+
+One set of score pairs prices totals, spreads, moneylines and team totals, so
+adding a market costs a pass over the samples rather than a new simulation.
+Samples come either from ``MonteCarloSimulator.simulate_joint_scores`` (equal
+weights) or from an exact ``ScorePMF`` joint matrix (weighted cells).
+"""
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass
+from typing import Iterable, List
+import math
+
+from .distribution import Distribution
+
+
+@dataclass(frozen=True)
+class OutcomeProbabilities:
+    """Win/lose/push probabilities for one side of a two-way market."""
+
+    win: float
+    lose: float
+    push: float = 0.0
+
+    def flipped(self) -> "OutcomeProbabilities":
+        return OutcomeProbabilities(win=self.lose, lose=self.win, push=self.push)
+
+
+class JointScores:
+    """Paired home/away scores with optional per-pair probabilities."""
+
+    def __init__(self, home: Iterable[float], away: Iterable[float], weights: Iterable[float] | None = None):
+        self.home = array("d", home)
+        self.away = array("d", away)
+        if len(self.home) != len(self.away):
+            raise ValueError("home and away scores must have the same length")
+        if not self.home:
+            raise ValueError("Need at least one score pair")
+        if weights is None:
+            self.weights = None
+        else:
+            self.weights = array("d", weights)
+            total = math.fsum(self.weights)
+            self.weights = array("d", (w / total for w in self.weights))
+
+    @classmethod
+    def from_pmf(cls, joint: List[List[float]], min_prob: float = 1e-12) -> "JointScores":
+        """Weighted pairs from an exact joint PMF (``joint[home][away]``)."""
+        home, away, weights = [], [], []
+        for h, row in enumerate(joint):
+            for a, p in enumerate(row):
+                if p > min_prob:
+                    home.append(h)
+                    away.append(a)
+                    weights.append(p)
+        return cls(home, away, weights)
+
+    def __len__(self) -> int:
+        return len(self.home)
+
+    def totals(self) -> array:
+        return array("d", (h + a for h, a in zip(self.home, self.away)))
+
+    def margins(self) -> array:
+        return array("d", (h - a for h, a in zip(self.home, self.away)))
+
+    def total_distribution(self) -> Distribution:
+        return self._distribution(self.totals())
+
+    def total(self, line: float) -> OutcomeProbabilities:
+        """Over ``line`` wins."""
+        return self._tally(self.totals(), line)
+
+    def team_total(self, side: str, line: float) -> OutcomeProbabilities:
+        """``side`` (``"home"``/``"away"``) scoring over ``line`` wins."""
+        return self._tally(self._side(side), line)
+
+    def spread(self, side: str, line: float) -> OutcomeProbabilities:
+        """``side`` covers when its score plus the handicap ``line`` beats the opponent."""
+        margins = self.margins()
+        if self._side(side) is self.away:
+            margins = array("d", (-m for m in margins))
+        return self._tally(margins, -line)
+
+    def moneyline(self, side: str, three_way: bool = False) -> OutcomeProbabilities:
+        """``side`` wins outright.
+
+        In a three-way market (soccer) a draw loses; otherwise regulation ties
+        are settled in extra time, treated as a coin flip.
+        """
+        result = self.spread(side, 0.0)
+        if three_way:
+            return OutcomeProbabilities(win=result.win, lose=result.lose + result.push)
+        return OutcomeProbabilities(win=result.win + result.push / 2, lose=result.lose + result.push / 2)
+
+    def draw(self) -> float:
+        return self.spread("home", 0.0).push
+
+    def _side(self, side: str) -> array:
+        if side == "home":
+            return self.home
+        if side == "away":
+            return self.away
+        raise ValueError(f"Unknown side '{side}'")
+
+    def _tally(self, values: array, line: float) -> OutcomeProbabilities:
+        over = under = push = 0.0
+        if self.weights is None:
+            for value in values:
+                if value > line:
+                    over += 1
+                elif value < line:
+                    under += 1
+                else:
+                    push += 1
+            count = len(values)
+            return OutcomeProbabilities(win=over / count, lose=under / count, push=push / count)
+        for value, weight in zip(values, self.weights):
+            if value > line:
+                over += weight
+            elif value < line:
+                under += weight
+            else:
+                push += weight
+        return OutcomeProbabilities(win=over, lose=under, push=push)
+
+    def _distribution(self, values: array) -> Distribution:
+        if self.weights is None:
+            return Distribution.from_samples(values)
+        mean = math.fsum(v * w for v, w in zip(values, self.weights))
+        variance = math.fsum((v - mean) ** 2 * w for v, w in zip(values, self.weights))
+        return Distribution(mean=mean, std=max(math.sqrt(variance), 0.1))
+
+
+__all__: List[str] = ["JointScores", "OutcomeProbabilities"]
@@ -1,11 +1,18 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Iterable, List
+from statistics import fmean, stdev
+from typing import Iterable, List, Sequence
+import math
 import random
 
+try:
+    from ..metrics import METRICS
+except ImportError:  # Allows imports when models is treated as a top-level package
+    from metrics import METRICS
 from .causal_graph import CausalGraph, InjuryModel, pace_adjustment
 from .distribution import Distribution
+from .joint_score import JointScores
 
 
 @dataclass
@@ -26,18 +33,68 @@ class MonteCarloSimulator:
         injuries: Iterable[dict] | None = None,
         pace: float | None = None,
     ) -> Distribution:
-        injuries = injuries or []
-        adjusted_injuries = self.injury_model.estimate_impacts(injuries)
-        graph = CausalGraph.from_injuries(adjusted_injuries)
-        mean, std = graph.apply(base_mean, base_std)
-
-        if pace:
-            adj = pace_adjustment(pace)
-            mean *= adj
-            std *= adj
-
-        samples = [random.gauss(mean, std) for _ in range(self.config.num_paths)]
-        return Distribution.from_samples(samples)
+        mean, std = self.adjusted_moments(base_mean, base_std, injuries, pace)
+        with METRICS.timer("simulation"):
+            samples = [random.gauss(mean, std) for _ in range(self.config.num_paths)]
+            return Distribution.from_samples(samples)
+
+    def adjusted_moments(
+        self,
+        base_mean: float,
+        base_std: float,
+        injuries: Iterable[dict] | None = None,
+        pace: float | None = None,
+    ) -> tuple[float, float]:
+        """Apply injury and pace adjustments to the pre-simulation mean/std."""
+        with METRICS.timer("causal_adjust"):
+            adjusted_injuries = self.injury_model.estimate_impacts(injuries or [])
+            graph = CausalGraph.from_injuries(adjusted_injuries)
+            mean, std = graph.apply(base_mean, base_std)
+
+            if pace:
+                adj = pace_adjustment(pace)
+                mean *= adj
+                std *= adj
+            return mean, std
+
+    def simulate_many(self, moments: Sequence[tuple[float, float]]) -> List[Distribution]:
+        """Simulate many games at once from one shared block of standard normals.
+
+        Every game's paths are ``mean + std * z`` for the same ``z`` draws
+        (common random numbers), so the sample mean and std of each game follow
+        from the block's moments without generating per-game samples.
+        """
+        if not moments:
+            return []
+        with METRICS.timer("simulation"):
+            z = [random.gauss(0.0, 1.0) for _ in range(max(2, self.config.num_paths))]
+            z_mean = fmean(z)
+            z_std = stdev(z, z_mean)
+            return [Distribution(mean=mean + std * z_mean, std=abs(std) * z_std) for mean, std in moments]
+
+    def simulate_joint_scores(
+        self,
+        home_mean: float,
+        away_mean: float,
+        total_std: float,
+        correlation: float = 0.0,
+    ) -> JointScores:
+        """Simulate correlated (home, away) score pairs once for every market.
+
+        Each team gets the same spread, chosen so the total keeps ``total_std``;
+        scores are rounded because books settle on whole points.
+        """
+        rho = max(-0.99, min(0.99, correlation))
+        team_std = total_std / math.sqrt(2 * (1 + rho))
+        residual = math.sqrt(1 - rho * rho)
+        home, away = [], []
+        with METRICS.timer("simulation"):
+            for _ in range(max(2, self.config.num_paths)):
+                z_home = random.gauss(0.0, 1.0)
+                z_away = rho * z_home + residual * random.gauss(0.0, 1.0)
+                home.append(round(home_mean + team_std * z_home))
+                away.append(round(away_mean + team_std * z_away))
+        return JointScores(home, away)
 
     def percentile_interval(self, samples: List[float]) -> tuple[float, float]:
         samples_sorted = sorted(samples)
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Iterable, List
+from typing import Iterable, List, Sequence, Tuple
+from statistics import NormalDist
 import math
 
 from .distribution import Distribution
@@ -38,13 +39,11 @@ class OTEngine:
 
     def distance_between_distributions(self, true_dist: Distribution, market_dist: Distribution) -> OTResult:
         analytic = self._gaussian_distance(true_dist, market_dist)
-        # Lightweight Monte Carlo refinement to capture tail mismatches without heavy sampling.
-        true_samples = true_dist.sample(512)
-        market_samples = market_dist.sample(512)
-        empirical = self.distance(true_samples, market_samples)
+        # Quantile term in closed form: both sides are normals, so no sampling is needed.
+        quantile = self._normal_quantile_distance(true_dist, market_dist)
 
-        # Blend analytic structure (linear algebra on mean/variance) with empirical tail signal.
-        blended_distance = math.hypot(analytic.distance, empirical.distance)
+        # Blend analytic structure (linear algebra on mean/variance) with the quantile-coupling distance.
+        blended_distance = math.hypot(analytic.distance, quantile)
         cost = blended_distance / (1 + self.reg)
         return OTResult(
             distance=blended_distance,
@@ -56,6 +55,35 @@ class OTEngine:
             gradient_scale=analytic.gradient_scale,
         )
 
+    def distances_between_distributions(self, pairs: Sequence[Tuple[Distribution, Distribution]]) -> List[OTResult]:
+        """Batch ``distance_between_distributions`` over many (true, market) pairs."""
+        return [self.distance_between_distributions(true_dist, market_dist) for true_dist, market_dist in pairs]
+
+    def _normal_quantile_distance(self, true_dist: Distribution, market_dist: Distribution) -> float:
+        """Wasserstein-p between the two normals under the quantile coupling, exactly.
+
+        The quantiles of ``N(m, s)`` are ``m + s * z``, so the gap at standard
+        quantile ``z`` is ``mean_shift + scale_shift * z`` and the distance is
+        ``E|mean_shift + scale_shift * Z| ** p`` for standard normal ``Z``.
+        """
+        mean_shift = true_dist.mean - market_dist.mean
+        scale_shift = abs(true_dist.std) - abs(market_dist.std)
+        p = self.p_norm
+        if p == 2:
+            return math.hypot(mean_shift, scale_shift)
+        if p == 1:
+            if scale_shift == 0:
+                return abs(mean_shift)
+            spread = abs(scale_shift)
+            ratio = mean_shift / spread
+            # Mean of a folded normal.
+            return spread * math.sqrt(2 / math.pi) * math.exp(-ratio * ratio / 2) + mean_shift * (
+                1 - 2 * _STANDARD_NORMAL.cdf(-ratio)
+            )
+        # Other norms: deterministic midpoint rule over the standard normal quantiles.
+        acc = sum(abs(mean_shift + scale_shift * z) ** p for z in _quantile_grid())
+        return (acc / _GRID_POINTS) ** (1.0 / p)
+
     def _gaussian_distance(self, true_dist: Distribution, market_dist: Distribution) -> OTResult:
         mean_shift = true_dist.mean - market_dist.mean
         scale_shift = max(true_dist.std, 1e-6) - max(market_dist.std, 1e-6)
@@ -97,23 +125,35 @@ class OTEngine:
         if n_points == 0:
             return 0.0
 
-        def percentile(sorted_vals: List[float], q: float) -> float:
-            pos = q * (len(sorted_vals) - 1)
-            low = int(math.floor(pos))
-            high = int(math.ceil(pos))
-            if low == high:
-                return sorted_vals[low]
-            weight = pos - low
-            return sorted_vals[low] * (1 - weight) + sorted_vals[high] * weight
-
         acc = 0.0
         for i in range(n_points):
             q = i / (n_points - 1)
-            a_q = percentile(sorted_a, q)
-            b_q = percentile(sorted_b, q)
+            a_q = _percentile(sorted_a, q)
+            b_q = _percentile(sorted_b, q)
             acc += abs(a_q - b_q) ** p_norm
 
         return (acc / n_points) ** (1.0 / p_norm)
 
 
+_STANDARD_NORMAL = NormalDist()
+_GRID_POINTS = 512
+_GRID: List[float] = []
+
+
+def _quantile_grid() -> List[float]:
+    if not _GRID:
+        _GRID.extend(_STANDARD_NORMAL.inv_cdf((i + 0.5) / _GRID_POINTS) for i in range(_GRID_POINTS))
+    return _GRID
+
+
+def _percentile(sorted_vals: List[float], q: float) -> float:
+    pos = q * (len(sorted_vals) - 1)
+    low = int(math.floor(pos))
+    high = int(math.ceil(pos))
+    if low == high:
+        return sorted_vals[low]
+    weight = pos - low
+    return sorted_vals[low] * (1 - weight) + sorted_vals[high] * weight
+
+
 __all__: List[str] = ["OTEngine", "OTResult"]
@@ -0,0 +1,239 @@
+"""Discord-free edge lookups shared by the bot and other front ends.
+
+Kept out of ``discord_bot`` so scripts and tests can list edges without
+importing discord.py.
+"""
+from __future__ import annotations
+
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Generic, Iterable, List, Tuple, TypeVar
+import asyncio
+import heapq
+import itertools
+import threading
+
+from .data.odds_cache import OddsCache
+from .data.odds_scraper import OddsScraper
+from .data.slate import Slate
+from .edge.detector import EdgeResult
+from .edge.result_cache import ResultCache
+from .metrics import METRICS
+from .sports import SlatePricer
+
+
+@dataclass
+class EdgeSummary:
+    sport: str
+    game_id: str
+    matchup: str
+    edge: EdgeResult
+
+    def as_line(self) -> str:
+        with METRICS.timer("format"):
+            ev_pct = self.edge.expected_value * 100
+            kelly_pct = self.edge.kelly_fraction * 100
+            return (
+                f"{self.matchup} → {self.edge.recommendation} {self.edge.line:.1f} "
+                f"(EV {ev_pct:.1f}%, Kelly {kelly_pct:.1f}%)"
+            )
+
+
+def fetch_edges_for_sport(
+    sport: str,
+    min_ev: float,
+    limit: int | None = None,
+    result_cache: ResultCache | None = None,
+    odds: OddsCache | None = None,
+) -> List[EdgeSummary]:
+    """Price one sport's slate in a single batch; edges worth at least ``min_ev``, best first.
+
+    With ``odds`` the games come from that cache instead of a fresh fetch.
+    """
+    if odds is not None:
+        slate = Slate.from_games(sport, odds.get(sport, max_games=limit))
+    else:
+        slate = OddsScraper().fetch_slate(sport=sport, max_games=limit)
+    results = [
+        EdgeSummary(sport=sport, game_id=row.game_id, matchup=row.matchup, edge=row.edge)
+        for row in SlatePricer(result_cache=result_cache).price_slates([slate])
+        if row.edge is not None and row.edge.expected_value >= min_ev
+    ]
+    return sorted(results, key=_edge_ev, reverse=True)
+
+
+T = TypeVar("T")
+
+
+class TopK(Generic[T]):
+    """Keep the ``k`` largest items by ``key`` in a bounded min-heap."""
+
+    def __init__(self, k: int, key: Callable[[T], float]):
+        self.k = k
+        self.key = key
+        self._heap: List[Tuple[float, int, T]] = []
+        self._order = itertools.count()
+
+    @property
+    def threshold(self) -> float | None:
+        """Score an item must beat to enter, or ``None`` while the heap has room."""
+        return self._heap[0][0] if self._heap and len(self._heap) >= self.k else None
+
+    def can_improve(self, bound: float) -> bool:
+        if self.k <= 0:
+            return False
+        threshold = self.threshold
+        return threshold is None or bound > threshold
+
+    def push(self, item: T) -> bool:
+        """Offer ``item``; returns whether it was kept."""
+        if self.k <= 0:
+            return False
+        score = self.key(item)
+        # Negated counter: among equal scores the earliest item survives.
+        entry = (score, -next(self._order), item)
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, entry)
+            return True
+        if entry[:2] <= self._heap[0][:2]:
+            return False
+        heapq.heapreplace(self._heap, entry)
+        return True
+
+    def items(self) -> List[T]:
+        """Kept items, best first."""
+        return [item for _, _, item in sorted(self._heap, reverse=True)]
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+
+def _edge_ev(summary: EdgeSummary) -> float:
+    return summary.edge.expected_value
+
+
+def top_edges(per_sport: Iterable[List[EdgeSummary]], k: int) -> List[EdgeSummary]:
+    """Global top ``k`` edges from per-sport lists sorted best first.
+
+    Sports are visited in order of their best edge; once a sport's best cannot
+    beat the current k-th EV, neither can any remaining sport, so the scan
+    stops. Within a sport it stops at the first edge that does not make it.
+    """
+    top: TopK[EdgeSummary] = TopK(k, _edge_ev)
+    for edges in sorted((edges for edges in per_sport if edges), key=lambda edges: _edge_ev(edges[0]), reverse=True):
+        if not top.can_improve(_edge_ev(edges[0])):
+            break
+        for edge in edges:
+            if not top.push(edge):
+                break
+    return top.items()
+
+
+class ScanTimeout(Exception):
+    """Raised when a scan does not finish within its time limit."""
+
+
+_WORKER_CACHE: ResultCache | None = None
+_WORKER_CACHE_PATH: str | None = None
+_WORKER_ODDS_TTL = 60.0
+_WORKER_LOCK = threading.Lock()
+# Per worker thread: an OddsCache and, per (sport, min_ev, limit), the
+# snapshot games last priced with the edges they produced.
+_WORKER_STATE = threading.local()
+
+
+def _init_worker(result_cache_path: str | None, odds_ttl: float = 60.0) -> None:
+    global _WORKER_CACHE_PATH, _WORKER_ODDS_TTL
+    _WORKER_CACHE_PATH = result_cache_path
+    _WORKER_ODDS_TTL = odds_ttl
+
+
+def _worker_fetch(sport: str, min_ev: float, limit: int | None) -> List[EdgeSummary]:
+    # One ResultCache per worker process (shared by threads); SQLite WAL handles
+    # concurrent readers/writers across processes.
+    global _WORKER_CACHE
+    if _WORKER_CACHE_PATH and _WORKER_CACHE is None:
+        with _WORKER_LOCK:
+            if _WORKER_CACHE is None:
+                _WORKER_CACHE = ResultCache(_WORKER_CACHE_PATH)
+    state = _WORKER_STATE
+    if not hasattr(state, "odds"):
+        state.odds = OddsCache(ttl=_WORKER_ODDS_TTL)
+        state.priced = {}
+    # Odds are revalidated at most once per TTL; while a sport's snapshot is
+    # unchanged (same games object) its last edges are still current.
+    state.odds.refresh(sport)
+    games = state.odds.snapshot(sport).games
+    key = (sport, min_ev, limit)
+    last = state.priced.get(key)
+    if last is not None and last[0] is games:
+        METRICS.inc("odds_unchanged")
+        return last[1]
+    edges = fetch_edges_for_sport(sport, min_ev, limit=limit, result_cache=_WORKER_CACHE, odds=state.odds)
+    state.priced[key] = (games, edges)
+    return edges
+
+
+def _worker_scan(sport: str, min_ev: float, limit: int | None, collect_metrics: bool):
+    """``_worker_fetch`` plus, from worker processes, the metrics it recorded."""
+    if not collect_metrics:
+        return _worker_fetch(sport, min_ev, limit), None
+    METRICS.enable()
+    edges = _worker_fetch(sport, min_ev, limit)
+    return edges, METRICS.drain()
+
+
+class ScanExecutor:
+    """Run edge scans in a worker pool so async callers never block their loop.
+
+    Each sport is a separate pool task, so multi-sport scans run in parallel
+    and a timeout cancels every sport that has not started yet. Processes are
+    the default because the scan is CPU-bound Python; ``use_processes=False``
+    swaps in threads (cheaper to start, but they share the GIL).
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        use_processes: bool = True,
+        timeout: float | None = 30.0,
+        result_cache_path: str | None = None,
+        odds_ttl: float = 60.0,
+    ):
+        self.timeout = timeout
+        # Threads record straight into this process's METRICS; processes ship theirs back.
+        self._collect_metrics = use_processes
+        pool_cls = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+        self._pool: Executor = pool_cls(
+            max_workers=max_workers, initializer=_init_worker, initargs=(result_cache_path, odds_ttl)
+        )
+
+    async def edges_for_sports(
+        self,
+        sports: Iterable[str],
+        min_ev: float,
+        limit: int | None = None,
+        timeout: float | None = None,
+    ) -> List[EdgeSummary]:
+        """Scan ``sports`` concurrently; results keep the order of ``sports``."""
+        loop = asyncio.get_running_loop()
+        timeout = timeout if timeout is not None else self.timeout
+        collect = self._collect_metrics and METRICS.enabled
+        tasks = [loop.run_in_executor(self._pool, _worker_scan, sport, min_ev, limit, collect) for sport in sports]
+        try:
+            results = await asyncio.wait_for(asyncio.gather(*tasks), timeout)
+        except asyncio.TimeoutError:
+            # Cancelling the executor futures also drops sports still queued in the pool.
+            for task in tasks:
+                task.cancel()
+            raise ScanTimeout(f"scan did not finish within {timeout}s") from None
+        for _, drained in results:
+            if drained is not None:
+                METRICS.merge(drained)
+        return [edge for edges, _ in results for edge in edges]
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+__all__: List[str] = ["EdgeSummary", "ScanExecutor", "ScanTimeout", "TopK", "fetch_edges_for_sport", "top_edges"]
@@ -1,15 +1,41 @@
-from .nba import NBAAnalyzer
-from .nfl import NFLAnalyzer
-from .ncaaf import NCAAFAnalyzer
-from .nhl import NHLAnalyzer
-from .soccer import SoccerAnalyzer
-from .cbb import CBBAnalyzer
-
-__all__ = [
-    "NBAAnalyzer",
-    "NFLAnalyzer",
-    "NCAAFAnalyzer",
-    "NHLAnalyzer",
-    "SoccerAnalyzer",
-    "CBBAnalyzer",
-]
+"""Sport analyzers and pricers.
+
+Exports resolve lazily through ``_EXPORTS`` so ``from src.sports import
+TotalsAnalyzer`` only imports the modules it needs, not every sport.
+"""
+from importlib import import_module
+
+_EXPORTS = {
+    "NBAAnalyzer": ".nba",
+    "NFLAnalyzer": ".nfl",
+    "NCAAFAnalyzer": ".ncaaf",
+    "NHLAnalyzer": ".nhl",
+    "SoccerAnalyzer": ".soccer",
+    "CBBAnalyzer": ".cbb",
+    "LiveGameState": ".live",
+    "LivePrice": ".live",
+    "LiveTotalsModel": ".live",
+    "MatchupMatrix": ".matchups",
+    "PricedGame": ".generic",
+    "SlatePricer": ".generic",
+    "TotalsAnalyzer": ".generic",
+    "SPORT_PROFILES": ".profiles",
+    "SportProfile": ".profiles",
+    "profile_for": ".profiles",
+}
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
+
+
+__all__ = list(_EXPORTS)
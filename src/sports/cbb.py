@@ -1,66 +1,38 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Iterable, List
+from typing import List
 
 try:
     from ..data.stats_fetcher import StatsFetcher
-    from ..edge.detector import EdgeDetector, EdgeResult
-    from ..models.distribution import Distribution
+    from ..edge.detector import EdgeDetector
+    from ..edge.result_cache import ResultCache
     from ..models.monte_carlo import MonteCarloSimulator
 except ImportError:  # Allows importing when src/ is on sys.path directly
     from data.stats_fetcher import StatsFetcher
-    from edge.detector import EdgeDetector, EdgeResult
-    from models.distribution import Distribution
+    from edge.detector import EdgeDetector
+    from edge.result_cache import ResultCache
     from models.monte_carlo import MonteCarloSimulator
+from .generic import GameInfo, TotalsAnalyzer
+from .profiles import SPORT_PROFILES
 
 
-@dataclass
-class GameInfo:
-    game_id: str
-    home_team: str
-    away_team: str
-    total_line: float
-    over_odds: int
-    under_odds: int
-    injuries: Iterable[dict]
-
-
-class CBBAnalyzer:
+class CBBAnalyzer(TotalsAnalyzer):
     def __init__(
         self,
         odds_api_client=None,
         stats_fetcher: StatsFetcher | None = None,
         simulator: MonteCarloSimulator | None = None,
         detector: EdgeDetector | None = None,
+        result_cache: ResultCache | None = None,
     ):
-        self.stats = stats_fetcher or StatsFetcher(odds_api_client=odds_api_client)
-        self.simulator = simulator or MonteCarloSimulator()
-        self.detector = detector or EdgeDetector()
-
-    def analyze_game(
-        self,
-        game_id: str,
-        home_team: str,
-        away_team: str,
-        total_line: float,
-        over_odds: int,
-        under_odds: int,
-        injuries: Iterable[dict] | None = None,
-    ) -> EdgeResult | None:
-        injuries = injuries or []
-        home_stats = self.stats.fetch_team_stats(home_team, sport="basketball_cbb_division1")
-        away_stats = self.stats.fetch_team_stats(away_team, sport="basketball_cbb_division1")
-
-        base_mean = (home_stats["offensive_rating"] + away_stats["offensive_rating"]) / 2
-        base_std = 10.0
-        pace = (home_stats["pace"] + away_stats["pace"]) / 2
-
-        true_dist = self.simulator.simulate_total_points(
-            base_mean=base_mean, base_std=base_std, injuries=injuries, pace=pace
+        super().__init__(
+            SPORT_PROFILES["basketball_cbb_division1"],
+            stats_fetcher=stats_fetcher,
+            simulator=simulator,
+            detector=detector,
+            result_cache=result_cache,
+            odds_api_client=odds_api_client,
         )
-        market_dist = Distribution.from_market_total(line=total_line, odds=over_odds)
-        return self.detector.detect(true_dist=true_dist, market_dist=market_dist, odds=over_odds, bet_on_over=True)
 
 
 __all__: List[str] = ["CBBAnalyzer", "GameInfo"]
@@ -0,0 +1,304 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Mapping
+
+try:
+    from ..data.slate import Slate
+    from ..data.stats_fetcher import StatsFetcher
+    from ..edge.detector import EdgeDetector, EdgeResult
+    from ..edge.markets import MarketEdge, price_markets
+    from ..edge.result_cache import CachedAnalysis, ResultCache, analysis_inputs, cached_analysis
+    from ..memory import MEMORY
+    from ..metrics import METRICS
+    from ..models.distribution import Distribution
+    from ..models.joint_score import JointScores
+    from ..models.monte_carlo import MonteCarloSimulator
+except ImportError:  # Allows importing when src/ is on sys.path directly
+    from data.slate import Slate
+    from data.stats_fetcher import StatsFetcher
+    from edge.detector import EdgeDetector, EdgeResult
+    from edge.markets import MarketEdge, price_markets
+    from edge.result_cache import CachedAnalysis, ResultCache, analysis_inputs, cached_analysis
+    from memory import MEMORY
+    from metrics import METRICS
+    from models.distribution import Distribution
+    from models.joint_score import JointScores
+    from models.monte_carlo import MonteCarloSimulator
+from .profiles import SportProfile, profile_for
+
+
+@dataclass
+class GameInfo:
+    game_id: str
+    home_team: str
+    away_team: str
+    total_line: float
+    over_odds: int
+    under_odds: int
+    injuries: Iterable[dict]
+
+
+class TotalsAnalyzer:
+    """Price a game total for any sport described by a ``SportProfile``."""
+
+    def __init__(
+        self,
+        profile: SportProfile,
+        stats_fetcher: StatsFetcher | None = None,
+        simulator: MonteCarloSimulator | None = None,
+        detector: EdgeDetector | None = None,
+        result_cache: ResultCache | None = None,
+        odds_api_client=None,
+    ):
+        self.profile = profile
+        self.stats = stats_fetcher or StatsFetcher(odds_api_client=odds_api_client)
+        self.simulator = simulator or MonteCarloSimulator()
+        self.detector = detector or EdgeDetector()
+        self.result_cache = result_cache
+
+    def analyze_game(
+        self,
+        game_id: str,
+        home_team: str,
+        away_team: str,
+        total_line: float,
+        over_odds: int,
+        under_odds: int,
+        injuries: Iterable[dict] | None = None,
+        sport: str | None = None,
+    ) -> EdgeResult | None:
+        # ``sport`` only selects the stats baseline (e.g. a specific soccer league).
+        sport = sport or self.profile.code
+        injuries = list(injuries or [])  # read twice: for the cache key and for pricing
+        METRICS.inc("games_analyzed")
+        with METRICS.timer("stats_fetch"):
+            home_stats = self.stats.fetch_team_stats(home_team, sport=sport)
+            away_stats = self.stats.fetch_team_stats(away_team, sport=sport)
+
+        base_mean = self.profile.base_mean(home_stats, away_stats)
+        base_std = self.profile.base_std
+        pace = (home_stats["pace"] + away_stats["pace"]) / 2
+
+        def price() -> CachedAnalysis:
+            market_dist = Distribution.from_market_total(line=total_line, odds=over_odds)
+            if self.profile.is_discrete:
+                mean, _ = self.simulator.adjusted_moments(base_mean, base_std, injuries, pace)
+                with METRICS.timer("score_pmf"):
+                    pmf = self.profile.discrete_model().score_pmf(*self.profile.team_means(mean, home_stats, away_stats))
+                true_dist = pmf.to_distribution()
+                edge = self.detector.detect(
+                    true_dist=true_dist,
+                    market_dist=market_dist,
+                    odds=over_odds,
+                    bet_on_over=True,
+                    true_prob=pmf.prob_over(total_line),
+                    push_prob=pmf.prob_push(total_line),
+                )
+                return CachedAnalysis(distribution=true_dist, edge=edge)
+
+            true_dist = self.simulator.simulate_total_points(
+                base_mean=base_mean, base_std=base_std, injuries=injuries, pace=pace
+            )
+            edge = self.detector.detect(true_dist=true_dist, market_dist=market_dist, odds=over_odds, bet_on_over=True)
+            return CachedAnalysis(distribution=true_dist, edge=edge)
+
+        inputs = analysis_inputs(
+            sport, home_stats, away_stats, injuries, total_line, over_odds, under_odds,
+            base_std, self.simulator, self.detector, scoring=self.profile.scoring,
+        )
+        edge = cached_analysis(self.result_cache, inputs, price).edge
+        if edge is not None:
+            METRICS.inc("edges_found")
+        return edge
+
+    def analyze_markets(self, game: dict, sport: str | None = None) -> List[MarketEdge]:
+        """Price the total, spread, moneyline and team totals of ``game`` from one joint sample."""
+        sport = sport or self.profile.code
+        home_stats = self.stats.fetch_team_stats(game["home_team"], sport=sport)
+        away_stats = self.stats.fetch_team_stats(game["away_team"], sport=sport)
+        scores = self.joint_scores(home_stats, away_stats, game.get("injuries"))
+        return price_markets(scores, game, self.detector)
+
+    def joint_scores(
+        self,
+        home_stats: Dict[str, float],
+        away_stats: Dict[str, float],
+        injuries: Iterable[dict] | None = None,
+    ) -> JointScores:
+        mean, std = self.simulator.adjusted_moments(
+            self.profile.base_mean(home_stats, away_stats),
+            self.profile.base_std,
+            injuries,
+            (home_stats["pace"] + away_stats["pace"]) / 2,
+        )
+        home_mean, away_mean = self.profile.team_means(mean, home_stats, away_stats)
+        if self.profile.is_discrete:
+            pmf = self.profile.discrete_model().score_pmf(home_mean, away_mean, with_joint=True)
+            return JointScores.from_pmf(pmf.joint)
+        return self.simulator.simulate_joint_scores(home_mean, away_mean, std, self.profile.correlation)
+
+
+@dataclass
+class PricedGame:
+    """One priced game, pointing back at its slate row.
+
+    The feed-shaped ``game`` dict is built only when read, so callers that
+    keep just the edges never pay for one per game.
+    """
+
+    slate: Slate
+    idx: int
+    distribution: Distribution
+    edge: EdgeResult | None
+
+    @property
+    def sport(self) -> str:
+        return self.slate.sport
+
+    @property
+    def game_id(self) -> str:
+        return self.slate.game_ids[self.idx]
+
+    @property
+    def matchup(self) -> str:
+        slate, idx = self.slate, self.idx
+        return f"{slate.team_name(slate.away[idx])} @ {slate.team_name(slate.home[idx])}"
+
+    @property
+    def game(self) -> dict:
+        return self.slate.game(self.idx)
+
+
+class SlatePricer:
+    """Price games from every sport in one batched pass.
+
+    Stats are fetched in bulk per sport, the per-game mean/std come from each
+    sport's profile, and simulation plus OT/EV run once over the whole slate via
+    ``MonteCarloSimulator.simulate_many`` and ``EdgeDetector.detect_many``.
+    With a ``result_cache``, games whose inputs were already priced are read
+    back from it and only the misses go through the batch.
+    """
+
+    def __init__(
+        self,
+        stats_fetcher: StatsFetcher | None = None,
+        simulator: MonteCarloSimulator | None = None,
+        detector: EdgeDetector | None = None,
+        result_cache: ResultCache | None = None,
+    ):
+        self.stats = stats_fetcher or StatsFetcher()
+        self.simulator = simulator or MonteCarloSimulator()
+        self.detector = detector or EdgeDetector()
+        self.result_cache = result_cache
+
+    def price(self, games_by_sport: Mapping[str, Iterable[dict]]) -> List[PricedGame]:
+        return self.price_slates(Slate.from_games(sport, games) for sport, games in games_by_sport.items())
+
+    def price_slates(self, slates: Iterable[Slate]) -> List[PricedGame]:
+        """Price columnar slates; rows reference their slate instead of copying the game."""
+        cache = self.result_cache
+        if cache is None:
+            return self._price_slates(slates, None)
+        with cache.batch():  # one cache transaction per call
+            return self._price_slates(slates, cache)
+
+    def _price_slates(self, slates: Iterable[Slate], cache: ResultCache | None) -> List[PricedGame]:
+        rows: List[tuple[Slate, int]] = []
+        cached: Dict[int, CachedAnalysis] = {}  # row -> result read from the cache
+        batch: List[int] = []  # rows priced in this pass
+        keys: List[str] = []  # cache keys of ``batch`` rows, when caching
+        true_dists: List[Distribution | None] = []
+        true_probs: List[float | None] = []
+        push_probs: List[float] = []
+        simulated: List[int] = []
+        moments: List[tuple[float, float]] = []
+        market_dists: List[Distribution] = []
+        odds: List[int] = []
+        with MEMORY.stage("prepare"):
+            for slate in slates:
+                if not len(slate):
+                    continue
+                sport = slate.sport
+                profile = profile_for(sport)
+                discrete = profile.discrete_model() if profile.is_discrete else None
+                team_ids = slate.team_ids()
+                by_name = self._fetch_stats({slate.team_name(team) for team in team_ids}, sport)
+                stats = {team: by_name[slate.team_name(team)] for team in team_ids}
+                for idx, (home, away, line, over_odds) in enumerate(
+                    zip(slate.home, slate.away, slate.total_line, slate.over_odds)
+                ):
+                    row = len(rows)
+                    rows.append((slate, idx))
+                    home_stats, away_stats = stats[home], stats[away]
+                    injuries = slate.injuries.get(idx)
+                    if cache is not None:
+                        key = cache.key_for(
+                            analysis_inputs(
+                                sport, home_stats, away_stats, injuries or [], line, over_odds,
+                                slate.under_odds[idx], profile.base_std, self.simulator, self.detector,
+                                scoring=profile.scoring,
+                            )
+                        )
+                        hit = cache.get(key)
+                        if hit is not None:
+                            METRICS.inc("result_cache_hits")
+                            cached[row] = hit
+                            continue
+                        METRICS.inc("result_cache_misses")
+                        keys.append(key)
+                    mean, std = self.simulator.adjusted_moments(
+                        base_mean=profile.base_mean(home_stats, away_stats),
+                        base_std=profile.base_std,
+                        injuries=injuries,
+                        pace=(home_stats["pace"] + away_stats["pace"]) / 2,
+                    )
+                    if discrete is not None:
+                        # Count sports are priced exactly; no simulation needed.
+                        with METRICS.timer("score_pmf"):
+                            pmf = discrete.score_pmf(*profile.team_means(mean, home_stats, away_stats))
+                        true_dists.append(pmf.to_distribution())
+                        true_probs.append(pmf.prob_over(line))
+                        push_probs.append(pmf.prob_push(line))
+                    else:
+                        simulated.append(len(batch))
+                        moments.append((mean, std))
+                        true_dists.append(None)
+                        true_probs.append(None)
+                        push_probs.append(0.0)
+                    market_dists.append(Distribution.from_market_total(line=line, odds=over_odds))
+                    odds.append(over_odds)
+                    batch.append(row)
+
+        with MEMORY.stage("simulation"):
+            for pos, dist in zip(simulated, self.simulator.simulate_many(moments)):
+                true_dists[pos] = dist
+        with MEMORY.stage("detect"):
+            edges = self.detector.detect_many(
+                true_dists, market_dists, odds, true_probs=true_probs, push_probs=push_probs
+            )
+        results: List[CachedAnalysis | None] = [None] * len(rows)
+        for pos, (row, dist, edge) in enumerate(zip(batch, true_dists, edges)):
+            results[row] = CachedAnalysis(distribution=dist, edge=edge)
+            if cache is not None:
+                cache.put(keys[pos], results[row])
+        for row, hit in cached.items():
+            results[row] = hit
+        if METRICS.enabled:
+            METRICS.inc("games_analyzed", len(rows))
+            METRICS.inc("edges_found", sum(result.edge is not None for result in results))
+        with MEMORY.stage("rows"):
+            return [
+                PricedGame(slate=slate, idx=idx, distribution=result.distribution, edge=result.edge)
+                for (slate, idx), result in zip(rows, results)
+            ]
+
+    def _fetch_stats(self, teams: set, sport: str) -> Dict[str, Dict[str, float]]:
+        with METRICS.timer("stats_fetch"):
+            fetch_many = getattr(self.stats, "fetch_team_stats_many", None)
+            if fetch_many is not None:
+                return fetch_many(teams, sport)
+            return {team: self.stats.fetch_team_stats(team, sport=sport) for team in teams}
+
+
+__all__: List[str] = ["GameInfo", "PricedGame", "SlatePricer", "TotalsAnalyzer"]
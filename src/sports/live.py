@@ -0,0 +1,168 @@
+"""In-play totals pricing rescaled from the pregame model.
+
+``LiveTotalsModel`` computes each team's pregame scoring rate once and, on
+every feed update, scales it to the time left: the remaining total has mean
+``rate * fraction_left`` (plus the value of the current possession) and, for
+simulated sports, std ``pregame_std * sqrt(fraction_left)``. Count sports use
+the exact Poisson PMF of the remaining goals. Nothing is re-simulated, so an
+update is priced in well under a millisecond.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterable, List
+import math
+import time
+
+try:
+    from ..edge.detector import EdgeDetector, EdgeResult
+except ImportError:  # Allows importing when src/ is on sys.path directly
+    from edge.detector import EdgeDetector, EdgeResult
+from .generic import TotalsAnalyzer
+from .profiles import SportProfile
+
+
+@dataclass(frozen=True)
+class LiveGameState:
+    """Feed snapshot. ``period`` and ``minutes_remaining`` order updates."""
+
+    home_score: int
+    away_score: int
+    minutes_remaining: float
+    period: int = 1
+    possession: str | None = None
+
+    @property
+    def total(self) -> int:
+        return self.home_score + self.away_score
+
+    def clock_key(self) -> tuple[int, float]:
+        return self.period, -self.minutes_remaining
+
+
+@dataclass
+class LivePrice:
+    state: LiveGameState
+    line: float
+    mean: float
+    std: float
+    prob_over: float
+    prob_under: float
+    prob_push: float
+    edge: EdgeResult | None
+    elapsed: float = 0.0
+
+
+class LiveTotalsModel:
+    """Re-price a live total from the pregame rates and the current game state."""
+
+    def __init__(
+        self,
+        profile: SportProfile,
+        home_mean: float,
+        away_mean: float,
+        total_std: float,
+        detector: EdgeDetector | None = None,
+    ):
+        self.profile = profile
+        self.home_mean = home_mean
+        self.away_mean = away_mean
+        self.total_std = total_std
+        self.detector = detector or EdgeDetector()
+        self.state: LiveGameState | None = None
+
+    @classmethod
+    def from_pregame(
+        cls,
+        analyzer: TotalsAnalyzer,
+        home_team: str,
+        away_team: str,
+        injuries: Iterable[dict] | None = None,
+        sport: str | None = None,
+    ) -> "LiveTotalsModel":
+        sport = sport or analyzer.profile.code
+        home_stats = analyzer.stats.fetch_team_stats(home_team, sport=sport)
+        away_stats = analyzer.stats.fetch_team_stats(away_team, sport=sport)
+        mean, std = analyzer.simulator.adjusted_moments(
+            analyzer.profile.base_mean(home_stats, away_stats),
+            analyzer.profile.base_std,
+            injuries,
+            (home_stats["pace"] + away_stats["pace"]) / 2,
+        )
+        home_mean, away_mean = analyzer.profile.team_means(mean, home_stats, away_stats)
+        return cls(analyzer.profile, home_mean, away_mean, std, detector=analyzer.detector)
+
+    def update(self, state: LiveGameState) -> bool:
+        """Accept ``state`` unless it is older than the last one seen (out-of-order feed)."""
+        if self.state is not None and state.clock_key() < self.state.clock_key():
+            return False
+        self.state = state
+        return True
+
+    def remaining_means(self, state: LiveGameState) -> tuple[float, float]:
+        fraction = self._fraction_left(state)
+        home, away = self.home_mean * fraction, self.away_mean * fraction
+        if fraction > 0 and state.possession == "home":
+            home += self.profile.possession_value
+        elif fraction > 0 and state.possession == "away":
+            away += self.profile.possession_value
+        return home, away
+
+    def price(self, line: float, over_odds: int, under_odds: int, state: LiveGameState | None = None) -> LivePrice:
+        """Price the live total for ``state`` (default: the last accepted update)."""
+        started = time.perf_counter()
+        if state is not None:
+            self.update(state)
+        state = self.state
+        if state is None:
+            raise ValueError("No live state; call update() first")
+
+        home, away = self.remaining_means(state)
+        needed = line - state.total
+        if self.profile.is_discrete:
+            pmf = self.profile.discrete_model().score_pmf(home, away)
+            over, under, push = pmf.prob_over(needed), pmf.prob_under(needed), pmf.prob_push(needed)
+            mean, std = state.total + pmf.mean, pmf.std
+        else:
+            mean = state.total + home + away
+            std = self.total_std * math.sqrt(self._fraction_left(state))
+            over, under, push = _normal_outcome(home + away, std, needed)
+
+        candidates = (
+            self.detector.detect_outcome("OVER", line, over_odds, over, push),
+            self.detector.detect_outcome("UNDER", line, under_odds, under, push),
+        )
+        edges = [edge for edge in candidates if edge is not None]
+        edge = max(edges, key=lambda e: e.expected_value) if edges else None
+        return LivePrice(
+            state=state,
+            line=line,
+            mean=mean,
+            std=std,
+            prob_over=over,
+            prob_under=under,
+            prob_push=push,
+            edge=edge,
+            elapsed=time.perf_counter() - started,
+        )
+
+    def _fraction_left(self, state: LiveGameState) -> float:
+        return max(0.0, min(1.0, state.minutes_remaining / self.profile.game_minutes))
+
+
+def _normal_outcome(mean: float, std: float, needed: float) -> tuple[float, float, float]:
+    """Over/under/push for a whole-number score with a normal remaining total."""
+    if std <= 0:
+        return float(mean > needed), float(mean < needed), float(mean == needed)
+
+    def cdf(x: float) -> float:
+        return 0.5 * math.erfc((mean - x) / (std * math.sqrt(2)))
+
+    if needed == int(needed):
+        # Continuity correction: the whole-number total lands on the line.
+        over, under = 1 - cdf(needed + 0.5), cdf(needed - 0.5)
+        return over, under, max(0.0, 1 - over - under)
+    return 1 - cdf(needed), cdf(needed), 0.0
+
+
+__all__: List[str] = ["LiveGameState", "LivePrice", "LiveTotalsModel"]
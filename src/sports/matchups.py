@@ -0,0 +1,159 @@
+"""All-pairs matchup matrix for pricing hypothetical games in O(1).
+
+``MatchupMatrix.build`` fills N×N expected-total and std planes for a whole
+league from the team stats vectors (home team on rows, away team on columns)
+and ``save`` writes them as native float32. ``MatchupMatrix.load``
+memory-maps that file, so a 361-team college basketball matrix costs ~1 MB on
+disk and nothing is parsed up front; every lookup is a single index.
+"""
+from __future__ import annotations
+
+from array import array
+from typing import Iterable, List, Sequence
+import json
+import math
+import mmap
+import struct
+
+try:
+    from ..data.stats_fetcher import StatsFetcher
+    from ..data.team_registry import TEAM_ALIASES, TeamIndex, teams_for_sport
+    from ..models.causal_graph import pace_adjustment
+    from ..models.discrete import poisson_pmf
+except ImportError:  # Allows importing when src/ is on sys.path directly
+    from data.stats_fetcher import StatsFetcher
+    from data.team_registry import TEAM_ALIASES, TeamIndex, teams_for_sport
+    from models.causal_graph import pace_adjustment
+    from models.discrete import poisson_pmf
+from .profiles import SportProfile, profile_for
+
+_MAGIC = b"MTXM"
+_VERSION = 1
+# magic, version, team count, metadata length
+_HEADER = struct.Struct("<4sIII")
+
+
+class MatchupMatrix:
+    """Expected total and std for every (home, away) pair in a league."""
+
+    def __init__(self, profile: SportProfile, teams: Sequence[str], means, stds, sport: str | None = None):
+        self.profile = profile
+        self.sport = sport or profile.code
+        self.teams = list(teams)
+        self.index = TeamIndex(self.sport, self.teams, TEAM_ALIASES.get(self.sport))
+        self._means = means
+        self._stds = stds
+        self._mmap: mmap.mmap | None = None
+        self._file = None
+
+    @classmethod
+    def build(
+        cls,
+        sport: str,
+        teams: Iterable[str] | None = None,
+        stats_fetcher: StatsFetcher | None = None,
+    ) -> "MatchupMatrix":
+        """Compute both planes row by row from the league's stats vectors."""
+        profile = profile_for(sport)
+        teams = list(teams) if teams is not None else teams_for_sport(sport)
+        fetcher = stats_fetcher or StatsFetcher()
+        fetch_many = getattr(fetcher, "fetch_team_stats_many", None)
+        if fetch_many is not None:
+            stats = fetch_many(teams, sport)
+        else:
+            stats = {team: fetcher.fetch_team_stats(team, sport=sport) for team in teams}
+
+        offense = [stats[team]["offensive_rating"] for team in teams]
+        pace = [stats[team]["pace"] for team in teams]
+        scale = 0.5 if profile.combine == "mean" else 1.0
+        means, stds = array("f"), array("f")
+        # Mirrors MonteCarloSimulator.adjusted_moments without injuries.
+        for home_off, home_pace in zip(offense, pace):
+            adjustments = [
+                pace_adjustment((home_pace + away_pace) / 2) if home_pace + away_pace else 1.0 for away_pace in pace
+            ]
+            means.extend((home_off + away_off) * scale * adj for away_off, adj in zip(offense, adjustments))
+            stds.extend(profile.base_std * adj for adj in adjustments)
+        return cls(profile, teams, means, stds, sport=sport)
+
+    @classmethod
+    def load(cls, path: str) -> "MatchupMatrix":
+        """Memory-map a matrix written by ``save``."""
+        handle = open(path, "rb")
+        try:
+            mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except BaseException:
+            handle.close()
+            raise
+        magic, version, count, meta_len = _HEADER.unpack_from(mapped, 0)
+        if magic != _MAGIC or version != _VERSION:
+            mapped.close()
+            handle.close()
+            raise ValueError(f"{path} is not a version {_VERSION} matchup matrix")
+        meta = json.loads(mapped[_HEADER.size:_HEADER.size + meta_len].decode("utf-8"))
+        start = _data_offset(meta_len)
+        plane = count * count * 4
+        view = memoryview(mapped)
+        means = view[start:start + plane].cast("f")
+        stds = view[start + plane:start + 2 * plane].cast("f")
+        profile = SportProfile(**meta["profile"])
+        matrix = cls(profile, meta["teams"], means, stds, sport=meta["sport"])
+        matrix._mmap, matrix._file = mapped, handle
+        return matrix
+
+    def save(self, path: str) -> None:
+        meta = json.dumps(
+            {"sport": self.sport, "teams": self.teams, "profile": vars(self.profile)}, separators=(",", ":")
+        ).encode("utf-8")
+        with open(path, "wb") as handle:
+            handle.write(_HEADER.pack(_MAGIC, _VERSION, len(self.teams), len(meta)))
+            handle.write(meta)
+            handle.write(b"\0" * (_data_offset(len(meta)) - _HEADER.size - len(meta)))
+            for plane in (self._means, self._stds):
+                handle.write(array("f", plane).tobytes())
+
+    def close(self) -> None:
+        if self._mmap is not None:
+            self._means.release()
+            self._stds.release()
+            self._means = self._stds = None
+            self._mmap.close()
+            self._file.close()
+            self._mmap = self._file = None
+
+    def __enter__(self) -> "MatchupMatrix":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.teams)
+
+    def moments(self, home_team: str, away_team: str) -> tuple[float, float]:
+        cell = self._cell(home_team, away_team)
+        return float(self._means[cell]), float(self._stds[cell])
+
+    def prob_over(self, home_team: str, away_team: str, line: float) -> float:
+        """P(total > line): normal tail, or the exact Poisson total for count sports."""
+        mean, std = self.moments(home_team, away_team)
+        if self.profile.is_discrete:
+            # Ignores the Dixon-Coles tweak, which only moves the 0-2 goal cells slightly.
+            pmf = poisson_pmf(mean, int(math.floor(line)) + 1)
+            return max(0.0, 1.0 - math.fsum(pmf))
+        return 0.5 * math.erfc((line - mean) / (std * math.sqrt(2)))
+
+    def _cell(self, home_team: str, away_team: str) -> int:
+        home, away = self.index.resolve(home_team), self.index.resolve(away_team)
+        if home is None or away is None:
+            missing = home_team if home is None else away_team
+            raise KeyError(f"{missing} is not in the {self.sport} matchup matrix")
+        return home * len(self.teams) + away
+
+
+def _data_offset(meta_len: int) -> int:
+    # Keep the float planes 4-byte aligned so memoryview.cast is valid.
+    return (_HEADER.size + meta_len + 3) // 4 * 4
+
+
+__all__: List[str] = ["MatchupMatrix"]
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+from typing import Dict, List, Tuple
+
+try:
+    from ..models.discrete import DiscreteScoreModel
+except ImportError:  # Allows importing when src/ is on sys.path directly
+    from models.discrete import DiscreteScoreModel
+
+
+@dataclass(frozen=True)
+class SportProfile:
+    """Per-sport constants for the totals model.
+
+    ``combine`` is how the two offensive ratings become the base mean: basketball
+    ratings are per-100-possession efficiencies and are averaged, the other
+    sports store points/goals per team and are summed. ``scoring`` is
+    ``"normal"`` for the simulated Gaussian total or a ``DiscreteScoreModel``
+    family for exact count models, with ``rho`` the Dixon-Coles correction.
+    ``correlation`` links the two simulated team scores (shared pace/game state).
+    ``game_minutes`` and ``possession_value`` (expected points of the current
+    possession) drive the live in-game model.
+    """
+
+    code: str
+    base_std: float
+    combine: str = "sum"
+    scoring: str = "normal"
+    rho: float = 0.0
+    correlation: float = 0.0
+    game_minutes: float = 60.0
+    possession_value: float = 0.0
+
+    def base_mean(self, home_stats: Dict[str, float], away_stats: Dict[str, float]) -> float:
+        total = home_stats["offensive_rating"] + away_stats["offensive_rating"]
+        return total / 2 if self.combine == "mean" else total
+
+    def team_means(
+        self, total_mean: float, home_stats: Dict[str, float], away_stats: Dict[str, float]
+    ) -> Tuple[float, float]:
+        """Split an expected total between the teams in proportion to their offence."""
+        home_off, away_off = home_stats["offensive_rating"], away_stats["offensive_rating"]
+        share = home_off / (home_off + away_off) if home_off + away_off > 0 else 0.5
+        return total_mean * share, total_mean * (1 - share)
+
+    @property
+    def is_discrete(self) -> bool:
+        return self.scoring != "normal"
+
+    def discrete_model(self) -> DiscreteScoreModel:
+        return DiscreteScoreModel(family=self.scoring, rho=self.rho)
+
+
+SOCCER_LEAGUES: List[str] = [
+    "soccer_epl",
+    "soccer_laliga",
+    "soccer_bundesliga",
+    "soccer_serie_a",
+    "soccer_ligue1",
+    "soccer_champions_league",
+]
+
+SPORT_PROFILES: Dict[str, SportProfile] = {
+    "basketball_nba": SportProfile(
+        "basketball_nba", base_std=12.0, combine="mean", correlation=0.3, game_minutes=48.0, possession_value=1.1
+    ),
+    "basketball_cbb_division1": SportProfile(
+        "basketball_cbb_division1",
+        base_std=10.0,
+        combine="mean",
+        correlation=0.3,
+        game_minutes=40.0,
+        possession_value=1.0,
+    ),
+    "football_nfl": SportProfile("football_nfl", base_std=9.5, correlation=0.1, possession_value=2.0),
+    "football_cfb_fbs": SportProfile("football_cfb_fbs", base_std=11.0, correlation=0.1, possession_value=2.3),
+    "hockey_nhl": SportProfile("hockey_nhl", base_std=1.8, scoring="poisson"),
+    **{
+        league: SportProfile(league, base_std=0.85, scoring="poisson", rho=-0.1, game_minutes=90.0)
+        for league in SOCCER_LEAGUES
+    },
+}
+
+
+def profile_for(sport: str) -> SportProfile:
+    profile = SPORT_PROFILES.get(sport)
+    if profile is not None:
+        return profile
+    if sport.startswith("soccer_"):
+        epl = SPORT_PROFILES["soccer_epl"]
+        return replace(epl, code=sport)
+    # Default to the NBA profile to keep demos running even if the sport code is new
+    return SPORT_PROFILES["basketball_nba"]
+
+
+__all__: List[str] = ["SOCCER_LEAGUES", "SPORT_PROFILES", "SportProfile", "profile_for"]
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Dict, Hashable, Iterable, List, Set, Tuple
+import time
+
+try:
+    from ..edge.detector import EdgeResult
+except ImportError:  # Allows importing when src/ is on sys.path directly
+    from edge.detector import EdgeResult
+
+
+Dependency = Tuple[Hashable, ...]
+
+
+def game_dependencies(sport: str, game: dict) -> Set[Dependency]:
+    """Inputs an ``analyze_game`` result depends on: team stats, injuries and the market line.
+
+    Injuries are keyed by team, not player: any player's news changes every
+    game their team plays, so a per-player key could not narrow the set.
+    """
+    deps: Set[Dependency] = {("line", game["game_id"])}
+    for team in (game["home_team"], game["away_team"]):
+        deps.add(("stats", sport, team))
+        deps.add(("injuries", sport, team))
+    return deps
+
+
+@dataclass
+class RecomputeReport:
+    trigger: str
+    recomputed: int
+    game_ids: List[str] = field(default_factory=list)
+    elapsed: float = 0.0
+
+
+class TrackedSlate:
+    """A sport's slate of priced games that re-prices only what an update touches.
+
+    Each result is stored with the set of inputs it was computed from and a
+    reverse index from input to games, so an injury, stats or line update
+    recomputes just the dependent games and reports how many that was.
+    """
+
+    def __init__(self, analyzer, sport: str):
+        self.analyzer = analyzer
+        self.sport = sport
+        self.games: Dict[str, dict] = {}
+        self.results: Dict[str, EdgeResult | None] = {}
+        self.injuries: Dict[str, List[dict]] = {}
+        self.total_recomputed = 0
+        self._deps: Dict[str, Set[Dependency]] = {}
+        self._dependents: Dict[Dependency, Set[str]] = {}
+
+    def edges(self) -> Dict[str, EdgeResult]:
+        return {game_id: edge for game_id, edge in self.results.items() if edge is not None}
+
+    def dependencies(self, game_id: str) -> Set[Dependency]:
+        return set(self._deps.get(game_id, ()))
+
+    def add_games(self, games: Iterable[dict]) -> RecomputeReport:
+        game_ids = []
+        for game in games:
+            self.games[game["game_id"]] = {k: v for k, v in game.items() if k != "injuries"}
+            game_ids.append(game["game_id"])
+        return self._recompute("add_games", game_ids)
+
+    def remove_game(self, game_id: str) -> None:
+        self.games.pop(game_id, None)
+        self.results.pop(game_id, None)
+        self._unlink(game_id)
+
+    def update_line(self, game_id: str, **prices) -> RecomputeReport:
+        """Apply new ``total_line``/``over_odds``/``under_odds`` values to one game."""
+        self.games[game_id].update(prices)
+        return self._recompute("line", self._dependents_of(("line", game_id)))
+
+    def update_injuries(self, team: str, injuries: Iterable[dict]) -> RecomputeReport:
+        """Replace ``team``'s injury report and re-price that team's games."""
+        self.injuries[team] = [{**injury, "team": team} for injury in injuries]
+        return self._recompute("injuries", self._dependents_of(("injuries", self.sport, team)))
+
+    def update_team_stats(self, team: str, stats: Dict[str, float]) -> RecomputeReport:
+        self.analyzer.stats.update_team_stats(team, self.sport, stats)
+        return self._recompute("stats", self._dependents_of(("stats", self.sport, team)))
+
+    def _dependents_of(self, dep: Dependency) -> List[str]:
+        return sorted(self._dependents.get(dep, ()))
+
+    def _recompute(self, trigger: str, game_ids: List[str]) -> RecomputeReport:
+        start = time.perf_counter()
+        for game_id in game_ids:
+            game = self.games[game_id]
+            injuries = self.injuries.get(game["home_team"], []) + self.injuries.get(game["away_team"], [])
+            payload = {**game, "injuries": [{k: v for k, v in i.items() if k != "team"} for i in injuries]}
+            self.results[game_id] = self.analyzer.analyze_game(**payload, sport=self.sport)
+            self._link(game_id, game_dependencies(self.sport, game))
+        self.total_recomputed += len(game_ids)
+        return RecomputeReport(
+            trigger=trigger, recomputed=len(game_ids), game_ids=game_ids, elapsed=time.perf_counter() - start
+        )
+
+    def _link(self, game_id: str, deps: Set[Dependency]) -> None:
+        self._unlink(game_id)
+        self._deps[game_id] = deps
+        for dep in deps:
+            self._dependents.setdefault(dep, set()).add(game_id)
+
+    def _unlink(self, game_id: str) -> None:
+        for dep in self._deps.pop(game_id, ()):
+            dependents = self._dependents.get(dep)
+            if dependents is not None:
+                dependents.discard(game_id)
+                if not dependents:
+                    del self._dependents[dep]
+
+
+__all__: List[str] = ["RecomputeReport", "TrackedSlate", "game_dependencies"]
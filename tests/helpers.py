@@ -0,0 +1,19 @@
+"""Small fakes and factories shared by the test modules."""
+from src.edge.detector import EdgeResult
+from src.scanner import EdgeSummary
+
+
+class FakeClock:
+    """Callable clock for code that takes ``clock=``; tests move ``now`` by hand."""
+
+    def __init__(self, now=0.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def summary(game_id, ev, line=215.5, sport="basketball_nba"):
+    """An OVER ``EdgeSummary`` for ``game_id`` with expected value ``ev``."""
+    edge = EdgeResult("OVER", line, ev, 0.02, 0.55, 0.52, 0.3)
+    return EdgeSummary(sport=sport, game_id=game_id, matchup=f"Away {game_id} @ Home", edge=edge)
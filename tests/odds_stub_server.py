@@ -0,0 +1,89 @@
+"""Local HTTP odds provider used by the async client tests."""
+import asyncio
+import hashlib
+import json
+import threading
+import time
+
+
+class StubOddsServer:
+    """Serve ``/sports/<sport>/odds`` from a background event loop.
+
+    ``delays`` maps sport codes to artificial response latency in seconds and
+    ``failures`` maps sport codes to how many leading requests return HTTP 503.
+    Responses carry an ``ETag`` and honour ``If-None-Match`` with a 304.
+    Use as a context manager; ``base_url`` is available once started.
+    """
+
+    def __init__(self, games_by_sport, delays=None, failures=None):
+        self.games_by_sport = games_by_sport
+        self.delays = dict(delays or {})
+        self.failures = dict(failures or {})
+        self.connections = 0
+        self.requests = []
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._server = None
+        self.base_url = ""
+
+    def __enter__(self):
+        self._thread.start()
+        self._server = asyncio.run_coroutine_threadsafe(
+            asyncio.start_server(self._handle, "127.0.0.1", 0), self._loop
+        ).result()
+        port = self._server.sockets[0].getsockname()[1]
+        self.base_url = f"http://127.0.0.1:{port}"
+        return self
+
+    def __exit__(self, *exc):
+        async def shutdown():
+            self._server.close()
+            await self._server.wait_closed()
+
+        asyncio.run_coroutine_threadsafe(shutdown(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    async def _handle(self, reader, writer):
+        self.connections += 1
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b""):
+                        break
+                    name, _, value = line.decode().partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                path = request_line.decode().split(" ")[1].split("?")[0]
+                self.requests.append((time.monotonic(), path))
+                status, body = await self._respond(path)
+                payload = json.dumps(body).encode()
+                etag = '"' + hashlib.sha1(payload).hexdigest() + '"'
+                if status.startswith("200") and headers.get("if-none-match") == etag:
+                    status, payload = "304 Not Modified", b""
+                writer.write(
+                    f"HTTP/1.1 {status}\r\nContent-Type: application/json\r\nETag: {etag}\r\n"
+                    f"Content-Length: {len(payload)}\r\n\r\n".encode()
+                    + payload
+                )
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def _respond(self, path):
+        parts = path.strip("/").split("/")
+        if len(parts) != 3 or parts[0] != "sports" or parts[2] != "odds":
+            return "404 Not Found", {"error": "unknown path"}
+        sport = parts[1]
+        await asyncio.sleep(self.delays.get(sport, 0.0))
+        if self.failures.get(sport, 0) > 0:
+            self.failures[sport] -= 1
+            return "503 Service Unavailable", {"error": "try again"}
+        return "200 OK", self.games_by_sport.get(sport, [])
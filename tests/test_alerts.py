@@ -0,0 +1,97 @@
+import asyncio
+import os
+import pathlib
+import sys
+import tempfile
+import unittest
+
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.alerts import AlertDispatcher, SubscriptionStore, diff_edges, pack_messages
+from src.board import EdgeBoard
+from tests.helpers import summary
+
+
+class TestAlerts(unittest.TestCase):
+    def test_diff_reports_only_new_and_material_changes(self):
+        before = [summary("g1", 0.05), summary("g2", 0.06), summary("g3", 0.04)]
+        after = [summary("g1", 0.055), summary("g2", 0.08), summary("g3", 0.04, line=216.5), summary("g4", 0.05)]
+        changes = diff_edges(before, after, ev_tolerance=0.01)
+        self.assertEqual([e.game_id for e in changes.new], ["g4"])
+        self.assertEqual([e.game_id for e in changes.changed], ["g2", "g3"])
+        self.assertEqual(diff_edges(after, after[:1]).removed, after[1:])
+
+    def test_plan_filters_by_subscription_and_batches_per_channel(self):
+        store = SubscriptionStore()
+        store.subscribe(1, "basketball_nba", 0.03)
+        store.subscribe(2, "basketball_nba", 0.07)
+        store.subscribe(3, "hockey_nhl", 0.0)
+        dispatcher = AlertDispatcher(store, send=None)
+
+        self.assertEqual(dispatcher.plan("basketball_nba", None, [summary("g1", 0.05)]), {})
+        plan = dispatcher.plan("basketball_nba", [summary("g1", 0.05)], [summary("g1", 0.09), summary("g2", 0.04)])
+        self.assertEqual(set(plan), {1, 2})
+        self.assertEqual(len(plan[1]), 1)
+        self.assertIn("g1", plan[1][0])
+        self.assertIn("g2", plan[1][0])
+        self.assertNotIn("g2", plan[2][0])
+
+    def test_edge_crossing_a_threshold_is_new_to_that_channel(self):
+        store = SubscriptionStore()
+        store.subscribe(1, "basketball_nba", 0.04)
+        store.subscribe(2, "basketball_nba", 0.03)
+        dispatcher = AlertDispatcher(store, send=None, ev_tolerance=0.01)
+
+        plan = dispatcher.plan("basketball_nba", [summary("g1", 0.038)], [summary("g1", 0.042)])
+        self.assertEqual(list(plan), [1])
+        self.assertIn("New", plan[1][0])
+        self.assertEqual(dispatcher.plan("basketball_nba", [summary("g1", 0.042)], [summary("g1", 0.045)]), {})
+
+    def test_pack_messages_respects_discord_limit(self):
+        messages = pack_messages(["x" * 900] * 5, limit=2000)
+        self.assertEqual([len(m) for m in messages], [1801, 1801, 900])
+        self.assertEqual(pack_messages(["y" * 2500])[0], "y" * 2000)
+
+    def test_subscriptions_persist(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "subs.json")
+            store = SubscriptionStore(path)
+            store.subscribe(10, "soccer_epl", 0.05)
+            store.subscribe(10, "hockey_nhl", 0.04)
+            store.subscribe(11, "soccer_epl", 0.05)
+            self.assertEqual(store.unsubscribe(10, "hockey_nhl"), 1)
+            reloaded = SubscriptionStore(path)
+            self.assertEqual(len(reloaded), 2)
+            self.assertEqual([sub.sport for sub in reloaded.for_channel(10)], ["soccer_epl"])
+
+    def test_board_refreshes_push_incremental_alerts(self):
+        sent = []
+
+        async def send(channel_id, message):
+            sent.append((channel_id, message))
+
+        slates = iter([[summary("g1", 0.05)], [summary("g1", 0.05), summary("g2", 0.06)], [summary("g2", 0.06)]])
+
+        async def fetch(sport):
+            return next(slates)
+
+        store = SubscriptionStore()
+        store.subscribe(7, "basketball_nba", 0.03)
+        board = EdgeBoard(fetch, ["basketball_nba"])
+        board.add_listener(AlertDispatcher(store, send, send_interval=0.0).on_board_update)
+
+        async def scenario():
+            for _ in range(3):
+                await board.refresh("basketball_nba")
+                await asyncio.sleep(0)
+
+        asyncio.run(scenario())
+        self.assertEqual(len(sent), 1)
+        self.assertEqual(sent[0][0], 7)
+        self.assertIn("g2", sent[0][1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+import asyncio
+import pathlib
+import sys
+import time
+import unittest
+
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.data.async_odds_client import AsyncOddsClient, OddsClientError, ProviderConfig, TokenBucket
+from src.data.odds_scraper import OddsScraper
+from tests.odds_stub_server import StubOddsServer
+
+
+def _games(sport, count=2):
+    return [
+        {
+            "game_id": f"{sport}_{idx}",
+            "home_team": f"Home {idx}",
+            "away_team": f"Away {idx}",
+            "total_line": 44.5,
+            "over_odds": -110,
+            "under_odds": -105,
+        }
+        for idx in range(count)
+    ]
+
+
+SPORTS = ["basketball_nba", "football_nfl", "hockey_nhl", "soccer_epl"]
+
+
+class TestAsyncOddsClient(unittest.TestCase):
+    def test_fetch_all_runs_sports_concurrently(self):
+        delays = {sport: 0.2 for sport in SPORTS}
+        with StubOddsServer({sport: _games(sport) for sport in SPORTS}, delays=delays) as server:
+            client = AsyncOddsClient(ProviderConfig(name="stub", base_url=server.base_url, requests_per_second=100))
+            with OddsScraper(client=client) as scraper:
+                start = time.perf_counter()
+                odds = scraper.fetch_all_odds(SPORTS)
+                elapsed = time.perf_counter() - start
+
+        self.assertEqual(sorted(odds), sorted(SPORTS))
+        self.assertEqual(odds["hockey_nhl"][1]["game_id"], "hockey_nhl_1")
+        self.assertLess(elapsed, 0.2 * len(SPORTS) * 0.75)
+
+    def test_connections_are_reused_across_requests(self):
+        with StubOddsServer({"football_nfl": _games("football_nfl")}) as server:
+            client = AsyncOddsClient(ProviderConfig(name="stub", base_url=server.base_url, requests_per_second=100))
+
+            async def sequential():
+                for _ in range(5):
+                    await client.fetch_sport("football_nfl")
+                await client.close()
+
+            asyncio.run(sequential())
+            self.assertEqual(server.connections, 1)
+            self.assertEqual(len(server.requests), 5)
+
+    def test_scraper_keeps_connections_between_calls(self):
+        with StubOddsServer({"football_nfl": _games("football_nfl")}) as server:
+            client = AsyncOddsClient(ProviderConfig(name="stub", base_url=server.base_url, requests_per_second=100))
+            with OddsScraper(client=client) as scraper:
+                for _ in range(3):
+                    scraper.fetch_odds_api("football_nfl")
+                scraper.fetch_all_odds(["football_nfl"])
+            self.assertEqual(server.connections, 1)
+            self.assertEqual(len(server.requests), 4)
+
+    def test_transient_failures_are_retried(self):
+        with StubOddsServer({"soccer_epl": _games("soccer_epl")}, failures={"soccer_epl": 2}) as server:
+            client = AsyncOddsClient(
+                ProviderConfig(name="stub", base_url=server.base_url, requests_per_second=100), backoff=0.01
+            )
+            with OddsScraper(client=client) as scraper:
+                games = scraper.fetch_odds_api("soccer_epl", max_games=1)
+            self.assertEqual(len(games), 1)
+            self.assertEqual(len(server.requests), 3)
+
+        with StubOddsServer({"soccer_epl": []}, failures={"soccer_epl": 10}) as server:
+            client = AsyncOddsClient(
+                ProviderConfig(name="stub", base_url=server.base_url), max_retries=1, backoff=0.01
+            )
+            with OddsScraper(client=client) as scraper, self.assertRaises(OddsClientError):
+                scraper.fetch_odds_api("soccer_epl")
+
+    def test_fetch_all_keeps_sports_that_succeeded(self):
+        games = {sport: _games(sport) for sport in SPORTS}
+        with StubOddsServer(games, failures={"hockey_nhl": 10}) as server:
+            client = AsyncOddsClient(
+                ProviderConfig(name="stub", base_url=server.base_url, requests_per_second=100),
+                max_retries=1,
+                backoff=0.01,
+            )
+            with OddsScraper(client=client) as scraper, self.assertLogs("src.data.async_odds_client", "WARNING"):
+                odds = scraper.fetch_all_odds(SPORTS)
+
+        self.assertEqual(sorted(odds), sorted(set(SPORTS) - {"hockey_nhl"}))
+        self.assertEqual(list(client.errors), ["hockey_nhl"])
+        self.assertIsInstance(client.errors["hockey_nhl"], OddsClientError)
+
+    def test_token_bucket_limits_request_rate(self):
+        async def drain():
+            bucket = TokenBucket(rate=20.0, capacity=1.0)
+            start = asyncio.get_running_loop().time()
+            for _ in range(5):
+                await bucket.acquire()
+            return asyncio.get_running_loop().time() - start
+
+        self.assertGreaterEqual(asyncio.run(drain()), 4 / 20.0 * 0.9)
+
+
+if __name__ == "__main__":
+    unittest.main()
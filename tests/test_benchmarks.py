@@ -0,0 +1,77 @@
+import contextlib
+import io
+import pathlib
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from benchmarks import harness
+from benchmarks import __main__ as cli
+from benchmarks.__main__ import main
+from benchmarks.cases import ANALYZE_SPORTS, all_cases
+
+
+def report(**medians):
+    return {"environment": {}, "results": {key: {"median": value} for key, value in medians.items()}}
+
+
+class TestBenchmarks(unittest.TestCase):
+    def test_compare_flags_regressions_and_improvements(self):
+        rows = harness.compare(
+            report(a=1.0, b=1.0, c=1.0, gone=1.0),
+            report(a=1.1, b=1.5, c=0.5, added=2.0),
+            threshold=0.15,
+        )
+        self.assertEqual(
+            {row.key: row.status for row in rows},
+            {"a": "same", "b": "regression", "c": "improvement", "gone": "missing", "added": "new"},
+        )
+
+    def test_cases_cover_hot_paths_and_sweeps(self):
+        keys = [case.key for case in all_cases()]
+        self.assertEqual(len(keys), len(set(keys)))
+        for sport in ANALYZE_SPORTS:
+            self.assertIn(f"analyze_game[sport={sport},num_paths=5000]", keys)
+        self.assertIn("simulator.simulate_total_points[num_paths=20000]", keys)
+        self.assertIn("slate_pricer.price_slates[slate=1000]", keys)
+
+    def test_run_then_compare_against_itself(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = f"{tmp}/current.json"
+            with contextlib.redirect_stderr(io.StringIO()):
+                self.assertEqual(main(["run", "--quick", "--filter", "compute_metrics[n=250]", "--output", path]), 0)
+            current = harness.load(path)
+            self.assertEqual(list(current["results"]), ["backtest.compute_metrics[n=250]"])
+            self.assertGreater(current["results"]["backtest.compute_metrics[n=250]"]["median"], 0)
+
+            slower = report(**{"backtest.compute_metrics[n=250]": 1e-9})
+            slower["environment"] = current["environment"]
+            harness.save(slower, f"{tmp}/baseline.json")
+            out = io.StringIO()
+            with contextlib.redirect_stdout(out), contextlib.redirect_stderr(io.StringIO()):
+                self.assertEqual(main(["compare", f"{tmp}/baseline.json", path]), 1)
+                self.assertEqual(main(["compare", path, path]), 0)
+            self.assertIn("regression", out.getvalue())
+
+    def test_run_compare_writes_the_scratch_report(self):
+        key = "backtest.compute_metrics[n=250]"
+        with tempfile.TemporaryDirectory() as tmp:
+            baseline = f"{tmp}/baseline.json"
+            harness.save(report(**{key: 1e6}), baseline)
+            scratch = f"{tmp}/current.json"
+            with mock.patch.object(cli, "DEFAULT_OUTPUT", scratch), contextlib.redirect_stdout(io.StringIO()), \
+                    contextlib.redirect_stderr(io.StringIO()):
+                self.assertEqual(main(["run", "--quick", "--filter", "compute_metrics[n=250]", "--compare", baseline]), 0)
+                with self.assertRaises(SystemExit):
+                    main(["run", "--quick", "--compare", baseline, "--output", baseline])
+            self.assertEqual(harness.load(baseline)["results"][key]["median"], 1e6)
+            self.assertIn(key, harness.load(scratch)["results"])
+
+
+if __name__ == "__main__":
+    unittest.main()
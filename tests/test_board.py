@@ -0,0 +1,74 @@
+import asyncio
+import pathlib
+import sys
+import unittest
+
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.board import EdgeBoard, format_age
+from tests.helpers import FakeClock
+
+
+class TestEdgeBoard(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock(100.0)
+        self.calls = []
+        self.fail = False
+
+    async def fetch(self, sport):
+        self.calls.append(sport)
+        call = len(self.calls)
+        await asyncio.sleep(0.01)
+        if self.fail:
+            raise RuntimeError("provider down")
+        return [f"{sport}-edge-{call}"]
+
+    def test_concurrent_requests_share_one_scan_then_hit_cache(self):
+        board = EdgeBoard(self.fetch, ["basketball_nba"], clock=self.clock)
+
+        async def scenario():
+            snaps = await asyncio.gather(*(board.get("basketball_nba") for _ in range(10)))
+            self.clock.now += 45
+            cached = await board.get("basketball_nba")
+            return snaps, cached
+
+        snaps, cached = asyncio.run(scenario())
+        self.assertEqual(self.calls, ["basketball_nba"])
+        self.assertTrue(all(snap is snaps[0] for snap in snaps))
+        self.assertIs(cached, snaps[0])
+        self.assertEqual(board.age("basketball_nba"), 45)
+        self.assertEqual(format_age(45), "45s ago")
+
+    def test_failed_refresh_keeps_previous_snapshot(self):
+        board = EdgeBoard(self.fetch, ["hockey_nhl", "soccer_epl"], clock=self.clock)
+
+        async def scenario():
+            await board.refresh_all()
+            self.fail = True
+            await board.refresh_all()
+            return await board.get_all()
+
+        snaps = asyncio.run(scenario())
+        self.assertEqual([snap.edges for snap in snaps], [["hockey_nhl-edge-1"], ["soccer_epl-edge-2"]])
+        self.assertEqual(board.refreshes, 2)
+
+    def test_background_task_refreshes_until_stopped(self):
+        board = EdgeBoard(self.fetch, ["football_nfl"], refresh_interval=0.01, clock=self.clock)
+
+        async def scenario():
+            board.start()
+            await asyncio.sleep(0.08)
+            await board.stop()
+            count = len(self.calls)
+            await asyncio.sleep(0.03)
+            return count
+
+        count = asyncio.run(scenario())
+        self.assertGreaterEqual(count, 2)
+        self.assertEqual(len(self.calls), count)
+
+
+if __name__ == "__main__":
+    unittest.main()
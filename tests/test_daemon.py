@@ -0,0 +1,115 @@
+import pathlib
+import sys
+import unittest
+
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.daemon import ScanDaemon, rescan_interval, start_timestamp
+from src.data.odds_scraper import OddsScraper
+from tests.helpers import FakeClock
+
+
+class SlateScraper(OddsScraper):
+    def __init__(self, slates):
+        super().__init__()
+        self.slates = slates
+
+    def fetch_odds_api(self, sport="basketball_nba", max_games=None):
+        return [dict(game) for game in self.slates.get(sport, [])]
+
+
+def game(game_id, starts_at, total_line=215.5):
+    return {
+        "game_id": game_id,
+        "home_team": "Boston Celtics",
+        "away_team": "Miami Heat",
+        "total_line": total_line,
+        "over_odds": -110,
+        "under_odds": -110,
+        "commence_time": starts_at,
+    }
+
+
+class TestScanDaemon(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock(1_000_000.0)
+        self.cpu = iter(x * 0.05 for x in range(10_000))
+        self.slates = {
+            "basketball_nba": [game("soon", self.clock.now + 600), game("later", self.clock.now + 3 * 86400)]
+        }
+        self.daemon = ScanDaemon(
+            sports=["basketball_nba"],
+            scraper=SlateScraper(self.slates),
+            cpu_budget=0.25,
+            odds_interval=300,
+            min_interval=60,
+            max_interval=6 * 3600,
+            clock=self.clock,
+            cpu_clock=lambda: next(self.cpu),
+            sleep=lambda seconds: None,
+        )
+
+    def count_pricings(self, until, step=30):
+        priced = {"soon": 0, "later": 0}
+        original = self.daemon.pricer.price
+
+        def counting(games_by_sport):
+            for games in games_by_sport.values():
+                for g in games:
+                    priced[g["game_id"]] += 1
+            return original(games_by_sport)
+
+        self.daemon.pricer.price = counting
+        while self.clock.now < until:
+            self.daemon.run_cycle()
+            self.clock.now += step
+        return priced
+
+    def test_games_near_start_are_rescanned_more_often(self):
+        start = self.clock.now
+        priced = self.count_pricings(start + 590)
+        self.assertGreaterEqual(priced["soon"], 5)
+        self.assertEqual(priced["later"], 1)
+
+        # Once a game starts it drops out of the pregame rotation.
+        self.count_pricings(start + 700)
+        self.assertNotIn(("basketball_nba", "soon"), self.daemon.games)
+        self.assertIn(("basketball_nba", "later"), self.daemon.results)
+
+    def test_line_moves_and_removals_follow_the_odds_feed(self):
+        self.daemon.run_cycle()
+        self.clock.now += 10
+        self.slates["basketball_nba"] = [game("later", self.clock.now + 3 * 86400, total_line=220.5)]
+        self.clock.now += 300
+        report = self.daemon.run_cycle()
+        self.assertEqual(report.priced, 1)
+        self.assertEqual(list(self.daemon.results), [("basketball_nba", "later")])
+        self.assertEqual(self.daemon.results[("basketball_nba", "later")].game["total_line"], 220.5)
+
+    def test_idle_time_respects_cpu_budget(self):
+        report = self.daemon.run_cycle()
+        self.assertAlmostEqual(report.cpu_seconds, 0.05)
+        self.assertAlmostEqual(report.idle, 0.15)
+        self.assertGreater(self.daemon.seconds_until_due(), 0)
+
+    def test_wait_ignores_superseded_schedule_entries(self):
+        self.daemon.run_cycle()
+        key = ("basketball_nba", "later")
+        self.daemon._schedule(key, self.clock.now - 5)
+        self.daemon._schedule(key, self.clock.now + 200)
+        self.daemon._schedule(("basketball_nba", "soon"), self.clock.now + 250)
+        self.assertAlmostEqual(self.daemon.seconds_until_due(), 200)
+
+    def test_start_time_parsing_and_intervals(self):
+        self.assertEqual(start_timestamp({"commence_time": "1970-01-01T00:01:00Z"}), 60.0)
+        self.assertEqual(start_timestamp({"commence_time": 120}), 120.0)
+        self.assertIsNone(start_timestamp({}))
+        self.assertEqual(rescan_interval(300, 60, 3600), 60)
+        self.assertEqual(rescan_interval(7200, 60, 3600), 720)
+        self.assertEqual(rescan_interval(10 * 86400, 60, 3600), 3600)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+import math
+import pathlib
+import sys
+from statistics import NormalDist
+
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.edge.detector import EdgeDetector
+from src.models.discrete import DiscreteScoreModel, _fft_convolve, convolve, negative_binomial_pmf, poisson_pmf
+from src.models.distribution import Distribution
+from src.models.monte_carlo import MonteCarloSimulator
+from src.models.ot_engine import OTEngine
+from src.sports import NHLAnalyzer
+
+
+def test_fft_convolution_matches_direct_sum():
+    a = poisson_pmf(3.1, 40)
+    b = negative_binomial_pmf(2.4, 5.0, 60)
+    direct = convolve(a, b)
+    fft = _fft_convolve(a, b)
+    assert len(direct) == len(fft)
+    assert max(abs(x - y) for x, y in zip(direct, fft)) < 1e-12
+
+
+def test_total_pmfs_are_normalised_with_expected_mean():
+    for model in (
+        DiscreteScoreModel("poisson"),
+        DiscreteScoreModel("poisson", rho=-0.1),
+        DiscreteScoreModel("bivariate_poisson", covariance=0.2),
+        DiscreteScoreModel("negative_binomial", dispersion=8.0),
+    ):
+        pmf = model.score_pmf(1.6, 1.1, with_joint=True)
+        assert math.isclose(sum(pmf.total), 1.0, abs_tol=1e-9)
+        assert math.isclose(sum(map(sum, pmf.joint)), 1.0, abs_tol=1e-9)
+        if not model.rho:
+            assert math.isclose(pmf.mean, 2.7, rel_tol=1e-6)
+
+
+def test_poisson_totals_match_closed_form():
+    pmf = DiscreteScoreModel("poisson").score_pmf(1.5, 1.0)
+    lam = 2.5
+    expected_under = sum(math.exp(-lam) * lam ** k / math.factorial(k) for k in range(3))
+    assert math.isclose(pmf.prob_under(2.5), expected_under, rel_tol=1e-9)
+    assert math.isclose(pmf.prob_over(2.5) + pmf.prob_under(2.5), 1.0, abs_tol=1e-9)
+    assert pmf.prob_push(2.5) == 0.0
+
+    push = pmf.prob_push(3.0)
+    assert math.isclose(push, math.exp(-lam) * lam ** 3 / 6, rel_tol=1e-9)
+    assert math.isclose(pmf.prob_over(3.0) + pmf.prob_under(3.0) + push, 1.0, abs_tol=1e-9)
+
+
+def test_dixon_coles_inflates_low_score_draws():
+    plain = DiscreteScoreModel("poisson").score_pmf(1.3, 1.1, with_joint=True)
+    corrected = DiscreteScoreModel("poisson", rho=-0.1).score_pmf(1.3, 1.1, with_joint=True)
+    assert corrected.joint[0][0] > plain.joint[0][0]
+    assert corrected.joint[1][1] > plain.joint[1][1]
+    assert math.isclose(corrected.total[0], corrected.joint[0][0], rel_tol=1e-9)
+
+
+def test_push_refunds_stake_in_detector():
+    detector = EdgeDetector(ot_threshold=0.0, min_ev=-1.0)
+    pmf = DiscreteScoreModel("poisson").score_pmf(3.0, 3.0)
+    market = Distribution.from_market_total(line=6.0, odds=-110)
+    with_push = detector.detect(
+        pmf.to_distribution(), market, -110, true_prob=pmf.prob_over(6.0), push_prob=pmf.prob_push(6.0)
+    )
+    without_push = detector.detect(pmf.to_distribution(), market, -110, true_prob=pmf.prob_over(6.0))
+    assert with_push.expected_value > without_push.expected_value
+
+
+def test_kelly_with_push_matches_closed_form():
+    detector = EdgeDetector(ot_threshold=0.0, min_ev=-1.0, kelly_cap=1.0)
+    win, push, b = 0.5, 0.2, 100 / 110
+    lose = 1 - win - push
+    expected = 0.5 * (b * win - lose) / (b * (win + lose))
+    edge = detector.detect_outcome("OVER", 6.0, -110, true_prob=win, push_prob=push)
+    assert math.isclose(edge.kelly_fraction, expected, rel_tol=1e-9)
+    assert math.isclose(expected, 0.10625, rel_tol=1e-9)
+
+
+def test_ot_distance_is_exact_without_sampling(monkeypatch):
+    def no_sampling(self, n):
+        raise AssertionError("OT distance must not sample")
+
+    monkeypatch.setattr(Distribution, "sample", no_sampling)
+    true_dist, market_dist = Distribution(6.4, 2.5), Distribution(6.0, 6.6)
+    first = EdgeDetector(ot_threshold=0.0, min_ev=-1.0).detect(true_dist, market_dist, -110, true_prob=0.55)
+    again = EdgeDetector(ot_threshold=0.0, min_ev=-1.0).detect_many([true_dist], [market_dist], [-110], true_probs=[0.55])
+    assert first.wasserstein_distance == again[0].wasserstein_distance
+    assert math.isclose(first.wasserstein_distance, math.sqrt(2) * math.hypot(0.4, 4.1), rel_tol=1e-9)
+
+    # p=1 closed form against a fine midpoint integration of E|dm + ds * Z|.
+    n = 200_000
+    grid = (NormalDist().inv_cdf((i + 0.5) / n) for i in range(n))
+    numeric = sum(abs(0.4 - 4.1 * z) for z in grid) / n
+    assert math.isclose(OTEngine(p_norm=1)._normal_quantile_distance(true_dist, market_dist), numeric, rel_tol=1e-4)
+
+
+def test_nhl_analyzer_prices_without_sampling():
+    class ExplodingSimulator(MonteCarloSimulator):
+        def simulate_total_points(self, *args, **kwargs):
+            raise AssertionError("discrete sports must not be simulated")
+
+    analyzer = NHLAnalyzer(simulator=ExplodingSimulator(), detector=EdgeDetector(ot_threshold=0.0, min_ev=-1.0))
+    edge = analyzer.analyze_game("g1", "Boston Bruins", "Toronto Maple Leafs", 6.0, -110, -110)
+    assert edge is not None
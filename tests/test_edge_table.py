@@ -0,0 +1,97 @@
+import csv
+import io
+import json
+import pathlib
+import random
+import sys
+import tempfile
+import unittest
+
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.agent import main
+from src.edge.detector import EdgeResult
+from src.edge.table import COLUMNS, EdgeTable
+from src.scanner import EdgeSummary
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+
+def random_table(size: int, seed: int = 7) -> tuple[EdgeTable, list]:
+    rng = random.Random(seed)
+    sports = ["basketball_nba", "hockey_nhl", "soccer_epl"]
+    summaries = [
+        EdgeSummary(
+            sport=rng.choice(sports),
+            game_id=f"g{idx}",
+            matchup=f"A{idx} @ H{idx}",
+            edge=EdgeResult("OVER", 200.5 + idx % 7, round(rng.uniform(-0.05, 0.2), 3), 0.02, 0.55, 0.52, 0.3),
+        )
+        for idx in range(size)
+    ]
+    return EdgeTable.from_summaries(summaries), summaries
+
+
+class TestEdgeTable(unittest.TestCase):
+    def test_filter_sort_topk_match_per_object_results(self):
+        table, summaries = random_table(500)
+        ev = lambda s: s.edge.expected_value
+
+        filtered = table.filter(min_ev=0.05, sport="hockey_nhl")
+        expected = [s.game_id for s in summaries if ev(s) >= 0.05 and s.sport == "hockey_nhl"]
+        self.assertEqual(filtered.column("game_id"), expected)
+
+        ranked = sorted(summaries, key=ev, reverse=True)
+        self.assertEqual(table.sort().column("game_id"), [s.game_id for s in ranked])
+        self.assertEqual(table.topk(10).column("game_id"), [s.game_id for s in ranked[:10]])
+        self.assertEqual(list(table.sort(by="line", descending=False).column("line")), sorted(table.column("line")))
+        self.assertEqual(table.edge(3), summaries[3].edge)
+        self.assertEqual(filtered.sort().edge(0), max((s.edge for s in summaries if s.game_id in expected), key=lambda e: e.expected_value))
+        self.assertEqual(filtered.topk(3).topk(1).column("game_id"), filtered.topk(1).column("game_id"))
+        with self.assertRaises(ValueError):
+            filtered.append("x", "y", "z", summaries[0].edge)
+
+        groups = table.groupby_sport()
+        self.assertEqual(sum(len(group) for group in groups.values()), len(table))
+        for sport, group in groups.items():
+            self.assertEqual(set(group.column("sport")), {sport})
+        with self.assertRaises(KeyError):
+            table.sort(by="nope")
+
+    def test_jsonl_and_csv_exports(self):
+        table, _ = random_table(20)
+        buffer = io.StringIO()
+        self.assertEqual(table.write_jsonl(buffer), 20)
+        first = json.loads(buffer.getvalue().splitlines()[0])
+        self.assertEqual(list(first), list(COLUMNS))
+        self.assertEqual(first["expected_value"], table.column("expected_value")[0])
+
+        buffer = io.StringIO()
+        table.write_csv(buffer)
+        rows = list(csv.DictReader(io.StringIO(buffer.getvalue())))
+        self.assertEqual(len(rows), 20)
+        self.assertEqual(float(rows[5]["line"]), table.column("line")[5])
+
+    @unittest.skipIf(pyarrow is None, "pyarrow not installed")
+    def test_arrow_export_shares_buffers(self):
+        table, _ = random_table(50)
+        arrow = table.to_arrow()
+        self.assertEqual(arrow.column_names, list(COLUMNS))
+        self.assertEqual(arrow.column("expected_value").to_pylist(), list(table.column("expected_value")))
+
+    def test_cli_csv_scan_writes_sorted_edges(self):
+        with tempfile.NamedTemporaryFile(suffix=".csv") as handle:
+            main(["scan", "--sport", "all", "--format", "csv", "--output", handle.name])
+            with open(handle.name, encoding="utf-8") as stream:
+                rows = list(csv.DictReader(stream))
+        evs = [float(row["expected_value"]) for row in rows]
+        self.assertEqual(evs, sorted(evs, reverse=True))
+
+
+if __name__ == "__main__":
+    unittest.main()
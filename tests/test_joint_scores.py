@@ -0,0 +1,86 @@
+import math
+import pathlib
+import random
+import sys
+
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.edge.detector import EdgeDetector
+from src.models.discrete import DiscreteScoreModel
+from src.models.joint_score import JointScores
+from src.models.monte_carlo import MonteCarloSimulator, SimulationConfig
+from src.sports import TotalsAnalyzer, profile_for
+
+
+def test_markets_settle_from_paired_scores():
+    scores = JointScores(home=[3, 1, 2, 0], away=[1, 1, 0, 2])
+    assert scores.total(3.5).win == 0.25
+    assert scores.total(4.0).push == 0.25
+    assert scores.spread("home", -1.5).win == 0.5
+    assert scores.spread("away", 1.5).win == 0.5
+    assert scores.spread("home", -2.0).push == 0.5
+    assert scores.team_total("away", 0.5).win == 0.75
+    assert scores.draw() == 0.25
+    assert scores.moneyline("home", three_way=True).lose == 0.5
+    assert scores.moneyline("home").win == 0.625
+
+
+def test_simulated_pairs_keep_total_moments_and_correlation():
+    random.seed(11)
+    scores = MonteCarloSimulator(SimulationConfig(num_paths=20000)).simulate_joint_scores(110.0, 104.0, 12.0, 0.3)
+    dist = scores.total_distribution()
+    assert math.isclose(dist.mean, 214.0, abs_tol=0.5)
+    assert math.isclose(dist.std, 12.0, rel_tol=0.05)
+    margin = scores.margins()
+    assert math.isclose(sum(margin) / len(margin), 6.0, abs_tol=0.3)
+
+
+def test_pmf_joint_matches_exact_total():
+    pmf = DiscreteScoreModel("poisson", rho=-0.1).score_pmf(1.5, 1.2, with_joint=True)
+    scores = JointScores.from_pmf(pmf.joint)
+    assert math.isclose(scores.total(2.5).win, pmf.prob_over(2.5), abs_tol=1e-9)
+    assert math.isclose(scores.total(3.0).push, pmf.prob_push(3.0), abs_tol=1e-9)
+    home, away = scores.moneyline("home", True).win, scores.moneyline("away", True).win
+    assert math.isclose(home + away + scores.draw(), 1.0, abs_tol=1e-9)
+
+
+def test_analyzer_prices_every_offered_market_from_one_sample():
+    random.seed(3)
+    calls = []
+
+    class CountingSimulator(MonteCarloSimulator):
+        def simulate_joint_scores(self, *args, **kwargs):
+            calls.append(args)
+            return super().simulate_joint_scores(*args, **kwargs)
+
+    analyzer = TotalsAnalyzer(
+        profile_for("football_nfl"),
+        simulator=CountingSimulator(SimulationConfig(num_paths=2000)),
+        detector=EdgeDetector(ot_threshold=0.0, min_ev=-1.0),
+    )
+    game = {
+        "game_id": "g1",
+        "home_team": "Kansas City Chiefs",
+        "away_team": "Buffalo Bills",
+        "total_line": 44.5,
+        "over_odds": -110,
+        "under_odds": -110,
+        "spread_line": -2.5,
+        "home_spread_odds": -110,
+        "away_spread_odds": -110,
+        "home_ml_odds": -135,
+        "away_ml_odds": 115,
+        "home_total_line": 23.5,
+        "home_over_odds": -110,
+        "home_under_odds": -110,
+    }
+    edges = analyzer.analyze_markets(game)
+    assert len(calls) == 1
+    assert {(e.market, e.selection) for e in edges} == {
+        ("total", "over"), ("total", "under"),
+        ("spread", "home"), ("spread", "away"),
+        ("moneyline", "home"), ("moneyline", "away"),
+        ("home_total", "over"), ("home_total", "under"),
+    }
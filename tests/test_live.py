@@ -0,0 +1,52 @@
+import math
+import pathlib
+import sys
+
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.edge.detector import EdgeDetector
+from src.sports import SPORT_PROFILES, LiveGameState, LiveTotalsModel, NHLAnalyzer
+
+
+def make_nba_model():
+    return LiveTotalsModel(SPORT_PROFILES["basketball_nba"], 110.0, 106.0, 12.0, EdgeDetector(min_ev=-1.0))
+
+
+def test_tipoff_reproduces_pregame_distribution():
+    model = make_nba_model()
+    price = model.price(215.5, -110, -110, LiveGameState(0, 0, 48.0))
+    assert math.isclose(price.mean, 216.0)
+    assert math.isclose(price.std, 12.0)
+    assert math.isclose(price.prob_over, 0.5 * math.erfc((215.5 - 216.0) / (12.0 * math.sqrt(2))))
+
+
+def test_remaining_distribution_scales_with_clock_and_possession():
+    model = make_nba_model()
+    half = model.price(200.5, -110, -110, LiveGameState(60, 50, 24.0, period=3))
+    assert math.isclose(half.mean, 110 + 108.0)
+    assert math.isclose(half.std, 12.0 * math.sqrt(0.5))
+    with_ball = model.price(200.5, -110, -110, LiveGameState(60, 50, 24.0, period=3, possession="away"))
+    assert math.isclose(with_ball.mean - half.mean, SPORT_PROFILES["basketball_nba"].possession_value)
+
+    final = model.price(110.0, -110, -110, LiveGameState(60, 50, 0.0, period=4))
+    assert (final.prob_over, final.prob_under, final.prob_push) == (0.0, 0.0, 1.0)
+
+
+def test_out_of_order_updates_are_ignored():
+    model = make_nba_model()
+    assert model.update(LiveGameState(40, 38, 10.0, period=2))
+    assert not model.update(LiveGameState(30, 30, 2.0, period=1))
+    assert model.price(200.5, -110, -110).state.period == 2
+
+
+def test_hockey_uses_exact_remaining_goal_pmf():
+    model = LiveTotalsModel.from_pregame(
+        NHLAnalyzer(detector=EdgeDetector(min_ev=-1.0)), "Boston Bruins", "Toronto Maple Leafs"
+    )
+    price = model.price(5.0, -110, -110, LiveGameState(2, 2, 20.0, period=3))
+    remaining = (model.home_mean + model.away_mean) / 3
+    assert math.isclose(price.prob_under, math.exp(-remaining), rel_tol=1e-9)
+    assert math.isclose(price.prob_push, math.exp(-remaining) * remaining, rel_tol=1e-9)
+    assert price.edge is not None
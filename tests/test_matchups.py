@@ -0,0 +1,69 @@
+import math
+import os
+import pathlib
+import sys
+import tempfile
+import unittest
+
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.data.stats_fetcher import StatsFetcher
+from src.models.monte_carlo import MonteCarloSimulator
+from src.sports import MatchupMatrix, profile_for
+
+
+class TestMatchupMatrix(unittest.TestCase):
+    def setUp(self):
+        self.fetcher = StatsFetcher()
+        self.fetcher.update_team_stats("Duke Blue Devils", "basketball_cbb_division1", {"offensive_rating": 120.0, "pace": 72.0})
+        self.fetcher.update_team_stats("Kansas Jayhawks", "basketball_cbb_division1", {"offensive_rating": 110.0, "pace": 66.0})
+        self.matrix = MatchupMatrix.build("basketball_cbb_division1", stats_fetcher=self.fetcher)
+
+    def test_cells_match_per_game_moments(self):
+        profile = profile_for("basketball_cbb_division1")
+        simulator = MonteCarloSimulator()
+        self.assertEqual(len(self.matrix), 361)
+        for home, away in (("Duke Blue Devils", "Kansas Jayhawks"), ("Kansas Jayhawks", "Duke Blue Devils")):
+            with self.subTest(home=home, away=away):
+                home_stats = self.fetcher.fetch_team_stats(home, "basketball_cbb_division1")
+                away_stats = self.fetcher.fetch_team_stats(away, "basketball_cbb_division1")
+                expected = simulator.adjusted_moments(
+                    profile.base_mean(home_stats, away_stats),
+                    profile.base_std,
+                    pace=(home_stats["pace"] + away_stats["pace"]) / 2,
+                )
+                mean, std = self.matrix.moments(home, away)
+                self.assertAlmostEqual(mean, expected[0], places=4)
+                self.assertAlmostEqual(std, expected[1], places=4)
+
+        mean, std = self.matrix.moments("Duke Blue Devils", "Kansas Jayhawks")
+        self.assertAlmostEqual(self.matrix.prob_over("Duke Blue Devils", "Kansas Jayhawks", mean), 0.5, places=6)
+        with self.assertRaises(KeyError):
+            self.matrix.moments("Duke Blue Devils", "Nowhere State")
+
+    def test_saved_matrix_is_memory_mapped_and_identical(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "cbb.mtx")
+            self.matrix.save(path)
+            self.assertLess(os.path.getsize(path), 361 * 361 * 8 + 16_384)
+            with MatchupMatrix.load(path) as loaded:
+                self.assertEqual(loaded.teams, self.matrix.teams)
+                self.assertTrue(loaded.profile.combine == "mean")
+                for pair in (("Duke Blue Devils", "Kansas Jayhawks"), ("Kansas Jayhawks", "Duke Blue Devils")):
+                    self.assertEqual(loaded.moments(*pair), self.matrix.moments(*pair))
+                self.assertAlmostEqual(
+                    loaded.prob_over("Duke Blue Devils", "Kansas Jayhawks", 100.5),
+                    self.matrix.prob_over("Duke Blue Devils", "Kansas Jayhawks", 100.5),
+                )
+
+    def test_discrete_sports_use_poisson_tail(self):
+        matrix = MatchupMatrix.build("hockey_nhl")
+        mean, _ = matrix.moments("Boston Bruins", "Toronto Maple Leafs")
+        under = sum(math.exp(-mean) * mean ** k / math.factorial(k) for k in range(7))
+        self.assertAlmostEqual(matrix.prob_over("Boston Bruins", "Toronto Maple Leafs", 6.0), 1 - under, places=9)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,148 @@
+import contextlib
+import io
+import pathlib
+import sys
+import tracemalloc
+import unittest
+from unittest import mock
+
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src import agent
+from src.agent import ScanReport, iter_priced, main, synthetic_scraper
+from src.memory import MEMORY, ChunkThrottle, MemoryProfiler
+
+
+class TestMemoryProfiler(unittest.TestCase):
+    def tearDown(self):
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    def test_stage_records_net_and_peak(self):
+        profiler = MemoryProfiler(enabled=True)
+        with profiler.stage("build") as stage:
+            kept = bytearray(200_000)
+            scratch = bytearray(1_000_000)
+            del scratch
+        stats = profiler.stages["build"]
+        self.assertEqual(stats.calls, 1)
+        self.assertGreaterEqual(stats.net, 200_000)
+        self.assertLess(stats.net, 1_000_000)
+        self.assertGreaterEqual(stats.peak, 1_200_000)
+        self.assertEqual(stage.peak - stage.start, stats.peak)
+        self.assertEqual(len(kept), 200_000)
+        profiler.disable()
+        self.assertFalse(tracemalloc.is_tracing())
+
+    def test_parent_peak_includes_children(self):
+        profiler = MemoryProfiler(enabled=True)
+        with profiler.stage("outer"):
+            with profiler.stage("inner"):
+                scratch = bytearray(1_000_000)
+                del scratch
+            small = bytearray(10_000)
+        self.assertGreaterEqual(profiler.stages["outer"].peak, 1_000_000)
+        self.assertGreaterEqual(profiler.stages["inner"].peak, 1_000_000)
+        self.assertEqual(len(small), 10_000)
+        lines = profiler.summary_lines()
+        self.assertTrue(lines[1].startswith("outer") or lines[1].startswith("inner"))
+        self.assertTrue(profiler.top_allocations(3))
+        profiler.disable()
+
+    def test_disabled_profiler_records_nothing(self):
+        profiler = MemoryProfiler()
+        with profiler.stage("build"):
+            bytearray(1000)
+        self.assertEqual(profiler.stages, {})
+        self.assertFalse(tracemalloc.is_tracing())
+        self.assertEqual(profiler.top_allocations(), [])
+
+
+class TestChunkThrottle(unittest.TestCase):
+    def test_resizes_toward_the_limit(self):
+        throttle = ChunkThrottle(1000, memory_limit=1_000_000, min_size=10)
+        self.assertEqual(throttle.observe(2_000_000), 400)
+        self.assertEqual(throttle.observe(900_000), 400)  # inside the band: keep
+        self.assertEqual(throttle.observe(100_000), 1000)  # capped at the configured size
+        self.assertEqual(throttle.observe(10**12), 10)
+        self.assertEqual(throttle.resizes, 3)
+        self.assertEqual(throttle.peak, 10**12)
+
+    def test_without_limit_size_is_fixed(self):
+        throttle = ChunkThrottle(500)
+        self.assertEqual(throttle.observe(10**12), 500)
+        with throttle.probe():
+            pass
+        self.assertFalse(tracemalloc.is_tracing())
+        with self.assertRaises(ValueError):
+            ChunkThrottle(0)
+
+    def test_probe_measures_one_chunk_then_waits(self):
+        throttle = ChunkThrottle(1000, memory_limit=500_000, probe_every=4)
+        with throttle.probe():
+            self.assertTrue(tracemalloc.is_tracing())
+            scratch = bytearray(1_000_000)
+            del scratch
+        self.assertFalse(tracemalloc.is_tracing())
+        self.assertLess(throttle.size, 500)
+        self.assertGreaterEqual(throttle.peak, 1_000_000)
+        with throttle.probe():
+            self.assertTrue(tracemalloc.is_tracing())  # first chunk after a resize is checked
+        for _ in range(3):
+            with throttle.probe():
+                self.assertFalse(tracemalloc.is_tracing())
+        with throttle.probe():
+            self.assertTrue(tracemalloc.is_tracing())
+
+
+class TestBoundedScan(unittest.TestCase):
+    def tearDown(self):
+        MEMORY.disable()
+        MEMORY.reset()
+
+    def test_chunked_scan_prices_every_game_in_order(self):
+        report = ScanReport()
+        with synthetic_scraper(120, 2) as scraper:
+            full = [row.game["game_id"] for row in iter_priced(["hockey_nhl"], scraper=scraper)]
+            chunked = [
+                row.game["game_id"]
+                for row in iter_priced(["hockey_nhl"], scraper=scraper, report=report, chunk_size=50)
+            ]
+        self.assertEqual(chunked, full)
+        self.assertEqual(report.chunks, 5)
+        self.assertEqual(report.sport_games["hockey_nhl"], 240)
+        self.assertIn("bounded scan: 5 chunks", report.summary_lines()[-1])
+
+    def test_memory_limit_shrinks_chunks(self):
+        report = ScanReport()
+        with synthetic_scraper(400, 2) as scraper:
+            rows = list(
+                iter_priced(["basketball_nba"], scraper=scraper, report=report, chunk_size=400, memory_limit=20_000)
+            )
+        self.assertEqual(len(rows), 800)
+        self.assertGreater(report.chunks, 2)
+        self.assertGreater(report.peak_memory, 20_000)
+        self.assertFalse(tracemalloc.is_tracing())
+
+    def test_memory_limit_alone_lets_chunks_grow_past_the_default(self):
+        report = ScanReport()
+        with synthetic_scraper(150, 1) as scraper, mock.patch.object(agent, "FIRST_CHUNK_SIZE", 40):
+            ids = [row.game_id for row in iter_priced(["hockey_nhl"], scraper=scraper, report=report, memory_limit=2**30)]
+        self.assertEqual(len(ids), 150)
+        self.assertEqual(len(set(ids)), 150)
+        self.assertEqual(report.chunks, 2)  # a probed 40-game chunk, then the other 110 at once
+
+    def test_cli_memory_report(self):
+        stderr = io.StringIO()
+        with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(stderr):
+            main(["scan", "--sport", "hockey_nhl", "--memory", "--chunk-size", "8"])
+        report = stderr.getvalue()
+        for stage in ("fetch", "price", "prepare", "simulation", "detect", "rows"):
+            self.assertIn(f"\n{stage} ", report)
+        self.assertIn("bounded scan:", report)
+
+
+if __name__ == "__main__":
+    unittest.main()
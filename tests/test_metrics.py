@@ -0,0 +1,95 @@
+import contextlib
+import io
+import pathlib
+import sys
+import unittest
+import urllib.request
+
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src import scanner
+from src.agent import main
+from src.data.odds_scraper import OddsScraper
+from src.metrics import METRICS, Histogram, Metrics, serve_metrics
+from src.sports import TotalsAnalyzer, profile_for
+
+
+class TestMetrics(unittest.TestCase):
+    def setUp(self):
+        METRICS.reset()
+        METRICS.enable()
+
+    def tearDown(self):
+        METRICS.disable()
+        METRICS.reset()
+
+    def test_histogram_buckets_and_quantiles(self):
+        histogram = Histogram((0.001, 0.01, 0.1))
+        for value in (0.0005, 0.002, 0.003, 0.05, 2.0):
+            histogram.observe(value)
+        self.assertEqual(histogram.counts, [1, 2, 1, 1])
+        self.assertEqual(histogram.quantile(0.5), 0.01)
+        self.assertEqual(histogram.quantile(1.0), float("inf"))
+        self.assertAlmostEqual(histogram.sum, 2.0555)
+
+    def test_disabled_registry_records_nothing(self):
+        metrics = Metrics()
+        with metrics.timer("ot"):
+            pass
+        metrics.inc("games_analyzed")
+        self.assertEqual((metrics.histograms, metrics.counters), ({}, {}))
+        self.assertEqual(metrics.render_prometheus(), "")
+
+    def test_analyze_game_records_every_stage(self):
+        analyzer = TotalsAnalyzer(profile_for("basketball_nba"))
+        for game in OddsScraper().fetch_odds_api(sport="basketball_nba", max_games=3):
+            analyzer.analyze_game(**game)
+        for stage in ("stats_fetch", "causal_adjust", "simulation", "ot", "ev_kelly"):
+            with self.subTest(stage=stage):
+                self.assertEqual(METRICS.histograms[stage].count, 3)
+        self.assertEqual(METRICS.counters["games_analyzed"], 3)
+
+    def test_prometheus_text_is_cumulative(self):
+        metrics = Metrics(enabled=True, buckets=(0.01, 0.1))
+        for value in (0.005, 0.05, 0.5):
+            metrics.observe("ot", value)
+        metrics.inc("edges_found", 2)
+        text = metrics.render_prometheus()
+        self.assertIn("# TYPE sportsmodel_stage_seconds histogram", text)
+        self.assertIn('sportsmodel_stage_seconds_bucket{stage="ot",le="0.1"} 2', text)
+        self.assertIn('sportsmodel_stage_seconds_bucket{stage="ot",le="+Inf"} 3', text)
+        self.assertIn('sportsmodel_stage_seconds_count{stage="ot"} 3', text)
+        self.assertIn("sportsmodel_edges_found_total 2", text)
+
+    def test_worker_metrics_are_drained_and_merged(self):
+        edges, drained = scanner._worker_scan("hockey_nhl", 0.03, 2, True)
+        self.assertEqual(METRICS.histograms, {})
+        METRICS.merge(drained)
+        METRICS.merge(drained)
+        self.assertEqual(METRICS.counters["games_analyzed"], 4)
+
+    def test_http_exporter_and_cli_summary(self):
+        METRICS.observe("ot", 0.002)
+        server = serve_metrics(0)
+        self.assertEqual(server.server_address[0], "127.0.0.1")
+        try:
+            url = f"http://127.0.0.1:{server.server_address[1]}/metrics"
+            with urllib.request.urlopen(url) as response:
+                body = response.read().decode("utf-8")
+        finally:
+            server.shutdown()
+            server.server_close()
+        self.assertIn('sportsmodel_stage_seconds_count{stage="ot"} 1', body)
+
+        stderr = io.StringIO()
+        with contextlib.redirect_stderr(stderr), contextlib.redirect_stdout(io.StringIO()):
+            main(["scan", "--sport", "hockey_nhl", "--metrics"])
+        table = stderr.getvalue()
+        self.assertIn("p95 us", table)
+        self.assertIn("score_pmf", table)
+
+
+if __name__ == "__main__":
+    unittest.main()
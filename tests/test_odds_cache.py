@@ -0,0 +1,70 @@
+import pathlib
+import sys
+import unittest
+
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.data.async_odds_client import AsyncOddsClient, ProviderConfig
+from src.data.odds_cache import OddsCache
+from src.data.odds_scraper import OddsScraper
+from tests.helpers import FakeClock
+from tests.odds_stub_server import StubOddsServer
+
+
+def _game(game_id, total_line=6.0, over_odds=-110):
+    return {
+        "game_id": game_id,
+        "home_team": "Home",
+        "away_team": "Away",
+        "total_line": total_line,
+        "over_odds": over_odds,
+        "under_odds": -110,
+    }
+
+
+class TestOddsCache(unittest.TestCase):
+    def test_ttl_and_per_game_diff(self):
+        games = {"hockey_nhl": [_game("a"), _game("b"), _game("c")]}
+        with StubOddsServer(games) as server:
+            client = AsyncOddsClient(ProviderConfig(name="stub", base_url=server.base_url, requests_per_second=100))
+            clock = FakeClock()
+            with OddsScraper(client=client) as scraper:
+                cache = OddsCache(scraper, ttl=30.0, clock=clock)
+
+                first = cache.refresh("hockey_nhl")
+                self.assertEqual(len(first.new), 3)
+
+                clock.now = 10.0
+                self.assertEqual(len(cache.get("hockey_nhl")), 3)
+                self.assertEqual(len(server.requests), 1)
+
+                clock.now = 45.0
+                unchanged = cache.refresh("hockey_nhl")
+                self.assertFalse(unchanged.has_changes)
+                self.assertEqual(unchanged.unchanged, 3)
+                self.assertEqual(len(server.requests), 2)
+
+                games["hockey_nhl"] = [_game("a"), _game("b", total_line=6.5), _game("d")]
+                clock.now = 90.0
+                diff = cache.refresh("hockey_nhl")
+
+        self.assertEqual([g["game_id"] for g in diff.new], ["d"])
+        self.assertEqual([g["game_id"] for g in diff.changed], ["b"])
+        self.assertEqual([g["game_id"] for g in diff.removed], ["c"])
+        self.assertEqual(diff.unchanged, 1)
+        self.assertEqual({g["game_id"] for g in diff.games_to_price}, {"b", "d"})
+
+    def test_synthetic_scraper_uses_fingerprint_etag(self):
+        clock = FakeClock()
+        cache = OddsCache(OddsScraper(), ttl=0.0, clock=clock)
+        first = cache.refresh("basketball_nba")
+        second = cache.refresh("basketball_nba")
+        self.assertEqual(len(first.new), 15)
+        self.assertFalse(second.has_changes)
+        self.assertEqual(second.unchanged, 15)
+
+
+if __name__ == "__main__":
+    unittest.main()
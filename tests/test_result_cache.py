@@ -0,0 +1,108 @@
+import pathlib
+import sys
+import tempfile
+import unittest
+
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.edge.detector import EdgeDetector, EdgeResult
+from src.edge.result_cache import CachedAnalysis, ResultCache
+from src.models.distribution import Distribution
+from src.models.monte_carlo import MonteCarloSimulator, SimulationConfig
+from src.sports.nfl import NFLAnalyzer
+from src.sports.nhl import NHLAnalyzer
+
+
+class CountingSimulator(MonteCarloSimulator):
+    def __init__(self):
+        super().__init__(SimulationConfig(num_paths=300))
+        self.calls = 0
+
+    def simulate_total_points(self, *args, **kwargs):
+        self.calls += 1
+        return super().simulate_total_points(*args, **kwargs)
+
+
+GAME = dict(
+    game_id="nfl1",
+    home_team="Kansas City Chiefs",
+    away_team="Buffalo Bills",
+    total_line=40.5,
+    over_odds=-110,
+    under_odds=-110,
+    injuries=[],
+)
+
+
+class TestResultCache(unittest.TestCase):
+    def test_results_survive_restart(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = f"{tmp}/results.sqlite"
+            detector = EdgeDetector(ot_threshold=0.05, min_ev=0.01)
+
+            first_sim = CountingSimulator()
+            first = NFLAnalyzer(simulator=first_sim, detector=detector, result_cache=ResultCache(path))
+            edge = first.analyze_game(**GAME)
+            first.result_cache.close()
+
+            second_sim = CountingSimulator()
+            second = NFLAnalyzer(simulator=second_sim, detector=detector, result_cache=ResultCache(path))
+            self.assertEqual(second.analyze_game(**GAME), edge)
+            self.assertEqual(second_sim.calls, 0)
+
+            second.analyze_game(**{**GAME, "total_line": 41.5})
+            second.analyze_game(**{**GAME, "injuries": [{"player": "QB", "status": "out", "impact": -3.0}]})
+            self.assertEqual(second_sim.calls, 2)
+            self.assertEqual(second.result_cache.hits, 1)
+
+    def test_injuries_may_be_an_iterator(self):
+        injuries = [{"player": "G", "status": "out", "impact": -1.5}]
+        game = dict(GAME, home_team="Boston Bruins", away_team="Toronto Maple Leafs", total_line=6.0)
+        detector = EdgeDetector(ot_threshold=0.0, min_ev=-1.0)
+        as_list = NHLAnalyzer(detector=detector, result_cache=ResultCache()).analyze_game(**{**game, "injuries": injuries})
+        as_iter = NHLAnalyzer(detector=detector, result_cache=ResultCache()).analyze_game(
+            **{**game, "injuries": iter(injuries)}
+        )
+        healthy = NHLAnalyzer(detector=detector).analyze_game(**game)
+        self.assertEqual(as_iter.true_prob, as_list.true_prob)
+        self.assertNotEqual(as_iter.true_prob, healthy.true_prob)
+
+    def test_eviction_keeps_cache_bounded(self):
+        cache = ResultCache(max_entries=20)
+        edge = EdgeResult("OVER", 1.5, 0.05, 0.02, 0.55, 0.52, 0.3)
+        for idx in range(50):
+            cache.put(f"key{idx}", CachedAnalysis(distribution=Distribution(idx, 1.0), edge=edge))
+        self.assertLessEqual(len(cache), 20)
+        self.assertIsNotNone(cache.get("key49"))
+        self.assertIsNone(cache.get("key0"))
+
+    def test_batch_commits_once_and_bound_holds_across_connections(self):
+        edge = EdgeResult("OVER", 1.5, 0.05, 0.02, 0.55, 0.52, 0.3)
+        analysis = CachedAnalysis(distribution=Distribution(1.0, 1.0), edge=edge)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = f"{tmp}/results.sqlite"
+            first, second = ResultCache(path, max_entries=20), ResultCache(path, max_entries=20)
+            with first.batch():
+                for idx in range(15):
+                    first.put(f"a{idx}", analysis)
+                self.assertIsNotNone(first.get("a3"))  # pending writes are readable
+                self.assertIsNone(second.get("a3"))  # but not committed yet
+            self.assertEqual(len(second), 15)
+            for idx in range(15):
+                second.put(f"b{idx}", analysis)
+            self.assertLessEqual(len(first), 20)
+            self.assertIsNotNone(first.get("b14"))
+            first.close()
+            second.close()
+
+    def test_model_version_changes_key(self):
+        inputs = {"total_line": 2.5}
+        self.assertNotEqual(
+            ResultCache(model_version="1").key_for(inputs), ResultCache(model_version="2").key_for(inputs)
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
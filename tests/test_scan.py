@@ -0,0 +1,71 @@
+import contextlib
+import io
+import json
+import pathlib
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.agent import ScanReport, iter_scan, main, write_jsonl
+from src.data.odds_scraper import OddsScraper
+from src.edge.detector import EdgeDetector
+from src.edge.result_cache import ResultCache
+from src.sports import SlatePricer
+
+
+class TestStreamingScan(unittest.TestCase):
+    def test_records_stream_per_sport_with_throughput(self):
+        report = ScanReport()
+        sports = ["basketball_nba", "hockey_nhl"]
+        pricer = SlatePricer(detector=EdgeDetector(ot_threshold=0.0, min_ev=-1.0))
+        stream = iter_scan(sports, pricer=pricer, report=report)
+
+        first = next(stream)
+        self.assertEqual(first["sport"], "basketball_nba")
+        self.assertEqual(list(report.sport_latency), ["basketball_nba"])
+
+        records = [first, *stream]
+        expected = sum(len(OddsScraper().fetch_odds_api(sport=code)) for code in sports)
+        self.assertEqual(len(records), expected)
+        self.assertEqual(report.games, expected)
+        self.assertEqual(report.edges, sum(r["edge"] is not None for r in records))
+        self.assertGreater(report.edges, 0)
+        self.assertGreater(report.games_per_sec, 0)
+        self.assertIn("games/sec", report.summary_lines()[-1])
+
+        buffer = io.StringIO()
+        self.assertEqual(write_jsonl(records, buffer), len(records))
+        parsed = [json.loads(line) for line in buffer.getvalue().splitlines()]
+        self.assertEqual(parsed[0]["game_id"], first["game_id"])
+
+    def test_cli_writes_jsonl_file(self):
+        with tempfile.NamedTemporaryFile(suffix=".jsonl") as handle:
+            main(["scan", "--sport", "football_nfl", "--output", handle.name])
+            lines = pathlib.Path(handle.name).read_text().splitlines()
+        self.assertEqual(len(lines), len(OddsScraper().fetch_odds_api(sport="football_nfl")))
+        self.assertTrue(all(json.loads(line)["sport"] == "football_nfl" for line in lines))
+
+    def test_cli_scan_uses_result_cache(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = str(pathlib.Path(tmp) / "results.sqlite")
+            output = pathlib.Path(tmp) / "out.jsonl"
+            args = ["scan", "--sport", "hockey_nhl", "--result-cache", path, "--output", str(output)]
+            close = mock.patch.object(ResultCache, "close", autospec=True, side_effect=ResultCache.close)
+            with contextlib.redirect_stderr(io.StringIO()), close as closed:
+                main(args)
+                first = output.read_text()
+                main(args)
+            self.assertEqual(output.read_text(), first)
+            self.assertEqual(closed.call_count, 2)
+            cache = ResultCache(path)
+            self.assertGreater(len(cache), 0)
+            cache.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
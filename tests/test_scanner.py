@@ -0,0 +1,143 @@
+import asyncio
+import pathlib
+import sys
+import threading
+import time
+import unittest
+from unittest import mock
+
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src import scanner
+from src.scanner import ScanExecutor, ScanTimeout, TopK, fetch_edges_for_sport, top_edges
+from tests.helpers import summary
+
+
+class TestTopEdges(unittest.TestCase):
+    def test_global_top_k_across_sorted_sports(self):
+        per_sport = [
+            [summary(f"cbb{i}", 0.031 + i * 0.001, sport="basketball_cbb_division1") for i in range(9, -1, -1)],
+            [summary("nhl0", 0.12, sport="hockey_nhl"), summary("nhl1", 0.05, sport="hockey_nhl")],
+            [],
+            [summary(f"epl{i}", ev, sport="soccer_epl") for i, ev in enumerate((0.09, 0.08, 0.07))],
+        ]
+        best = top_edges(per_sport, k=5)
+        self.assertEqual([e.game_id for e in best], ["nhl0", "epl0", "epl1", "epl2", "nhl1"])
+
+        everything = sorted((e for edges in per_sport for e in edges), key=lambda e: e.edge.expected_value, reverse=True)
+        self.assertEqual(top_edges(per_sport, k=50), everything)
+        self.assertEqual(top_edges(per_sport, k=0), [])
+
+    def test_stops_reading_once_nothing_can_beat_kth(self):
+        read = []
+
+        class Tracked(list):
+            def __iter__(self):
+                for item in list.__iter__(self):
+                    read.append(item.game_id)
+                    yield item
+
+        per_sport = [
+            Tracked([summary("a0", 0.10, sport="a"), summary("a1", 0.09, sport="a"), summary("a2", 0.01, sport="a")]),
+            Tracked([summary("b0", 0.05, sport="b"), summary("b1", 0.04, sport="b")]),
+            Tracked([summary("c0", 0.02, sport="c")]),
+        ]
+        best = top_edges(per_sport, k=2)
+        self.assertEqual([e.game_id for e in best], ["a0", "a1"])
+        self.assertEqual(read, ["a0", "a1", "a2"])
+
+    def test_topk_keeps_earliest_on_ties(self):
+        top = TopK(2, key=lambda item: item[1])
+        for item in [("x", 1.0), ("y", 1.0), ("z", 1.0), ("w", 0.5)]:
+            top.push(item)
+        self.assertEqual(top.items(), [("x", 1.0), ("y", 1.0)])
+        self.assertEqual(top.threshold, 1.0)
+        self.assertFalse(top.can_improve(1.0))
+
+
+class TestScanExecutor(unittest.TestCase):
+    def test_process_pool_matches_inline_scan_and_keeps_loop_responsive(self):
+        sports = ["basketball_nba", "hockey_nhl", "football_nfl"]
+        executor = ScanExecutor(max_workers=2)
+
+        async def scenario():
+            ticks = 0
+            done = asyncio.Event()
+
+            async def heartbeat():
+                nonlocal ticks
+                while not done.is_set():
+                    ticks += 1
+                    await asyncio.sleep(0.001)
+
+            beat = asyncio.create_task(heartbeat())
+            edges = await executor.edges_for_sports(sports, min_ev=-1.0, limit=3)
+            done.set()
+            await beat
+            return edges, ticks
+
+        try:
+            edges, ticks = asyncio.run(scenario())
+        finally:
+            executor.shutdown()
+
+        expected = [edge for sport in sports for edge in fetch_edges_for_sport(sport, -1.0, limit=3)]
+        self.assertEqual([(e.sport, e.game_id) for e in edges], [(e.sport, e.game_id) for e in expected])
+        self.assertGreater(ticks, 1)
+
+    def test_worker_reuses_edges_while_odds_are_unchanged(self):
+        with mock.patch.object(scanner, "_WORKER_STATE", threading.local()), mock.patch.object(
+            scanner, "fetch_edges_for_sport", wraps=fetch_edges_for_sport
+        ) as fetch:
+            scanner._init_worker(None, odds_ttl=0.0)
+            first = scanner._worker_fetch("hockey_nhl", -1.0, 3)
+            second = scanner._worker_fetch("hockey_nhl", -1.0, 3)
+            scanner._worker_fetch("hockey_nhl", -1.0, 2)  # a different scan prices separately
+            scanner._WORKER_STATE.odds.invalidate("hockey_nhl")
+            third = scanner._worker_fetch("hockey_nhl", -1.0, 3)
+        scanner._init_worker(None)
+        self.assertIs(second, first)
+        self.assertIsNot(third, first)
+        self.assertEqual([e.game_id for e in third], [e.game_id for e in first])
+        self.assertEqual(fetch.call_count, 3)
+
+    def test_results_keep_sport_order(self):
+        def fake_fetch(sport, min_ev, limit):
+            time.sleep(0.02 if sport == "a" else 0.0)
+            return [f"{sport}-1", f"{sport}-2"]
+
+        executor = ScanExecutor(max_workers=3, use_processes=False)
+        try:
+            with mock.patch.object(scanner, "_worker_fetch", fake_fetch):
+                edges = asyncio.run(executor.edges_for_sports(["a", "b", "c"], min_ev=0.0))
+        finally:
+            executor.shutdown()
+        self.assertEqual(edges, ["a-1", "a-2", "b-1", "b-2", "c-1", "c-2"])
+
+    def test_timeout_cancels_queued_sports(self):
+        started = []
+        release = threading.Event()
+
+        def slow_fetch(sport, min_ev, limit):
+            started.append(sport)
+            release.wait(2)
+            return []
+
+        executor = ScanExecutor(max_workers=1, use_processes=False, timeout=0.05)
+        try:
+            with mock.patch.object(scanner, "_worker_fetch", slow_fetch):
+                began = time.perf_counter()
+                with self.assertRaises(ScanTimeout):
+                    asyncio.run(executor.edges_for_sports(["a", "b", "c"], min_ev=0.0))
+                self.assertLess(time.perf_counter() - began, 1.0)
+                release.set()
+        finally:
+            executor.shutdown()
+        time.sleep(0.05)
+        self.assertEqual(started, ["a"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+import math
+import pathlib
+import random
+import sys
+import unittest
+
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.data.odds_scraper import OddsScraper
+from src.data.slate import Slate
+from src.data.team_registry import team_id
+from src.edge.detector import EdgeDetector
+from src.models.monte_carlo import MonteCarloSimulator, SimulationConfig
+from src.sports import SlatePricer
+
+
+class TestSlate(unittest.TestCase):
+    def test_synthetic_slate_matches_dict_feed(self):
+        scraper = OddsScraper()
+        for sport in ("basketball_nba", "hockey_nhl", "soccer_epl"):
+            with self.subTest(sport=sport):
+                slate = scraper.fetch_slate(sport)
+                games = scraper.fetch_odds_api(sport=sport)
+                self.assertEqual(len(slate), len(games))
+                self.assertEqual(list(slate.games()), games)
+                self.assertEqual(slate.home[0], team_id(sport, games[0]["home_team"]))
+
+    def test_from_games_resolves_ids_and_keeps_unknown_teams(self):
+        games = [
+            {"game_id": "g1", "home_team": "LA Lakers", "away_team": "Boston Celtics", "total_line": 221.5,
+             "over_odds": -105, "under_odds": -115, "commence_time": 1700000000},
+            {"game_id": "g2", "home_team": "Expansion Club", "away_team": "Boston Celtics", "total_line": 210.0,
+             "over_odds": -110, "under_odds": -110, "injuries": [{"player": "x", "impact": 0.2}]},
+        ]
+        slate = Slate.from_games("basketball_nba", games)
+        self.assertEqual(slate.team_name(slate.home[0]), "Los Angeles Lakers")
+        self.assertEqual(slate.team_name(slate.home[1]), "Expansion Club")
+        self.assertEqual(slate.home[1], len(slate.teams))
+        self.assertEqual(slate.team_id("Expansion Club"), slate.home[1])
+        self.assertEqual(slate.start[0], 1700000000.0)
+        self.assertTrue(math.isnan(slate.start[1]))
+        self.assertEqual(slate.injuries, {1: games[1]["injuries"]})
+        self.assertEqual(len(slate.team_ids()), 3)
+        self.assertIs(slate.game(1), games[1])
+
+        slate.append("g3", slate.home[0], slate.away[0], 219.5, -110, -110)
+        self.assertEqual(slate.game(0)["home_team"], "Los Angeles Lakers")
+        self.assertEqual(slate.game(2)["total_line"], 219.5)
+
+    def test_from_games_parses_iso_start_times(self):
+        base = {"home_team": "LA Lakers", "away_team": "Boston Celtics", "total_line": 221.5,
+                "over_odds": -110, "under_odds": -110}
+        slate = Slate.from_games("basketball_nba", [
+            {**base, "game_id": "iso", "commence_time": "2023-11-14T22:13:20Z"},
+            {**base, "game_id": "bad", "commence_time": "tonight"},
+        ])
+        self.assertEqual(slate.start[0], 1700000000.0)
+        self.assertTrue(math.isnan(slate.start[1]))
+
+    def test_slice_keeps_rows_injuries_and_teams(self):
+        games = [
+            {"game_id": f"g{idx}", "home_team": "Expansion Club" if idx == 3 else "LA Lakers",
+             "away_team": "Boston Celtics", "total_line": 220.0 + idx, "over_odds": -110, "under_odds": -110,
+             **({"injuries": [{"player": "x", "impact": 0.2}]} if idx == 2 else {})}
+            for idx in range(5)
+        ]
+        slate = Slate.from_games("basketball_nba", games)
+        part = slate.slice(2, 4)
+        self.assertEqual(len(part), 2)
+        self.assertEqual(list(part.games()), games[2:4])
+        self.assertEqual(part.injuries, {0: games[2]["injuries"]})
+        self.assertEqual(part.team_name(part.home[1]), "Expansion Club")
+        generated = OddsScraper().fetch_slate("basketball_nba").slice(-2, None)
+        self.assertEqual(len(generated), 2)
+        self.assertEqual(generated.game(0)["game_id"], OddsScraper().fetch_odds_api("basketball_nba")[-2]["game_id"])
+
+    def test_price_slates_matches_dict_pricing(self):
+        scraper = OddsScraper()
+        sports = ["basketball_nba", "hockey_nhl", "football_nfl"]
+        detector = EdgeDetector(ot_threshold=0.05, min_ev=0.0)
+        random.seed(3)
+        by_dicts = SlatePricer(simulator=MonteCarloSimulator(SimulationConfig(num_paths=2000)), detector=detector).price(
+            {sport: scraper.fetch_odds_api(sport=sport, max_games=4) for sport in sports}
+        )
+        random.seed(3)
+        by_columns = SlatePricer(
+            simulator=MonteCarloSimulator(SimulationConfig(num_paths=2000)), detector=detector
+        ).price_slates(scraper.fetch_slate(sport, max_games=4) for sport in sports)
+        self.assertEqual([row.game for row in by_columns], [row.game for row in by_dicts])
+        self.assertEqual(by_columns[0].game_id, by_dicts[0].game["game_id"])
+        self.assertEqual(
+            by_columns[0].matchup, f"{by_dicts[0].game['away_team']} @ {by_dicts[0].game['home_team']}"
+        )
+        for cols, dicts in zip(by_columns, by_dicts):
+            self.assertAlmostEqual(cols.distribution.mean, dicts.distribution.mean)
+            self.assertEqual(cols.edge, dicts.edge)
+
+
+if __name__ == "__main__":
+    unittest.main()
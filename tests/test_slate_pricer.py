@@ -0,0 +1,75 @@
+import pathlib
+import random
+import sys
+import unittest
+
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.agent import resolve_analyzer
+from src.data.odds_scraper import OddsScraper
+from src.edge.detector import EdgeDetector
+from src.edge.result_cache import ResultCache
+from src.models.monte_carlo import MonteCarloSimulator, SimulationConfig
+from src.sports import SPORT_PROFILES, SlatePricer, TotalsAnalyzer, profile_for
+
+
+class TestSlatePricer(unittest.TestCase):
+    def test_profiles_cover_every_supported_sport(self):
+        for sport in OddsScraper.list_supported_sports():
+            with self.subTest(sport=sport):
+                self.assertIn(sport, SPORT_PROFILES)
+                self.assertIsInstance(resolve_analyzer(sport), TotalsAnalyzer)
+        self.assertEqual(profile_for("soccer_mls").base_std, SPORT_PROFILES["soccer_epl"].base_std)
+        self.assertEqual(profile_for("unknown").code, "basketball_nba")
+
+    def test_batched_pricing_matches_per_game_model(self):
+        random.seed(5)
+        scraper = OddsScraper()
+        slate = {sport: scraper.fetch_odds_api(sport=sport, max_games=3) for sport in scraper.list_supported_sports()}
+        simulator = MonteCarloSimulator(SimulationConfig(num_paths=4000))
+        detector = EdgeDetector(ot_threshold=0.05, min_ev=0.0)
+
+        priced = SlatePricer(simulator=simulator, detector=detector).price(slate)
+        self.assertEqual(len(priced), sum(len(games) for games in slate.values()))
+
+        for row in priced[::4]:
+            with self.subTest(sport=row.sport, game=row.game["game_id"]):
+                analyzer = TotalsAnalyzer(profile_for(row.sport), simulator=simulator)
+                stats = analyzer.stats
+                home = stats.fetch_team_stats(row.game["home_team"], sport=row.sport)
+                away = stats.fetch_team_stats(row.game["away_team"], sport=row.sport)
+                expected_mean, expected_std = simulator.adjusted_moments(
+                    analyzer.profile.base_mean(home, away),
+                    analyzer.profile.base_std,
+                    pace=(home["pace"] + away["pace"]) / 2,
+                )
+                if analyzer.profile.is_discrete:
+                    # Count sports use the exact Poisson total, whose variance equals its mean.
+                    expected_std = expected_mean ** 0.5
+                self.assertAlmostEqual(row.distribution.mean, expected_mean, delta=0.1 * expected_std)
+                self.assertAlmostEqual(row.distribution.std, expected_std, delta=0.1 * expected_std)
+
+    def test_result_cache_skips_repriced_games(self):
+        scraper = OddsScraper()
+        slates = [scraper.fetch_slate(sport=sport, max_games=4) for sport in ("basketball_nba", "hockey_nhl")]
+        cache = ResultCache()
+        pricer = SlatePricer(simulator=MonteCarloSimulator(SimulationConfig(num_paths=2000)), result_cache=cache)
+
+        first = pricer.price_slates(slates)
+        self.assertEqual(len(first), 8)
+        self.assertEqual(cache.hits + cache.misses, len(first))
+        self.assertLessEqual(len(cache), cache.misses)
+        hits = cache.hits
+        second = pricer.price_slates(slates)
+        self.assertEqual(cache.hits - hits, len(first))
+        for ours, theirs in zip(first, second):
+            self.assertEqual(ours.game["game_id"], theirs.game["game_id"])
+            self.assertAlmostEqual(ours.distribution.mean, theirs.distribution.mean)
+            self.assertEqual(ours.edge, theirs.edge)
+        cache.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,49 @@
+import pathlib
+import subprocess
+import sys
+import unittest
+
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.agent import profile_imports
+from src.data import team_registry
+
+
+def fresh_modules(statement: str) -> set:
+    """Modules loaded by ``statement`` in a clean interpreter."""
+    code = f"import sys; {statement}; print('\\n'.join(sys.modules))"
+    out = subprocess.run([sys.executable, "-c", code], cwd=PROJECT_ROOT, capture_output=True, text=True, check=True)
+    return set(out.stdout.split())
+
+
+class TestStartup(unittest.TestCase):
+    def test_cli_import_skips_unused_analyzers_and_heavy_modules(self):
+        loaded = fresh_modules("import src.agent")
+        self.assertIn("src.sports.generic", loaded)
+        heavy = ("asyncio", "sqlite3", "discord", "tracemalloc")
+        for module in ("src.sports.nba", "src.sports.soccer", "src.sports.live", *heavy):
+            with self.subTest(module=module):
+                self.assertNotIn(module, loaded)
+
+    def test_scanner_helpers_do_not_need_discord(self):
+        self.assertNotIn("discord", fresh_modules("import src.scanner"))
+
+    def test_lazy_exports_and_team_lists(self):
+        from src.sports import NBAAnalyzer, TotalsAnalyzer
+
+        self.assertTrue(issubclass(NBAAnalyzer, TotalsAnalyzer))
+        self.assertEqual(len(team_registry.NBA_TEAMS), 30)
+        self.assertEqual(sorted(team_registry.SPORT_TEAM_MAP), team_registry.supported_sports())
+        with self.assertRaises(AttributeError):
+            team_registry.MLB_TEAMS
+
+    def test_profile_imports_reports_per_module_times(self):
+        rows = profile_imports("src.data.team_registry")
+        self.assertEqual(rows[0][0], "src.data.team_registry")
+        self.assertTrue(all(cumulative >= own for _, own, cumulative in rows))
+
+
+if __name__ == "__main__":
+    unittest.main()
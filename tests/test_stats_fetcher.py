@@ -0,0 +1,79 @@
+import pathlib
+import sys
+import threading
+import time
+import unittest
+
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.data.odds_scraper import OddsScraper
+from src.data.stats_fetcher import StatsFetcher
+from src.sports.nhl import NHLAnalyzer
+from tests.helpers import FakeClock
+
+
+class CountingContextClient:
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.calls = []
+
+    def fetch_team_context(self, team, sport):
+        time.sleep(self.delay)
+        self.calls.append(team)
+        return {"offensive_rating": 3.4}
+
+
+class TestStatsFetcherCache(unittest.TestCase):
+    def test_slate_scan_fetches_each_team_once(self):
+        client = CountingContextClient()
+        fetcher = StatsFetcher(odds_api_client=client)
+        analyzer = NHLAnalyzer(stats_fetcher=fetcher)
+        games = OddsScraper().fetch_odds_api(sport="hockey_nhl")
+
+        fetcher.fetch_team_stats_many({g["home_team"] for g in games} | {g["away_team"] for g in games}, "hockey_nhl")
+        for game in games + games:
+            analyzer.analyze_game(**{**game, "injuries": []})
+
+        self.assertEqual(len(client.calls), 2 * len(games))
+        self.assertEqual(len(set(client.calls)), len(client.calls))
+
+    def test_ttl_expiry_and_lru_bound(self):
+        client = CountingContextClient()
+        clock = FakeClock()
+        fetcher = StatsFetcher(odds_api_client=client, cache_ttl=10.0, cache_size=2, clock=clock)
+
+        fetcher.fetch_team_stats_many(["A", "B"], "hockey_nhl")
+        fetcher.fetch_team_stats("A", "hockey_nhl")
+        self.assertEqual(client.calls, ["A", "B"])
+
+        fetcher.fetch_team_stats("C", "hockey_nhl")  # evicts least recently used "B"
+        fetcher.fetch_team_stats("B", "hockey_nhl")
+        self.assertEqual(client.calls, ["A", "B", "C", "B"])
+
+        clock.now = 11.0
+        fetcher.fetch_team_stats("B", "hockey_nhl")
+        self.assertEqual(client.calls[-1], "B")
+        self.assertEqual(len(client.calls), 5)
+
+    def test_concurrent_callers_share_inflight_fetch(self):
+        client = CountingContextClient(delay=0.05)
+        fetcher = StatsFetcher(odds_api_client=client)
+        results = []
+
+        def worker():
+            results.append(fetcher.fetch_team_stats_many(["A", "B"], "hockey_nhl"))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(sorted(client.calls), ["A", "B"])
+        self.assertTrue(all(r["A"]["offensive_rating"] == 3.4 for r in results))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,157 @@
+import io
+import itertools
+import json
+import pathlib
+import random
+import sys
+import unittest
+from contextlib import redirect_stdout
+
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.agent import generate_load, iter_priced, main, synthetic_scraper
+from src.backtest.walk_forward import WalkForwardBacktest
+from src.data.odds_cache import OddsCache
+from src.data.odds_scraper import DEFAULT_TOTALS, OddsScraper
+from src.data.synthetic import (
+    DEFAULT_BOOKS,
+    InjuryUpdate,
+    LineMove,
+    SyntheticOddsClient,
+    SyntheticSlateGenerator,
+    probability_to_american,
+)
+from src.models.distribution import american_to_probability
+
+
+class TestSyntheticSlateGenerator(unittest.TestCase):
+    def test_same_seed_replays_the_same_stream(self):
+        first = list(SyntheticSlateGenerator(seed=7).games("basketball_nba", 50))
+        second = list(SyntheticSlateGenerator(seed=7).games("basketball_nba", 50))
+        other = list(SyntheticSlateGenerator(seed=8).games("basketball_nba", 50))
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, other)
+
+    def test_one_row_per_game_and_book(self):
+        games = list(SyntheticSlateGenerator(books=3).games("football_nfl", 40))
+        self.assertEqual(len(games), 120)
+        self.assertEqual({game["book"] for game in games}, set(DEFAULT_BOOKS[:3]))
+        self.assertEqual(len({game["game_id"] for game in games}), 120)
+        for _, quotes in itertools.groupby(games, key=lambda game: game["event_id"]):
+            quotes = list(quotes)
+            self.assertEqual(len({(q["home_team"], q["away_team"], q["commence_time"]) for q in quotes}), 1)
+            self.assertNotEqual(quotes[0]["home_team"], quotes[0]["away_team"])
+        wide = SyntheticSlateGenerator(books=8)
+        self.assertEqual(wide.books[-1], "book07")
+
+    def test_lines_and_odds_are_dispersed_and_valid(self):
+        generator = SyntheticSlateGenerator(seed=1, injury_rate=0.2)
+        for sport in ("basketball_nba", "hockey_nhl", "soccer_epl"):
+            with self.subTest(sport=sport):
+                games = list(generator.games(sport, 400))
+                lines = [game["total_line"] for game in games]
+                base = DEFAULT_TOTALS[sport]
+                self.assertGreater(len(set(lines)), 1)
+                self.assertAlmostEqual(sum(lines) / len(lines), base, delta=base * 0.05)
+                for game in games:
+                    self.assertEqual(game["total_line"] * 2, int(game["total_line"] * 2))
+                    for odds in (game["over_odds"], game["under_odds"]):
+                        self.assertGreaterEqual(abs(odds), 100)
+                self.assertGreater(len({game["over_odds"] for game in games}), 10)
+                injured = [game for game in games if game.get("injuries")]
+                self.assertTrue(0 < len(injured) < len(games))
+                self.assertIn(injured[0]["injuries"][0]["status"], ("out", "doubtful", "questionable"))
+
+    def test_probability_to_american(self):
+        self.assertEqual(probability_to_american(0.5), -100)
+        self.assertEqual(probability_to_american(0.6), -150)
+        self.assertEqual(probability_to_american(0.4), 150)
+
+    def test_slates_chunk_the_same_quotes(self):
+        generator = SyntheticSlateGenerator(seed=3)
+        chunks = list(generator.slates("hockey_nhl", 90, chunk_size=100))
+        self.assertEqual([len(chunk) for chunk in chunks], [100, 100, 100, 100, 50])
+        games = list(generator.games("hockey_nhl", 90))
+        from_slates = [game for chunk in chunks for game in chunk.games()]
+        for ours, theirs in zip(from_slates, games):
+            self.assertEqual(ours["game_id"], theirs["game_id"])
+            self.assertEqual(ours["home_team"], theirs["home_team"])
+            self.assertEqual(ours["total_line"], theirs["total_line"])
+            self.assertEqual(ours["over_odds"], theirs["over_odds"])
+
+    def test_events_are_time_ordered_and_reference_quotes(self):
+        generator = SyntheticSlateGenerator(seed=5)
+        game_ids = {game["game_id"] for game in generator.games("basketball_nba", 30)}
+        events = list(generator.events("basketball_nba", 30, moves=200, injury_updates=20))
+        self.assertEqual(len(events), 220)
+        stamps = [event.ts for event in events]
+        self.assertEqual(stamps, sorted(stamps))
+        moves = [event for event in events if isinstance(event, LineMove)]
+        self.assertEqual(len(moves), 200)
+        self.assertTrue(all(move.game_id in game_ids for move in moves))
+        self.assertEqual(sum(isinstance(event, InjuryUpdate) for event in events), 20)
+
+    def test_streams_are_lazy(self):
+        games = SyntheticSlateGenerator().games("basketball_nba", 10**9)
+        self.assertEqual(len(list(itertools.islice(games, 5))), 5)
+
+    def test_game_records_feed_the_walk_forward_backtest(self):
+        records = list(SyntheticSlateGenerator(seed=2).game_records("basketball_nba", 200, games_per_day=10))
+        self.assertEqual(len(records), 200)
+        self.assertEqual(len({record.date for record in records}), 20)
+        mean_total = sum(record.home_score + record.away_score for record in records) / len(records)
+        self.assertAlmostEqual(mean_total, DEFAULT_TOTALS["basketball_nba"], delta=10)
+        result = WalkForwardBacktest(train_days=5, step_days=1).run(records)
+        self.assertTrue(result.steps)
+        self.assertGreater(result.games_scored, 0)
+
+    def test_prices_carry_an_overround(self):
+        rng = random.Random(3)
+        for _ in range(200):
+            over, under = SyntheticSlateGenerator.prices(rng)
+            self.assertTrue(1.0 < american_to_probability(over) + american_to_probability(under) < 1.08)
+
+    def test_rejects_empty_book_list(self):
+        with self.assertRaises(ValueError):
+            SyntheticSlateGenerator(books=[])
+
+
+class TestSyntheticOddsClient(unittest.TestCase):
+    def test_scraper_and_cache_see_line_churn(self):
+        client = SyntheticOddsClient(SyntheticSlateGenerator(seed=4, books=2), games_per_sport=100, move_fraction=0.1)
+        with OddsScraper(client=client) as scraper:
+            cache = OddsCache(scraper, ttl=0)
+            first = cache.refresh("basketball_nba")
+            second = cache.refresh("basketball_nba")
+        self.assertEqual(len(first.new), 200)
+        self.assertTrue(0 < len(second.changed) <= 20)
+        self.assertEqual(len(second.changed) + second.unchanged, 200)
+
+    def test_scan_prices_synthetic_games(self):
+        with synthetic_scraper(games=50, books=2) as scraper:
+            rows = list(iter_priced(["hockey_nhl"], scraper=scraper))
+        self.assertEqual(len(rows), 100)
+
+
+class TestGenerateLoad(unittest.TestCase):
+    def test_writes_games_then_events(self):
+        buffer = io.StringIO()
+        with redirect_stdout(buffer):
+            written = generate_load("soccer_epl", games=10, books=2, moves=15, injury_updates=5)
+        records = [json.loads(line) for line in buffer.getvalue().splitlines()]
+        self.assertEqual(written, 40)
+        self.assertEqual(len(records), 40)
+        self.assertEqual([r["type"] for r in records[:20]], ["game"] * 20)
+        self.assertEqual({r["type"] for r in records[20:]}, {"line_move", "injury"})
+
+    def test_cli_respects_zero_games(self):
+        buffer = io.StringIO()
+        with redirect_stdout(buffer):
+            main(["loadgen", "--sport", "hockey_nhl", "--synthetic-games", "0", "--moves", "5"])
+        self.assertEqual(buffer.getvalue(), "")
+
+
+if __name__ == "__main__":
+    unittest.main()
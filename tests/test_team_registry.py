@@ -0,0 +1,43 @@
+import pathlib
+import sys
+import unittest
+
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.data.team_registry import supported_sports, team_id, team_index, team_name, teams_for_sport
+
+
+class TestTeamIndex(unittest.TestCase):
+    def test_ids_round_trip_for_every_sport(self):
+        for sport in supported_sports():
+            with self.subTest(sport=sport):
+                teams = teams_for_sport(sport)
+                self.assertEqual(len(team_index(sport)), len(teams))
+                for idx, name in enumerate(teams):
+                    self.assertEqual(team_id(sport, name), idx)
+                    self.assertEqual(team_name(sport, idx), name)
+
+    def test_feed_spellings_resolve_without_fuzzy_matching(self):
+        clippers = team_id("basketball_nba", "LA Clippers")
+        self.assertEqual(team_id("basketball_nba", "Los Angeles Clippers"), clippers)
+        self.assertEqual(team_id("basketball_nba", "clippers"), clippers)
+        self.assertEqual(team_name("soccer_epl", team_id("soccer_epl", "Man Utd")), "Manchester United")
+        self.assertEqual(team_name("soccer_laliga", team_id("soccer_laliga", "Atletico Madrid")), "Atlético Madrid")
+        self.assertEqual(team_id("hockey_nhl", "Saint Louis Blues"), team_id("hockey_nhl", "St. Louis Blues"))
+
+    def test_fuzzy_matching_is_opt_in(self):
+        self.assertIsNone(team_id("basketball_cbb_division1", "Gonzaga Bulldog"))
+        match = team_id("basketball_cbb_division1", "Gonzaga Bulldog", fuzzy=True)
+        self.assertEqual(team_name("basketball_cbb_division1", match), "Gonzaga Bulldogs")
+        self.assertIsNone(team_id("hockey_nhl", "Completely Unknown", fuzzy=True))
+
+    def test_teams_for_sport_returns_a_copy(self):
+        teams = teams_for_sport("basketball_nba")
+        teams.append("Seattle SuperSonics")
+        self.assertNotIn("Seattle SuperSonics", teams_for_sport("basketball_nba"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import pathlib
+import sys
+import unittest
+
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.data.odds_scraper import OddsScraper
+from src.models.monte_carlo import MonteCarloSimulator, SimulationConfig
+from src.sports.nhl import NHLAnalyzer
+from src.sports.tracking import TrackedSlate
+
+
+class CountingNHLAnalyzer(NHLAnalyzer):
+    def __init__(self):
+        super().__init__(simulator=MonteCarloSimulator(SimulationConfig(num_paths=200)))
+        self.calls = []
+
+    def analyze_game(self, **kwargs):
+        self.calls.append(kwargs["game_id"])
+        return super().analyze_game(**kwargs)
+
+
+class TestTrackedSlate(unittest.TestCase):
+    def setUp(self):
+        self.analyzer = CountingNHLAnalyzer()
+        self.slate = TrackedSlate(self.analyzer, "hockey_nhl")
+        self.games = OddsScraper().fetch_odds_api(sport="hockey_nhl")
+        self.slate.add_games(self.games)
+        self.analyzer.calls.clear()
+
+    def test_injury_update_recomputes_only_that_teams_game(self):
+        game = self.games[3]
+        report = self.slate.update_injuries(game["home_team"], [{"player": "G1", "status": "out", "impact": 0.6}])
+        self.assertEqual(report.recomputed, 1)
+        self.assertEqual(self.analyzer.calls, [game["game_id"]])
+        teams = (game["home_team"], game["away_team"])
+        expected = {("line", game["game_id"])} | {
+            (kind, "hockey_nhl", team) for kind in ("stats", "injuries") for team in teams
+        }
+        self.assertEqual(self.slate.dependencies(game["game_id"]), expected)
+
+    def test_stats_and_line_updates_are_targeted(self):
+        game = self.games[5]
+        stats_report = self.slate.update_team_stats(game["away_team"], {"offensive_rating": 4.2})
+        line_report = self.slate.update_line(self.games[0]["game_id"], total_line=6.5)
+
+        self.assertEqual(stats_report.game_ids, [game["game_id"]])
+        self.assertEqual(line_report.recomputed, 1)
+        self.assertEqual(self.slate.games[self.games[0]["game_id"]]["total_line"], 6.5)
+        self.assertEqual(self.slate.total_recomputed, len(self.games) + 2)
+        self.assertEqual(self.analyzer.stats.fetch_team_stats(game["away_team"], "hockey_nhl")["offensive_rating"], 4.2)
+
+    def test_unknown_team_update_recomputes_nothing(self):
+        report = self.slate.update_injuries("Quebec Nordiques", [])
+        self.assertEqual(report.recomputed, 0)
+        self.assertEqual(self.analyzer.calls, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
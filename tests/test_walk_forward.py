@@ -0,0 +1,85 @@
+import pathlib
+import random
+import sys
+import unittest
+
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.backtest.walk_forward import GameRecord, IncrementalRatings, WalkForwardBacktest
+from src.edge.detector import EdgeDetector
+
+
+def _synthetic_season(days: int = 60, seed: int = 11):
+    rng = random.Random(seed)
+    teams = [f"Team {i}" for i in range(10)]
+    strength = {team: rng.uniform(-6.0, 6.0) for team in teams}
+    games = []
+    for day in range(days):
+        order = teams[:]
+        rng.shuffle(order)
+        for idx in range(0, len(order), 2):
+            home, away = order[idx], order[idx + 1]
+            games.append(
+                GameRecord(
+                    game_id=f"d{day:03d}_{idx}",
+                    date=f"2024-01-01+{day:03d}",
+                    home_team=home,
+                    away_team=away,
+                    home_score=rng.gauss(105 + strength[home], 8),
+                    away_score=rng.gauss(105 + strength[away], 8),
+                    # Market shades every total well below the true ~210 mean.
+                    total_line=200.5,
+                )
+            )
+    return games
+
+
+class TestWalkForward(unittest.TestCase):
+    def test_sliding_window_matches_refit_from_scratch(self):
+        games = _synthetic_season(days=12)
+        incremental = IncrementalRatings()
+        for game in games:
+            incremental.add(game)
+        for game in games[:20]:
+            incremental.remove(game)
+
+        refit = IncrementalRatings()
+        for game in games[20:]:
+            refit.add(game)
+
+        self.assertEqual(incremental.num_games, refit.num_games)
+        self.assertAlmostEqual(incremental.league_std, refit.league_std, places=6)
+        for team in ("Team 0", "Team 5"):
+            self.assertAlmostEqual(
+                incremental.predict(team, "Team 3").mean, refit.predict(team, "Team 3").mean, places=6
+            )
+
+    def test_walk_forward_scores_only_out_of_sample_days(self):
+        games = _synthetic_season()
+        backtest = WalkForwardBacktest(
+            detector=EdgeDetector(ot_threshold=0.1, min_ev=0.03), train_days=14, min_train_games=25
+        )
+        result = backtest.run(games)
+
+        self.assertGreater(len(result.steps), 0)
+        self.assertLess(result.games_scored, len(games))
+        self.assertTrue(all(step.train_games <= 14 * 5 for step in result.steps))
+        self.assertGreater(result.bets, 0)
+        self.assertGreater(result.metrics.roi, 0.0)
+
+    def test_rerun_starts_from_fresh_ratings(self):
+        games = _synthetic_season()
+        backtest = WalkForwardBacktest(
+            detector=EdgeDetector(ot_threshold=0.1, min_ev=0.03), train_days=14, min_train_games=25
+        )
+        first = backtest.run(games)
+        second = backtest.run(games)
+        self.assertEqual(len(second.steps), len(first.steps))
+        self.assertEqual(second.games_scored, first.games_scored)
+        self.assertEqual(second.bets, first.bets)
+
+
+if __name__ == "__main__":
+    unittest.main()